@@ -14,14 +14,20 @@ from beanie.odm.actions import (
     before_event,
 )
 from beanie.odm.bulk import BulkWriter
+from beanie.odm.cache import (
+    CacheBackend,
+    KeyValueCacheBackend,
+    MemoryCacheBackend,
+)
 from beanie.odm.custom_types import DecimalAnnotation
 from beanie.odm.custom_types.bson.binary import BsonBinary
 from beanie.odm.documents import (
     Document,
     DocumentWithSoftDelete,
     MergeStrategy,
+    SaveManyResult,
 )
-from beanie.odm.enums import SortDirection
+from beanie.odm.enums import SortDirection, StateSnapshot
 from beanie.odm.fields import (
     BackLink,
     BeanieObjectId,
@@ -31,6 +37,7 @@ from beanie.odm.fields import (
     PydanticObjectId,
     WriteRules,
 )
+from beanie.odm.identity_map import IdentityMap
 from beanie.odm.queries.update import UpdateResponse
 from beanie.odm.settings.timeseries import Granularity, TimeSeriesConfig
 from beanie.odm.union_doc import UnionDoc
@@ -51,7 +58,9 @@ __all__ = [
     "TimeSeriesConfig",
     "Granularity",
     "SortDirection",
+    "StateSnapshot",
     "MergeStrategy",
+    "SaveManyResult",
     # Actions
     "before_event",
     "after_event",
@@ -66,6 +75,10 @@ __all__ = [
     "Update",
     # Bulk Write
     "BulkWriter",
+    # Cache
+    "CacheBackend",
+    "MemoryCacheBackend",
+    "KeyValueCacheBackend",
     # Migrations
     "iterative_migration",
     "free_fall_migration",
@@ -74,6 +87,7 @@ __all__ = [
     "BackLink",
     "WriteRules",
     "DeleteRules",
+    "IdentityMap",
     # Custom Types
     "DecimalAnnotation",
     "BsonBinary",
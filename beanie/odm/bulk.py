@@ -1,6 +1,6 @@
+import asyncio
 from typing import Any, Dict, List, Mapping, Optional, Type, Union
 
-from pydantic import BaseModel, Field
 from pymongo import (
     DeleteMany,
     DeleteOne,
@@ -10,45 +10,107 @@ from pymongo import (
     UpdateOne,
 )
 from pymongo.client_session import ClientSession
+from pymongo.errors import BulkWriteError
 from pymongo.results import BulkWriteResult
 
-from beanie.odm.utils.pydantic import IS_PYDANTIC_V2
-
-if IS_PYDANTIC_V2:
-    from pydantic import ConfigDict
-
-
-class Operation(BaseModel):
-    operation: Union[
-        Type[InsertOne],
-        Type[DeleteOne],
-        Type[DeleteMany],
-        Type[ReplaceOne],
-        Type[UpdateOne],
-        Type[UpdateMany],
-    ]
-    first_query: Mapping[str, Any]
-    second_query: Optional[Dict[str, Any]] = None
-    pymongo_kwargs: Dict[str, Any] = Field(default_factory=dict)
-    object_class: Type
-
-    if IS_PYDANTIC_V2:
-        model_config = ConfigDict(
-            arbitrary_types_allowed=True,
+from beanie.odm.cache import get_document_ids, get_size
+
+OperationType = Union[
+    Type[InsertOne],
+    Type[DeleteOne],
+    Type[DeleteMany],
+    Type[ReplaceOne],
+    Type[UpdateOne],
+    Type[UpdateMany],
+]
+
+
+class Operation:
+    """
+    Write operation collected by the bulk writer.
+    It is converted to the pymongo request on flush
+    """
+
+    __slots__ = (
+        "operation",
+        "first_query",
+        "second_query",
+        "pymongo_kwargs",
+        "object_class",
+    )
+
+    def __init__(
+        self,
+        *,
+        operation: OperationType,
+        first_query: Mapping[str, Any],
+        object_class: Type,
+        second_query: Optional[Any] = None,
+        pymongo_kwargs: Optional[Dict[str, Any]] = None,
+    ):
+        self.operation = operation
+        self.first_query = first_query
+        self.second_query = second_query
+        self.pymongo_kwargs = (
+            pymongo_kwargs if pymongo_kwargs is not None else {}
+        )
+        self.object_class = object_class
+
+    def to_request(self) -> Any:
+        """
+        Build the pymongo request
+
+        :return: pymongo request object
+        """
+        if self.operation in (InsertOne, DeleteOne):
+            return self.operation(self.first_query, **self.pymongo_kwargs)  # type: ignore
+        return self.operation(
+            self.first_query, self.second_query, **self.pymongo_kwargs  # type: ignore
         )
-    else:
 
-        class Config:
-            arbitrary_types_allowed = True
+
+class _Chunk:
+    __slots__ = ("collection", "indices", "operations")
+
+    def __init__(self, collection: Any):
+        self.collection = collection
+        self.indices: List[int] = []
+        self.operations: List[Operation] = []
 
 
 class BulkWriter:
+    """
+    Collects write operations and sends them with `bulk_write`
+    on commit.
+
+    With `max_operations` or `max_bytes` the collected operations
+    are flushed in the background every time the threshold is reached.
+    Unordered writers without a session run up to
+    `max_concurrent_flushes` flushes concurrently.
+    Operations of different document models are grouped
+    by collection.
+    """
+
     def __init__(
-        self, session: Optional[ClientSession] = None, ordered: bool = True
+        self,
+        session: Optional[ClientSession] = None,
+        ordered: bool = True,
+        max_operations: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        max_concurrent_flushes: int = 1,
     ):
         self.operations: List[Operation] = []
         self.session = session
         self.ordered = ordered
+        self.max_operations = max_operations
+        self.max_bytes = max_bytes
+        self.max_concurrent_flushes = max_concurrent_flushes
+        self._operations_size = 0
+        self._flushes: List[asyncio.Future] = []
+        self._flush_limiter: Optional[
+            Union[asyncio.Lock, asyncio.Semaphore]
+        ] = None
+        self._reset_results()
 
     async def __aenter__(self):
         return self
@@ -58,32 +120,220 @@ class BulkWriter:
 
     async def commit(self) -> Optional[BulkWriteResult]:
         """
-        Commit all the operations to the database
-        :return:
+        Commit all the operations to the database.
+        Waits for the background flushes to finish
+
+        :return: Optional[BulkWriteResult] - aggregated result
+        of all the writes since the previous commit
         """
-        obj_class = None
-        requests = []
         if self.operations:
-            for op in self.operations:
-                if obj_class is None:
-                    obj_class = op.object_class
-
-                if obj_class != op.object_class:
-                    raise ValueError(
-                        "All the operations should be for a single document model"
-                    )
-                if op.operation in [InsertOne, DeleteOne]:
-                    query = op.operation(op.first_query, **op.pymongo_kwargs)  # type: ignore
+            self._schedule_flush()
+        await self._wait_for_flushes(0)
+        try:
+            return self._get_result()
+        finally:
+            self._reset_results()
+
+    async def add(self, operation: Operation) -> None:
+        """
+        Add the operation. Waits while the maximum number
+        of the background flushes is in flight,
+        so the memory used by the writer stays bounded
+
+        :param operation: Operation - operation to add
+        :return: None
+        """
+        self.add_operation(operation)
+        await self._wait_for_flushes(self._get_flush_concurrency())
+
+    def add_operation(self, operation: Operation):
+        if self.max_bytes is not None:
+            operation_size = get_size(operation.first_query) + get_size(
+                operation.second_query
+            )
+            if (
+                self.operations
+                and self._operations_size + operation_size > self.max_bytes
+            ):
+                self._schedule_flush()
+            self._operations_size += operation_size
+        self.operations.append(operation)
+        if (
+            self.max_operations is not None
+            and len(self.operations) >= self.max_operations
+        ) or (
+            self.max_bytes is not None
+            and self._operations_size >= self.max_bytes
+        ):
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        operations, first_index = self.operations, self._first_index
+        self.operations = []
+        self._operations_size = 0
+        self._first_index += len(operations)
+        self._flushes.append(
+            asyncio.ensure_future(self._flush(operations, first_index))
+        )
+
+    async def _flush(
+        self, operations: List[Operation], first_index: int
+    ) -> None:
+        if self._flush_limiter is None:
+            concurrency = self._get_flush_concurrency()
+            # Lock keeps the order of the flushes
+            self._flush_limiter = (
+                asyncio.Lock()
+                if concurrency == 1
+                else asyncio.Semaphore(concurrency)
+            )
+        async with self._flush_limiter:
+            for chunk in self._split(operations, first_index):
+                if self.ordered and self._failed:
+                    return
+                await self._write(chunk)
+
+    def _get_flush_concurrency(self) -> int:
+        # Sessions can not be used concurrently
+        if self.ordered or self.session is not None:
+            return 1
+        return max(self.max_concurrent_flushes, 1)
+
+    async def _wait_for_flushes(self, limit: int) -> None:
+        self._collect_flushes()
+        while len(self._flushes) > limit:
+            await asyncio.wait(
+                self._flushes, return_when=asyncio.FIRST_COMPLETED
+            )
+            self._collect_flushes()
+
+    def _collect_flushes(self) -> None:
+        flushes = []
+        for flush in self._flushes:
+            if not flush.done():
+                flushes.append(flush)
+            elif not flush.cancelled() and flush.exception() is not None:
+                self._errors.append(flush.exception())  # type: ignore
+        self._flushes = flushes
+
+    def _split(
+        self, operations: List[Operation], first_index: int
+    ) -> List[_Chunk]:
+        # Ordered writers keep the order of the operations
+        # by splitting them into runs of the same collection
+        chunks: List[_Chunk] = []
+        chunks_by_collection: Dict[str, _Chunk] = {}
+        for index, op in enumerate(operations, first_index):
+            collection = op.object_class.get_motor_collection()
+            if self.ordered:
+                if (
+                    chunks
+                    and chunks[-1].collection.full_name == collection.full_name
+                ):
+                    chunk = chunks[-1]
+                else:
+                    chunk = _Chunk(collection)
+                    chunks.append(chunk)
+            else:
+                if collection.full_name in chunks_by_collection:
+                    chunk = chunks_by_collection[collection.full_name]
                 else:
-                    query = op.operation(
-                        op.first_query, op.second_query, **op.pymongo_kwargs  # type: ignore
-                    )
-                requests.append(query)
+                    chunk = _Chunk(collection)
+                    chunks_by_collection[collection.full_name] = chunk
+                    chunks.append(chunk)
+            chunk.indices.append(index)
+            chunk.operations.append(op)
+        return chunks
 
-            return await obj_class.get_motor_collection().bulk_write(  # type: ignore
+    async def _write(self, chunk: _Chunk) -> None:
+        requests = [op.to_request() for op in chunk.operations]
+        try:
+            result = await chunk.collection.bulk_write(
                 requests, session=self.session, ordered=self.ordered
             )
-        return None
+        except BulkWriteError as e:
+            self._failed = True
+            self._add_result(chunk.indices, e.details)
+        except Exception as e:
+            self._failed = True
+            self._errors.append(e)
+        else:
+            if result.acknowledged:
+                self._add_result(chunk.indices, result.bulk_api_result)
+            else:
+                self._acknowledged = False
+        finally:
+            # Failed bulk writes could be applied partially
+            await self._invalidate_caches(chunk.operations)
 
-    def add_operation(self, operation: Operation):
-        self.operations.append(operation)
+    def _reset_results(self) -> None:
+        # Indices of the results start from the first operation
+        # after the commit
+        self._first_index = 0
+        self._written = False
+        self._failed = False
+        self._acknowledged = True
+        self._errors: List[Exception] = []
+        self._result: Dict[str, Any] = {
+            "writeErrors": [],
+            "writeConcernErrors": [],
+            "nInserted": 0,
+            "nUpserted": 0,
+            "nMatched": 0,
+            "nModified": 0,
+            "nRemoved": 0,
+            "upserted": [],
+        }
+
+    def _add_result(self, indices: List[int], result: Mapping[str, Any]):
+        # Indices of the chunk are mapped to the indices
+        # of the operations in the writer
+        self._written = True
+        for key in (
+            "nInserted",
+            "nUpserted",
+            "nMatched",
+            "nModified",
+            "nRemoved",
+        ):
+            self._result[key] += result.get(key, 0)
+        for key in ("upserted", "writeErrors"):
+            for item in result.get(key, []):
+                self._result[key].append(
+                    {**item, "index": indices[item["index"]]}
+                )
+        self._result["writeConcernErrors"].extend(
+            result.get("writeConcernErrors", [])
+        )
+
+    def _get_result(self) -> Optional[BulkWriteResult]:
+        if self._errors:
+            raise self._errors[0]
+        if self._result["writeErrors"] or self._result["writeConcernErrors"]:
+            self._result["writeErrors"].sort(key=lambda e: e["index"])
+            raise BulkWriteError(self._result)
+        if not self._written and self._acknowledged:
+            return None
+        return BulkWriteResult(self._result, self._acknowledged)
+
+    async def _invalidate_caches(self, operations: List[Operation]) -> None:
+        operations_by_class: Dict[Type, List[Operation]] = {}
+        for op in operations:
+            operations_by_class.setdefault(op.object_class, []).append(op)
+        for obj_class, class_operations in operations_by_class.items():
+            await obj_class._invalidate_cache_on_write(
+                self._get_document_ids(class_operations)
+            )
+
+    @staticmethod
+    def _get_document_ids(
+        operations: List[Operation],
+    ) -> Optional[List[Any]]:
+        # Inserted documents get their ids on the bulk write
+        document_ids: List[Any] = []
+        for op in operations:
+            op_document_ids = get_document_ids(op.first_query)
+            if op_document_ids is None:
+                return None
+            document_ids.extend(op_document_ids)
+        return document_ids
@@ -1,45 +1,562 @@
 import collections
-import datetime
+import hashlib
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import timedelta
-from typing import Any, Optional
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Union,
+)
 
-from pydantic import BaseModel, Field
+import bson
+from bson.binary import UuidRepresentation
+from bson.codec_options import CodecOptions, TypeRegistry
+from bson.errors import InvalidDocument
+from bson.raw_bson import RawBSONDocument
+from pydantic import BaseModel
 
+from beanie.odm.utils.pydantic import get_model_copy
 
-class CachedItem(BaseModel):
-    timestamp: datetime.datetime = Field(
-        default_factory=datetime.datetime.utcnow
-    )
-    value: Any
+logger = logging.getLogger(__name__)
+
+IMMUTABLE_TYPES = (
+    str,
+    int,
+    float,
+    bool,
+    bytes,
+    type(None),
+    bson.ObjectId,
+    bson.Decimal128,
+    bson.Int64,
+)
+
+
+def _key_fallback_encoder(value: Any) -> Any:
+    if isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+    return repr(value)
+
+
+KEY_CODEC_OPTIONS: CodecOptions = CodecOptions(
+    type_registry=TypeRegistry(fallback_encoder=_key_fallback_encoder),
+    uuid_representation=UuidRepresentation.STANDARD,
+)
+
+# Tag of the cached results, which depend on the whole collection
+QUERY_TAG = "query"
+
+
+def get_size(value: Any) -> int:
+    """
+    Estimate the size of the cached value in bytes.
+    Documents are measured by their BSON size
+
+    :param value: Any - raw document or list of raw documents
+    :return: int
+    """
+    if value is None:
+        return 0
+    if isinstance(value, bytes):
+        return len(value)
+    if isinstance(value, RawBSONDocument):
+        return len(value.raw)
+    if isinstance(value, list):
+        return sum(get_size(item) for item in value)
+    if isinstance(value, dict):
+        try:
+            return len(bson.encode(value, codec_options=KEY_CODEC_OPTIONS))
+        except (InvalidDocument, TypeError, ValueError):
+            return len(repr(value))
+    return len(repr(value))
+
+
+def copy_value(value: Any) -> Any:
+    """
+    Copy the cached value, so the caller can not change the cache content.
+    Containers and models are copied recursively,
+    immutable values are shared
+
+    :param value: Any
+    :return: Any
+    """
+    value_type = type(value)
+    if value_type in IMMUTABLE_TYPES:
+        return value
+    if value_type is list:
+        return [copy_value(item) for item in value]
+    if value_type is dict:
+        return {key: copy_value(item) for key, item in value.items()}
+    if isinstance(value, BaseModel):
+        new_value = get_model_copy(value)
+        values = new_value.__dict__
+        for key, item in values.items():
+            if type(item) not in IMMUTABLE_TYPES:
+                values[key] = copy_value(item)
+        return new_value
+    if isinstance(value, (list, dict, set)):
+        return value.copy()
+    return value
+
+
+def get_document_ids(query: Mapping[str, Any]) -> Optional[List[Any]]:
+    """
+    Get ids of the documents, which could be matched by the query.
+    Returns None if the query is not limited by ids
+
+    :param query: Mapping[str, Any] - encoded filter query
+    :return: Optional[List[Any]]
+    """
+    if "_id" in query:
+        value = query["_id"]
+        if not isinstance(value, Mapping):
+            return [value]
+        if len(value) == 1 and "$eq" in value:
+            return [value["$eq"]]
+        if len(value) == 1 and "$in" in value:
+            return list(value["$in"])
+        return None
+    for sub_query in query.get("$and", ()):
+        if isinstance(sub_query, Mapping):
+            document_ids = get_document_ids(sub_query)
+            if document_ids is not None:
+                return document_ids
+    return None
+
+
+def get_id_tag(document_id: Any) -> str:
+    return "id:" + LRUCache.create_key(document_id)
+
+
+def get_invalidation_tags(
+    document_ids: Optional[Iterable[Any]],
+) -> Optional[List[str]]:
+    """
+    Tags of the cached values, which depend on the changed documents.
+    All the values depend on them if the ids are unknown
+
+    :param document_ids: Optional[Iterable[Any]] - ids of the changed documents
+    :return: Optional[List[str]]
+    """
+    if document_ids is None:
+        return None
+    return [QUERY_TAG] + [
+        get_id_tag(document_id) for document_id in document_ids
+    ]
+
+
+class CachedItem:
+    __slots__ = ("value", "expires_at", "size", "tags")
+
+    def __init__(
+        self,
+        value: Any,
+        expires_at: float,
+        size: int = 0,
+        tags: Iterable[str] = (),
+    ):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+        self.tags = tuple(tags)
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
 
 
 class LRUCache:
-    def __init__(self, capacity: int, expiration_time: timedelta):
+    """
+    Query result cache with LRU eviction and expiration time.
+
+    Entries are limited by number (`capacity`) and optionally
+    by the total size in bytes (`max_size`).
+    Entries could be tagged to be invalidated together.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        expiration_time: timedelta,
+        max_size: Optional[int] = None,
+    ):
         self.capacity: int = capacity
         self.expiration_time: timedelta = expiration_time
+        self.max_size: Optional[int] = max_size
+        self.size: int = 0
+        self.stats = CacheStats()
         self.cache: collections.OrderedDict = collections.OrderedDict()
+        self.tags: Dict[str, Set[Any]] = {}
+        self._ttl: float = expiration_time.total_seconds()
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+    def get(self, key) -> Any:
+        item: Optional[CachedItem] = self.cache.get(key)
+        if item is None:
+            self.stats.misses += 1
+            return None
+        if item.expires_at <= time.monotonic():
+            self._remove(key)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+        self.cache.move_to_end(key)
+        self.stats.hits += 1
+        return item.value
 
-    def get(self, key) -> Optional[CachedItem]:
+    def set(
+        self,
+        key,
+        value,
+        size: Optional[int] = None,
+        tags: Iterable[str] = (QUERY_TAG,),
+        expiration_time: Optional[timedelta] = None,
+    ) -> None:
+        """
+        Store the value
+
+        :param key: cache key
+        :param value: Any - value to store
+        :param size: Optional[int] - size of the value in bytes.
+        It is estimated if the size limit is set and it was not provided
+        :param tags: Iterable[str] - tags to invalidate the value by
+        :param expiration_time: Optional[timedelta] - expiration time
+        of the value. The cache expiration time is used if None
+        :return: None
+        """
+        if key in self.cache:
+            self._remove(key)
+        if self.max_size is not None:
+            if size is None:
+                size = get_size(value)
+            if size > self.max_size:
+                return
+        else:
+            size = 0
+        item = CachedItem(
+            value=value,
+            expires_at=time.monotonic()
+            + (
+                self._ttl
+                if expiration_time is None
+                else expiration_time.total_seconds()
+            ),
+            size=size,
+            tags=tags,
+        )
+        self.cache[key] = item
+        self.size += size
+        for tag in item.tags:
+            self.tags.setdefault(tag, set()).add(key)
+        while len(self.cache) > self.capacity or (
+            self.max_size is not None and self.size > self.max_size
+        ):
+            self._remove(next(iter(self.cache)))
+            self.stats.evictions += 1
+
+    def delete(self, key) -> None:
+        if key in self.cache:
+            self._remove(key)
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        """
+        Remove all the values with any of the tags
+
+        :param tags: Iterable[str]
+        :return: None
+        """
+        for tag in tags:
+            for key in self.tags.pop(tag, ()):
+                if key in self.cache:
+                    self._remove(key)
+
+    def clear(self) -> None:
+        self.cache.clear()
+        self.tags.clear()
+        self.size = 0
+
+    def _remove(self, key) -> None:
+        item = self.cache.pop(key)
+        self.size -= item.size
+        for tag in item.tags:
+            keys = self.tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.tags[tag]
+
+    @staticmethod
+    def create_key(*args) -> str:
+        """
+        Build a stable key from the query parts.
+        Parts are encoded to BSON, which keeps the order of the fields,
+        and hashed
+
+        :param args: query parts
+        :return: str
+        """
         try:
-            item = self.cache.pop(key)
-            if (
-                datetime.datetime.utcnow() - item.timestamp
-                > self.expiration_time
-            ):
-                return None
-            self.cache[key] = item
-            return item.value
-        except KeyError:
+            data = bson.encode(
+                {"key": list(args)}, codec_options=KEY_CODEC_OPTIONS
+            )
+        except (InvalidDocument, TypeError, ValueError, OverflowError):
+            data = repr(args).encode()
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class CacheBackend(ABC):
+    """
+    Storage for the query results shared between the processes.
+
+    Values are BSON encoded. Keys and tags are namespaced
+    by the document class, so one backend could be used
+    by many document classes.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        expiration_time: timedelta,
+        tags: Iterable[str] = (),
+    ) -> None:
+        ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        """
+        Delete all the values with any of the tags
+
+        :param tags: Iterable[str]
+        :return: None
+        """
+        ...
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    In-memory backend. It could be shared between the document classes
+    of the process. Mostly useful for the testing.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1024,
+        expiration_time: timedelta = timedelta(minutes=10),
+        max_size: Optional[int] = None,
+    ):
+        self.cache = LRUCache(
+            capacity=capacity,
+            expiration_time=expiration_time,
+            max_size=max_size,
+        )
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self.cache.get(key)
+
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        expiration_time: timedelta,
+        tags: Iterable[str] = (),
+    ) -> None:
+        self.cache.set(
+            key,
+            value,
+            size=len(value),
+            tags=tags,
+            expiration_time=expiration_time,
+        )
+
+    async def delete(self, key: str) -> None:
+        self.cache.delete(key)
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        self.cache.invalidate(tags)
+
+
+class KeyValueCacheBackend(CacheBackend):
+    """
+    Adapter for external key-value stores (Redis and compatible).
+
+    Subclasses implement the store primitives. Tags are stored
+    as sets of the keys.
+    """
+
+    tag_prefix = "beanie-tag:"
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    async def put(self, key: str, value: bytes, ttl: timedelta) -> None:
+        """
+        Store the value with expiration time (`SET key value PX ttl`)
+        """
+        ...
+
+    @abstractmethod
+    async def delete_many(self, keys: List[str]) -> None:
+        """
+        Delete the keys (`DEL key [key ...]`)
+        """
+        ...
+
+    @abstractmethod
+    async def add_to_set(self, name: str, member: str, ttl: timedelta) -> None:
+        """
+        Add the member to the set and prolong the set expiration time
+        (`SADD name member`, `PEXPIRE name ttl`)
+        """
+        ...
+
+    @abstractmethod
+    async def pop_set(self, name: str) -> List[str]:
+        """
+        Get all the members of the set and delete it
+        (`SMEMBERS name`, `DEL name`)
+        """
+        ...
+
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        expiration_time: timedelta,
+        tags: Iterable[str] = (),
+    ) -> None:
+        await self.put(key, value, expiration_time)
+        for tag in tags:
+            await self.add_to_set(self.tag_prefix + tag, key, expiration_time)
+
+    async def delete(self, key: str) -> None:
+        await self.delete_many([key])
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            keys = await self.pop_set(self.tag_prefix + tag)
+            if keys:
+                await self.delete_many(keys)
+
+
+class SharedCache:
+    """
+    Cache of the document class over a cache backend.
+    Results are stored as BSON and decoded with the codec options
+    of the collection, as they were returned by the database.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        namespace: str,
+        expiration_time: timedelta,
+        codec_options: CodecOptions,
+    ):
+        self.backend = backend
+        self.namespace = namespace
+        self.expiration_time = expiration_time
+        self.codec_options = codec_options
+        self.stats = CacheStats()
+
+    def _tag(self, tag: str) -> str:
+        return f"{self.namespace}:{tag}"
+
+    async def get(self, key: str) -> Any:
+        data = await self.backend.get(self._tag(key))
+        if data is None:
+            self.stats.misses += 1
             return None
+        self.stats.hits += 1
+        return bson.decode(data, codec_options=self.codec_options)["value"]
 
-    def set(self, key, value) -> None:
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        tags: Iterable[str] = (QUERY_TAG,),
+    ) -> None:
         try:
-            self.cache.pop(key)
-        except KeyError:
-            if len(self.cache) >= self.capacity:
-                self.cache.popitem(last=False)
-        self.cache[key] = CachedItem(value=value)
+            data = bson.encode(
+                {"value": value}, codec_options=self.codec_options
+            )
+        except (InvalidDocument, TypeError, ValueError):
+            logger.debug("Value of %s is not cached", key, exc_info=True)
+            return
+        await self.backend.set(
+            self._tag(key),
+            data,
+            expiration_time=self.expiration_time,
+            tags=[self.namespace, *(self._tag(tag) for tag in tags)],
+        )
 
-    @staticmethod
-    def create_key(*args):
-        return str(args)  # TODO think about this
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        await self.backend.invalidate([self._tag(tag) for tag in tags])
+
+    async def clear(self) -> None:
+        await self.backend.invalidate([self.namespace])
+
+
+DocumentCache = Union[LRUCache, SharedCache]
+
+
+async def get_cached(cache: DocumentCache, key: str) -> Any:
+    if isinstance(cache, LRUCache):
+        return cache.get(key)
+    return await cache.get(key)
+
+
+async def set_cached(
+    cache: DocumentCache,
+    key: str,
+    value: Any,
+    size: Optional[int] = None,
+    tags: Iterable[str] = (QUERY_TAG,),
+) -> None:
+    if isinstance(cache, LRUCache):
+        cache.set(key, value, size=size, tags=tags)
+    else:
+        await cache.set(key, value, tags=tags)
+
+
+async def invalidate_cached(
+    cache: DocumentCache, tags: Optional[Iterable[str]] = None
+) -> None:
+    """
+    Invalidate values with any of the tags or all the values
+    if tags are not provided
+    """
+    if isinstance(cache, LRUCache):
+        if tags is None:
+            cache.clear()
+        else:
+            cache.invalidate(tags)
+    elif tags is None:
+        await cache.clear()
+    else:
+        await cache.invalidate(tags)
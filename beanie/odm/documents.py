@@ -1,4 +1,5 @@
 import asyncio
+import dataclasses
 import warnings
 from datetime import datetime
 from enum import Enum
@@ -10,10 +11,14 @@ from typing import (
     ClassVar,
     Coroutine,
     Dict,
+    FrozenSet,
+    Generic,
     Iterable,
     List,
     Mapping,
     Optional,
+    Sequence,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -33,7 +38,7 @@ from pydantic.class_validators import root_validator
 from pydantic.main import BaseModel
 from pymongo import InsertOne
 from pymongo.client_session import ClientSession
-from pymongo.errors import DuplicateKeyError
+from pymongo.errors import BulkWriteError, DuplicateKeyError, WriteError
 from pymongo.results import (
     DeleteResult,
     InsertManyResult,
@@ -50,12 +55,17 @@ from beanie.exceptions import (
 )
 from beanie.odm.actions import (
     ActionDirections,
+    ActionRegistry,
     EventTypes,
     wrap_with_actions,
 )
 from beanie.odm.bulk import BulkWriter, Operation
-from beanie.odm.cache import LRUCache
-from beanie.odm.enums import SortDirection
+from beanie.odm.cache import (
+    DocumentCache,
+    get_invalidation_tags,
+    invalidate_cached,
+)
+from beanie.odm.enums import SortDirection, StateSnapshot
 from beanie.odm.fields import (
     BackLink,
     DeleteRules,
@@ -90,11 +100,24 @@ from beanie.odm.operators.update.general import (
 from beanie.odm.queries.find import FindMany, FindOne
 from beanie.odm.queries.update import UpdateMany, UpdateResponse
 from beanie.odm.settings.document import DocumentSettings
+from beanie.odm.utils.batch_loader import BatchLoader
+from beanie.odm.utils.batched_links import FetchLinksType
+from beanie.odm.utils.cascade import (
+    group_by_class,
+    plan_cascade_delete,
+    plan_cascade_write,
+)
 from beanie.odm.utils.dump import get_dict, get_top_level_nones
+from beanie.odm.utils.encoder import (
+    Encoder,
+    decode_uuid,
+    get_document_encoding_plan,
+)
 from beanie.odm.utils.parsing import apply_changes, merge_models
 from beanie.odm.utils.pydantic import (
     IS_PYDANTIC_V2,
     get_extra_field_info,
+    get_field_default,
     get_field_type,
     get_model_dump,
     get_model_fields,
@@ -102,18 +125,27 @@ from beanie.odm.utils.pydantic import (
     parse_object_as,
 )
 from beanie.odm.utils.self_validation import validate_self_before
+from beanie.odm.utils.single_flight import SingleFlight
 from beanie.odm.utils.state import (
+    check_if_state_saved,
+    get_state_path,
+    make_snapshot,
+    normalize_state,
     previous_saved_state_needed,
+    read_snapshot,
     save_state_after,
     saved_state_needed,
+    set_state_path,
 )
+from beanie.odm.utils.tracking import resolve_paths, track_fields
 from beanie.odm.utils.typing import extract_id_class
+from beanie.odm.views import View
 
 if IS_PYDANTIC_V2:
     from pydantic import model_validator
 
 if TYPE_CHECKING:
-    from beanie.odm.views import View
+    from beanie.odm.utils.encoder import ModelEncodingPlan
 
 FindType = TypeVar("FindType", bound=Union["Document", "View"])
 DocType = TypeVar("DocType", bound="Document")
@@ -153,6 +185,27 @@ class MergeStrategy(str, Enum):
     remote = "remote"
 
 
+@dataclasses.dataclass
+class SaveManyResult(Generic[DocType]):
+    """
+    Result of `save_many` and `save_changes_many`
+
+    saved - saved documents
+    unchanged - documents without changes to save
+    conflicts - documents that were not saved, because they were
+    changed or deleted in the database (revision id or document is missing)
+    errors - documents that were not saved because of write errors
+    with the error details
+    """
+
+    saved: List[DocType] = dataclasses.field(default_factory=list)
+    unchanged: List[DocType] = dataclasses.field(default_factory=list)
+    conflicts: List[DocType] = dataclasses.field(default_factory=list)
+    errors: List[Tuple[DocType, Mapping[str, Any]]] = dataclasses.field(
+        default_factory=list
+    )
+
+
 class Document(
     LazyModel,
     SettersInterface,
@@ -190,14 +243,27 @@ class Document(
 
     # State
     revision_id: Optional[UUID] = Field(default=None, exclude=True)
-    _saved_state: Optional[Dict[str, Any]] = PrivateAttr(default=None)
-    _previous_saved_state: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    _saved_state: Optional[Union[Dict[str, Any], bytes]] = PrivateAttr(
+        default=None
+    )
+    _previous_saved_state: Optional[
+        Union[Dict[str, Any], bytes]
+    ] = PrivateAttr(default=None)
+    _changed_paths: Optional[Set[Tuple[Any, ...]]] = PrivateAttr(default=None)
+
+    _untrackable_fields: ClassVar[FrozenSet[str]] = frozenset()
 
     # Relations
     _link_fields: ClassVar[Optional[Dict[str, LinkInfo]]] = None
+    _lookup_queries: ClassVar[Optional[Dict[Any, List[Dict[str, Any]]]]] = None
 
     # Cache
-    _cache: ClassVar[Optional[LRUCache]] = None
+    _cache: ClassVar[Optional[DocumentCache]] = None
+    _single_flight: ClassVar[Optional[SingleFlight]] = None
+    _batch_loader: ClassVar[Optional[BatchLoader]] = None
+
+    # Encoding
+    _encoding_plan: ClassVar[Optional["ModelEncodingPlan"]] = None
 
     # Settings
     _document_settings: ClassVar[Optional[DocumentSettings]] = None
@@ -245,6 +311,35 @@ class Document(
         def fill_back_refs(cls, values):
             return cls._fill_back_refs(values)
 
+    @classmethod
+    def _parse_id(cls, document_id: Any) -> Any:
+        id_type = get_field_type(get_model_fields(cls)["id"])
+        if not isinstance(document_id, extract_id_class(id_type)):
+            document_id = parse_object_as(id_type, document_id)
+        return document_id
+
+    @classmethod
+    def _generate_id(cls) -> Any:
+        """
+        New id of the document: the default of the id field
+        or the generated ObjectId or UUID.
+        None, if the database should assign it
+        :return: Any
+        """
+        field = get_model_fields(cls)["id"]
+        document_id = get_field_default(field)
+        if document_id is not None:
+            return document_id
+        try:
+            id_class = extract_id_class(get_field_type(field))
+        except ValueError:
+            return None
+        if issubclass(id_class, ObjectId):
+            return id_class()
+        if issubclass(id_class, UUID):
+            return uuid4()
+        return None
+
     @classmethod
     async def get(
         cls: Type["DocType"],
@@ -266,13 +361,7 @@ class Document(
         :param **pymongo_kwargs: pymongo native parameters for find operation
         :return: Union["Document", None]
         """
-        if not isinstance(
-            document_id,
-            extract_id_class(get_field_type(get_model_fields(cls)["id"])),
-        ):
-            document_id = parse_object_as(
-                get_field_type(get_model_fields(cls)["id"]), document_id
-            )
+        document_id = cls._parse_id(document_id)
 
         return await cls.find_one(
             {"_id": document_id},
@@ -307,9 +396,7 @@ class Document(
 
         if merge_strategy == MergeStrategy.local:
             original_changes = self.get_changes()
-            new_state = document.get_saved_state()
-            if new_state is None:
-                raise DocumentWasNotSaved
+            new_state = document._get_state()
             changes_to_apply = self._collect_updates(
                 new_state, original_changes
             )
@@ -337,43 +424,17 @@ class Document(
         if self.get_settings().use_revision:
             self.revision_id = uuid4()
         if link_rule == WriteRules.WRITE:
-            link_fields = self.get_link_fields()
-            if link_fields is not None:
-                for field_info in link_fields.values():
-                    value = getattr(self, field_info.field_name)
-                    if field_info.link_type in [
-                        LinkTypes.DIRECT,
-                        LinkTypes.OPTIONAL_DIRECT,
-                    ]:
-                        if isinstance(value, Document):
-                            await value.save(link_rule=WriteRules.WRITE)
-                    if field_info.link_type in [
-                        LinkTypes.LIST,
-                        LinkTypes.OPTIONAL_LIST,
-                    ]:
-                        if isinstance(value, List):
-                            await asyncio.gather(
-                                *[
-                                    obj.save(link_rule=WriteRules.WRITE)
-                                    for obj in value
-                                    if isinstance(obj, Document)
-                                ]
-                            )
+            await self._write_linked_documents(
+                [self], include_back_links=False, session=session
+            )
         result = await self.get_motor_collection().insert_one(
             get_dict(
                 self, to_db=True, keep_nulls=self.get_settings().keep_nulls
             ),
             session=session,
         )
-        new_id = result.inserted_id
-        if not isinstance(
-            new_id,
-            extract_id_class(get_field_type(get_model_fields(self)["id"])),
-        ):
-            new_id = parse_object_as(
-                get_field_type(get_model_fields(self)["id"]), new_id
-            )
-        self.id = new_id
+        self.id = self._parse_id(result.inserted_id)
+        await self._invalidate_cache_on_write([self.id])
         return self
 
     async def create(
@@ -410,10 +471,13 @@ class Document(
             return await document.insert(link_rule=link_rule, session=session)
         else:
             if link_rule == WriteRules.WRITE:
-                raise NotSupported(
-                    "Cascade insert with bulk writing not supported"
+                await cls._write_linked_documents(
+                    [document],
+                    include_back_links=False,
+                    session=session,
+                    bulk_writer=bulk_writer,
                 )
-            bulk_writer.add_operation(
+            await bulk_writer.add(
                 Operation(
                     operation=InsertOne,
                     first_query=get_dict(
@@ -432,31 +496,103 @@ class Document(
         documents: Iterable[DocType],
         session: Optional[ClientSession] = None,
         link_rule: WriteRules = WriteRules.DO_NOTHING,
+        skip_actions: Optional[List[Union[ActionDirections, str]]] = None,
+        chunk_size: int = 1000,
         **pymongo_kwargs,
     ) -> InsertManyResult:
         """
-        Insert many documents to the collection
+        Insert many documents to the collection.
+        Like `insert`, runs the actions and the validation,
+        sets the revision ids, assigns the inserted ids to the documents
+        and saves their state, but writes the documents
+        with one `insert_many` call per chunk
 
         :param documents:  List["Document"] - documents to insert
         :param session: ClientSession - pymongo session
         :param link_rule: InsertRules - how to manage link fields
+        :param skip_actions: Optional[List[Union[ActionDirections, str]]]
+        - actions to skip
+        :param chunk_size: int - max number of documents per call
         :return: InsertManyResult
         """
+        if skip_actions is None:
+            skip_actions = []
+        documents_list = list(documents)
         if link_rule == WriteRules.WRITE:
-            raise NotSupported(
-                "Cascade insert not supported for insert many method"
+            await cls._write_linked_documents(
+                documents_list, include_back_links=False, session=session
             )
-        documents_list = [
-            get_dict(
+        inserted_ids: List[Any] = []
+        acknowledged = True
+        for start in range(0, len(documents_list), chunk_size):
+            chunk = documents_list[start : start + chunk_size]
+            for document in chunk:
+                await ActionRegistry.run_actions(
+                    document,
+                    event_type=EventTypes.INSERT,
+                    action_direction=ActionDirections.BEFORE,
+                    exclude=skip_actions,
+                )
+                await document.validate_self(skip_actions=skip_actions)
+                if document.get_settings().use_revision:
+                    document.revision_id = uuid4()
+            raw_documents = [
+                get_dict(
+                    document,
+                    to_db=True,
+                    keep_nulls=document.get_settings().keep_nulls,
+                )
+                for document in chunk
+            ]
+            try:
+                result = await cls.get_motor_collection().insert_many(
+                    raw_documents, session=session, **pymongo_kwargs
+                )
+            except BulkWriteError as e:
+                failed = {error["index"] for error in e.details["writeErrors"]}
+                if pymongo_kwargs.get("ordered", True):
+                    # Ordered inserts stop on the first error
+                    failed.update(range(min(failed, default=0), len(chunk)))
+                await cls._finish_insert_many(
+                    [
+                        (document, raw_document)
+                        for i, (document, raw_document) in enumerate(
+                            zip(chunk, raw_documents)
+                        )
+                        if i not in failed
+                    ],
+                    skip_actions,
+                )
+                raise
+            acknowledged = acknowledged and result.acknowledged
+            await cls._finish_insert_many(
+                list(zip(chunk, raw_documents)), skip_actions
+            )
+            # pymongo sets the generated ids to the raw documents
+            inserted_ids.extend(
+                raw_document["_id"] for raw_document in raw_documents
+            )
+        return InsertManyResult(inserted_ids, acknowledged)
+
+    @classmethod
+    async def _finish_insert_many(
+        cls,
+        inserted: List[Tuple["Document", Dict[str, Any]]],
+        skip_actions: List[Union[ActionDirections, str]],
+    ) -> None:
+        for document, raw_document in inserted:
+            document.id = document._parse_id(raw_document["_id"])
+            document._save_state()
+            await ActionRegistry.run_actions(
                 document,
-                to_db=True,
-                keep_nulls=document.get_settings().keep_nulls,
+                event_type=EventTypes.INSERT,
+                action_direction=ActionDirections.AFTER,
+                exclude=skip_actions,
+            )
+        if inserted:
+            await cls._invalidate_cache_on_write(
+                [document.id for document, _ in inserted]
             )
-            for document in documents
-        ]
-        return await cls.get_motor_collection().insert_many(
-            documents_list, session=session, **pymongo_kwargs
-        )
 
     @wrap_with_actions(EventTypes.REPLACE)
     @save_state_after
@@ -481,46 +617,14 @@ class Document(
         if self.id is None:
             raise ValueError("Document must have an id")
 
-        if bulk_writer is not None and link_rule != WriteRules.DO_NOTHING:
-            raise NotSupported
-
         if link_rule == WriteRules.WRITE:
-            link_fields = self.get_link_fields()
-            if link_fields is not None:
-                for field_info in link_fields.values():
-                    value = getattr(self, field_info.field_name)
-                    if field_info.link_type in [
-                        LinkTypes.DIRECT,
-                        LinkTypes.OPTIONAL_DIRECT,
-                        LinkTypes.BACK_DIRECT,
-                        LinkTypes.OPTIONAL_BACK_DIRECT,
-                    ]:
-                        if isinstance(value, Document):
-                            await value.replace(
-                                link_rule=link_rule,
-                                bulk_writer=bulk_writer,
-                                ignore_revision=ignore_revision,
-                                session=session,
-                            )
-                    if field_info.link_type in [
-                        LinkTypes.LIST,
-                        LinkTypes.OPTIONAL_LIST,
-                        LinkTypes.BACK_LIST,
-                        LinkTypes.OPTIONAL_BACK_LIST,
-                    ]:
-                        if isinstance(value, List):
-                            await asyncio.gather(
-                                *[
-                                    obj.replace(
-                                        link_rule=link_rule,
-                                        bulk_writer=bulk_writer,
-                                        ignore_revision=ignore_revision,
-                                        session=session,
-                                    )
-                                    for obj in value
-                                    if isinstance(obj, Document)
-                                ]
-                            )
+            await self._write_linked_documents(
+                [self],
+                replace=True,
+                ignore_revision=ignore_revision,
+                session=session,
+                bulk_writer=bulk_writer,
+            )
 
         use_revision_id = self.get_settings().use_revision
         find_query: Dict[str, Any] = {"_id": self.id}
@@ -561,36 +665,11 @@ class Document(
         :return: None
         """
         if link_rule == WriteRules.WRITE:
-            link_fields = self.get_link_fields()
-            if link_fields is not None:
-                for field_info in link_fields.values():
-                    value = getattr(self, field_info.field_name)
-                    if field_info.link_type in [
-                        LinkTypes.DIRECT,
-                        LinkTypes.OPTIONAL_DIRECT,
-                        LinkTypes.BACK_DIRECT,
-                        LinkTypes.OPTIONAL_BACK_DIRECT,
-                    ]:
-                        if isinstance(value, Document):
-                            await value.save(
-                                link_rule=link_rule, session=session
-                            )
-                    if field_info.link_type in [
-                        LinkTypes.LIST,
-                        LinkTypes.OPTIONAL_LIST,
-                        LinkTypes.BACK_LIST,
-                        LinkTypes.OPTIONAL_BACK_LIST,
-                    ]:
-                        if isinstance(value, List):
-                            await asyncio.gather(
-                                *[
-                                    obj.save(
-                                        link_rule=link_rule, session=session
-                                    )
-                                    for obj in value
-                                    if isinstance(obj, Document)
-                                ]
-                            )
+            await self._write_linked_documents(
+                [self],
+                session=session,
+                bulk_writer=kwargs.get("bulk_writer"),
+            )
 
         if self.get_settings().keep_nulls is False:
             return await self.update(
@@ -642,22 +721,12 @@ class Document(
         """
         if not self.is_changed:
             return None
-        changes = self.get_changes()
-        if self.get_settings().keep_nulls is False:
-            return await self.update(
-                SetOperator(changes),
-                Unset(get_top_level_nones(self)),
-                ignore_revision=ignore_revision,
-                session=session,
-                bulk_writer=bulk_writer,
-            )
-        else:
-            return await self.set(
-                changes,
-                ignore_revision=ignore_revision,
-                session=session,
-                bulk_writer=bulk_writer,
-            )
+        return await self.update(
+            *self._get_changes_operators(),
+            ignore_revision=ignore_revision,
+            session=session,
+            bulk_writer=bulk_writer,
+        )
 
     @classmethod
     async def replace_many(
@@ -683,6 +752,305 @@ class Document(
                     bulk_writer=bulk_writer, session=session
                 )
 
+    @classmethod
+    async def _write_linked_documents(
+        cls,
+        documents: Sequence["Document"],
+        include_back_links: bool = True,
+        replace: bool = False,
+        ignore_revision: bool = False,
+        session: Optional[ClientSession] = None,
+        bulk_writer: Optional[BulkWriter] = None,
+    ) -> None:
+        """
+        Write the documents linked from the given ones.
+        Linked documents are saved (or replaced) with one bulk write
+        per document class, linked documents first
+
+        :param documents: Sequence["Document"] - documents to write
+        :param include_back_links: bool - follow the back links
+        of the given documents
+        :param replace: bool - replace the linked documents
+        instead of saving them
+        :param ignore_revision: bool - do force write
+        :param session: Optional[ClientSession] - pymongo session
+        :param bulk_writer: Optional[BulkWriter] - add the writes
+        to the bulk writer instead of running them
+        :return: None
+        """
+        linked_documents = plan_cascade_write(documents, include_back_links)
+        if not replace:
+            # Linking documents can be encoded before the linked ones
+            # are written: in the bulk writer or in the same class group.
+            # Ids, which only the database can assign, are set on the write
+            for document in linked_documents:
+                if document.id is None:
+                    document.id = document._generate_id()
+        if bulk_writer is not None:
+            for document in linked_documents:
+                if replace:
+                    await document.replace(
+                        ignore_revision=ignore_revision,
+                        session=session,
+                        bulk_writer=bulk_writer,
+                    )
+                else:
+                    await document.save(
+                        ignore_revision=ignore_revision,
+                        session=session,
+                        bulk_writer=bulk_writer,
+                    )
+            return
+
+        for document_class, class_documents in group_by_class(
+            linked_documents
+        ).items():
+            if replace:
+                class_bulk_writer = BulkWriter(session=session)
+                for document in class_documents:
+                    await document.replace(
+                        ignore_revision=ignore_revision,
+                        session=session,
+                        bulk_writer=class_bulk_writer,
+                    )
+                bulk_result = await class_bulk_writer.commit()
+                if (
+                    bulk_result is not None
+                    and bulk_result.matched_count < len(class_documents)
+                ):
+                    if (
+                        document_class.get_settings().use_revision
+                        and not ignore_revision
+                    ):
+                        raise RevisionIdWasChanged
+                    raise DocumentNotFound
+            else:
+                result = await document_class.save_many(
+                    class_documents,
+                    ignore_revision=ignore_revision,
+                    session=session,
+                )
+                if result.conflicts:
+                    raise RevisionIdWasChanged
+                if result.errors:
+                    _, error = result.errors[0]
+                    raise WriteError(
+                        error.get("errmsg", ""), error.get("code"), error
+                    )
+
+    @classmethod
+    async def save_many(
+        cls: Type[DocType],
+        documents: Iterable[DocType],
+        ignore_revision: bool = False,
+        session: Optional[ClientSession] = None,
+        skip_actions: Optional[List[Union[ActionDirections, str]]] = None,
+    ) -> "SaveManyResult[DocType]":
+        """
+        Save many documents with one unordered `bulk_write`.
+        Documents are upserted like with `save`
+
+        :param documents: Iterable["Document"] - documents to save
+        :param ignore_revision: bool - do force save
+        :param session: Optional[ClientSession] - pymongo session
+        :param skip_actions: Optional[List[Union[ActionDirections, str]]]
+        - actions to skip
+        :return: SaveManyResult - saved documents and conflicts
+        """
+        return await cls._save_many(
+            documents,
+            changes_only=False,
+            ignore_revision=ignore_revision,
+            session=session,
+            skip_actions=skip_actions,
+        )
+
+    @classmethod
+    async def save_changes_many(
+        cls: Type[DocType],
+        documents: Iterable[DocType],
+        ignore_revision: bool = False,
+        session: Optional[ClientSession] = None,
+        skip_actions: Optional[List[Union[ActionDirections, str]]] = None,
+    ) -> "SaveManyResult[DocType]":
+        """
+        Save changes of many documents with one unordered `bulk_write`.
+        State management usage must be turned on
+
+        :param documents: Iterable["Document"] - documents to save
+        :param ignore_revision: bool - ignore revision id,
+        if revision is turned on
+        :param session: Optional[ClientSession] - pymongo session
+        :param skip_actions: Optional[List[Union[ActionDirections, str]]]
+        - actions to skip
+        :return: SaveManyResult - saved documents and conflicts
+        """
+        return await cls._save_many(
+            documents,
+            changes_only=True,
+            ignore_revision=ignore_revision,
+            session=session,
+            skip_actions=skip_actions,
+        )
+
+    @classmethod
+    async def _save_many(
+        cls: Type[DocType],
+        documents: Iterable[DocType],
+        changes_only: bool,
+        ignore_revision: bool,
+        session: Optional[ClientSession],
+        skip_actions: Optional[List[Union[ActionDirections, str]]],
+    ) -> "SaveManyResult[DocType]":
+        if skip_actions is None:
+            skip_actions = []
+        event_type = (
+            EventTypes.SAVE_CHANGES if changes_only else EventTypes.SAVE
+        )
+        result: SaveManyResult[DocType] = SaveManyResult()
+        # Documents to write with their ids, filters and new revision ids
+        planned: List[Tuple[DocType, Any, Dict[str, Any], Optional[UUID]]] = []
+        bulk_writer = BulkWriter(session=session, ordered=False)
+        for document in documents:
+            if changes_only:
+                check_if_state_saved(document)
+            await ActionRegistry.run_actions(
+                document,
+                event_type=event_type,
+                action_direction=ActionDirections.BEFORE,
+                exclude=skip_actions,
+            )
+            await document.validate_self(skip_actions=skip_actions)
+            if changes_only and not document.is_changed:
+                result.unchanged.append(document)
+                continue
+
+            settings = document.get_settings()
+            arguments: List[Any]
+            if changes_only:
+                arguments = document._get_changes_operators()
+            else:
+                arguments = [
+                    SetOperator(
+                        get_dict(
+                            document,
+                            to_db=True,
+                            keep_nulls=settings.keep_nulls,
+                        )
+                    )
+                ]
+                if settings.keep_nulls is False:
+                    arguments.append(Unset(get_top_level_nones(document)))
+            document_id = (
+                document.id
+                if document.id is not None
+                else document._generate_id()
+            )
+            # The filter matches nothing, so the upsert assigns the id
+            find_query: Dict[str, Any] = {
+                "_id": document_id if document_id is not None else {"$in": []}
+            }
+            new_revision_id = None
+            if settings.use_revision:
+                if not ignore_revision:
+                    find_query["revision_id"] = document.revision_id
+                new_revision_id = uuid4()
+                arguments.append(SetRevisionId(new_revision_id))
+            await document.find_one(find_query).update(
+                *arguments,
+                bulk_writer=bulk_writer,
+                upsert=not changes_only,
+            )
+            planned.append(
+                (document, document_id, find_query, new_revision_id)
+            )
+
+        write_errors: Dict[int, Mapping[str, Any]] = {}
+        upserted_ids: Dict[int, Any] = {}
+        bulk_result = None
+        if planned:
+            try:
+                bulk_result = await bulk_writer.commit()
+            except BulkWriteError as e:
+                if e.details["writeConcernErrors"]:
+                    raise
+                write_errors = {
+                    error["index"]: error for error in e.details["writeErrors"]
+                }
+                upserted_ids = {
+                    item["index"]: item["_id"]
+                    for item in e.details["upserted"]
+                }
+            if bulk_result is not None:
+                upserted_ids = bulk_result.upserted_ids or {}
+
+        stored_revisions: Optional[Dict[Any, Any]] = None
+        if (
+            changes_only
+            and planned
+            and (
+                bulk_result is None or bulk_result.matched_count < len(planned)
+            )
+        ):
+            # Updates without upsert do not report which documents
+            # were not matched. UUID values are read as binary ones
+            encoder = Encoder(custom_encoders=cls.get_bson_encoders())
+            ids = [
+                encoder.encode(document_id) for _, document_id, _, _ in planned
+            ]
+            stored_revisions = {
+                decode_uuid(raw["_id"]): decode_uuid(raw.get("revision_id"))
+                for raw in await cls.get_motor_collection()
+                .find(
+                    {"_id": {"$in": ids}},
+                    projection={"revision_id": 1},
+                    session=session,
+                )
+                .to_list(length=None)
+            }
+
+        for index, (
+            document,
+            document_id,
+            find_query,
+            new_revision_id,
+        ) in enumerate(planned):
+            error = write_errors.get(index)
+            if error is not None:
+                # Duplicated id on upsert means the revision was changed
+                if error.get("code") == 11000 and "revision_id" in find_query:
+                    result.conflicts.append(document)
+                else:
+                    result.errors.append((document, error))
+                continue
+            if stored_revisions is not None:
+                stored_id = decode_uuid(ids[index])
+                if stored_id not in stored_revisions or (
+                    new_revision_id is not None
+                    and stored_revisions[stored_id] != new_revision_id
+                ):
+                    result.conflicts.append(document)
+                    continue
+            if document.id is None:
+                document.id = (
+                    document_id
+                    if document_id is not None
+                    else cls._parse_id(upserted_ids[index])
+                )
+            if new_revision_id is not None:
+                document.revision_id = new_revision_id
+            document._save_state()
+            result.saved.append(document)
+
+        for document in result.saved + result.unchanged:
+            await ActionRegistry.run_actions(
+                document,
+                event_type=event_type,
+                action_direction=ActionDirections.AFTER,
+                exclude=skip_actions,
+            )
+        return result
+
     @wrap_with_actions(EventTypes.UPDATE)
     @save_state_after
     async def update(
@@ -713,10 +1081,11 @@ class Document(
             )
         use_revision_id = self.get_settings().use_revision
 
-        if self.id is not None:
-            find_query: Dict[str, Any] = {"_id": self.id}
-        else:
-            find_query = {"_id": PydanticObjectId()}
+        document_id = self.id if self.id is not None else self._generate_id()
+        # The filter matches nothing, so the upsert assigns the id
+        find_query: Dict[str, Any] = {
+            "_id": document_id if document_id is not None else {"$in": []}
+        }
 
         if use_revision_id and not ignore_revision:
             find_query["revision_id"] = self.revision_id
@@ -885,43 +1254,59 @@ class Document(
         """
 
         if link_rule == DeleteRules.DELETE_LINKS:
-            link_fields = self.get_link_fields()
-            if link_fields is not None:
-                for field_info in link_fields.values():
-                    value = getattr(self, field_info.field_name)
-                    if field_info.link_type in [
-                        LinkTypes.DIRECT,
-                        LinkTypes.OPTIONAL_DIRECT,
-                        LinkTypes.BACK_DIRECT,
-                        LinkTypes.OPTIONAL_BACK_DIRECT,
-                    ]:
-                        if isinstance(value, Document):
-                            await value.delete(
-                                link_rule=DeleteRules.DELETE_LINKS,
-                                **pymongo_kwargs,
-                            )
-                    if field_info.link_type in [
-                        LinkTypes.LIST,
-                        LinkTypes.OPTIONAL_LIST,
-                        LinkTypes.BACK_LIST,
-                        LinkTypes.OPTIONAL_BACK_LIST,
-                    ]:
-                        if isinstance(value, List):
-                            await asyncio.gather(
-                                *[
-                                    obj.delete(
-                                        link_rule=DeleteRules.DELETE_LINKS,
-                                        **pymongo_kwargs,
-                                    )
-                                    for obj in value
-                                    if isinstance(obj, Document)
-                                ]
-                            )
+            await self._delete_linked_documents(
+                session=session, bulk_writer=bulk_writer, **pymongo_kwargs
+            )
 
         return await self.find_one({"_id": self.id}).delete(
             session=session, bulk_writer=bulk_writer, **pymongo_kwargs
         )
 
+    async def _delete_linked_documents(
+        self,
+        session: Optional[ClientSession] = None,
+        bulk_writer: Optional[BulkWriter] = None,
+        **pymongo_kwargs,
+    ) -> None:
+        """
+        Delete the documents linked from this one
+        with one `delete_many` per document class.
+        Unfetched links are followed up to `max_nesting_depth` levels.
+        Actions run for the fetched linked documents only
+
+        :param session: Optional[ClientSession] - pymongo session.
+        :param bulk_writer: "BulkWriter" - Beanie bulk writer
+        :param **pymongo_kwargs: pymongo native parameters for delete operation
+        """
+        linked_documents, linked_ids = await plan_cascade_delete(
+            self, self.get_settings().max_nesting_depth, session=session
+        )
+        for document in linked_documents:
+            await ActionRegistry.run_actions(
+                document, EventTypes.DELETE, ActionDirections.BEFORE, []
+            )
+        for document_class, ids in linked_ids.items():
+            query = document_class.find(
+                In("_id", ids), with_children=True, session=session
+            )
+            if issubclass(document_class, DocumentWithSoftDelete):
+                await query.update(
+                    SetOperator({"deleted_at": datetime.utcnow()}),
+                    session=session,
+                    bulk_writer=bulk_writer,
+                    **pymongo_kwargs,
+                )
+            else:
+                await query.delete(
+                    session=session, bulk_writer=bulk_writer, **pymongo_kwargs
+                )
+        for document in linked_documents:
+            if isinstance(document, DocumentWithSoftDelete):
+                document.deleted_at = datetime.utcnow()
+            await ActionRegistry.run_actions(
+                document, EventTypes.DELETE, ActionDirections.AFTER, []
+            )
+
     @classmethod
     async def delete_all(
         cls,
@@ -941,6 +1326,80 @@ class Document(
             session=session, bulk_writer=bulk_writer, **pymongo_kwargs
         )
 
+    # Cache
+
+    @classmethod
+    async def invalidate_cache(
+        cls, document_ids: Optional[Iterable[Any]] = None
+    ) -> None:
+        """
+        Invalidate cached results of the document collection.
+        All the classes of the inheritance tree share the collection,
+        so their caches are invalidated too, as well as the caches
+        of the union doc and the views, which read the collection.
+        If ids are provided, cached lookups by other ids are kept.
+
+        :param document_ids: Optional[Iterable[Any]] - ids of the changed
+        documents. All the cache is invalidated if None
+        :return: None
+        """
+        root = cls._get_root()
+        tags = get_invalidation_tags(document_ids)
+        for document_class in [root, *root._children.values()]:
+            if document_class._cache is not None:
+                await invalidate_cached(document_class._cache, tags)
+        await cls._invalidate_dependent_caches(document_ids)
+
+    @classmethod
+    async def _invalidate_dependent_caches(
+        cls,
+        document_ids: Optional[Iterable[Any]] = None,
+        on_write: bool = False,
+    ) -> None:
+        """
+        Invalidate cached results of the union doc and the views,
+        which read the document collection
+
+        :param document_ids: Optional[Iterable[Any]] - ids of the changed
+        documents. All the cache is invalidated if None
+        :param on_write: bool - invalidate only the caches
+        with `cache_invalidate_on_write` setting
+        :return: None
+        """
+        union_doc = cls._get_root().get_settings().union_doc
+        if (
+            union_doc is not None
+            and union_doc._cache is not None
+            and (
+                not on_write
+                or union_doc.get_settings().cache_invalidate_on_write
+            )
+        ):
+            await invalidate_cached(
+                union_doc._cache, get_invalidation_tags(document_ids)
+            )
+        collection = cls.get_motor_collection()
+        await View.invalidate_source_caches(
+            f"{collection.database.name}.{collection.name}", on_write=on_write
+        )
+
+    @classmethod
+    async def _invalidate_cache_on_write(
+        cls, document_ids: Optional[Iterable[Any]] = None
+    ) -> None:
+        if cls.get_settings().cache_invalidate_on_write:
+            await cls.invalidate_cache(document_ids)
+        else:
+            # The union doc and the views could have their own setting
+            await cls._invalidate_dependent_caches(document_ids, on_write=True)
+
+    @classmethod
+    def _get_root(cls) -> Type["Document"]:
+        root = cls
+        while root._parent is not None:
+            root = root._parent
+        return root
+
     # State management
 
     @classmethod
@@ -967,6 +1426,121 @@ class Document(
         """
         return cls.get_settings().state_management_replace_objects
 
+    @classmethod
+    def state_management_snapshot(cls) -> StateSnapshot:
+        """
+        Representation of the saved state
+        :return: StateSnapshot
+        """
+        return cls.get_settings().state_management_snapshot
+
+    @classmethod
+    def _check_snapshot_values(cls) -> None:
+        """
+        Check if the snapshots keep the values of the fields.
+        Internal method
+        :return: None
+        """
+        if cls.state_management_snapshot() == StateSnapshot.HASH:
+            raise NotSupported(
+                "Hash snapshots keep no values of the fields, "
+                "use the DICT or BSON state_management_snapshot"
+            )
+
+    @classmethod
+    def state_management_track_changes(cls) -> bool:
+        """
+        Should the changes of the fields and of the nested values
+        be tracked to encode only the changed paths,
+        when the changes are collected
+        :return: bool
+        """
+        return cls.get_settings().state_management_track_changes
+
+    def _get_tracked_fields(self) -> Optional[Dict[Tuple[str, ...], Any]]:
+        """
+        Paths, which could be changed since the state was saved,
+        with their current values: the assigned paths, the paths
+        of the nested values changed in place and the fields,
+        whose changes can't be tracked. Hash snapshots keep
+        the top level fields only, so the paths are cut to them.
+        Internal method
+        :return: Optional[Dict[Tuple[str, ...], Any]] - values by
+        the paths of the database keys or None if the changes
+        are not tracked
+        """
+        changed_paths = self._changed_paths
+        if changed_paths is None or not self.state_management_track_changes():
+            return None
+        paths = set(changed_paths)
+        paths.update((name,) for name in self._untrackable_fields)
+        if IS_PYDANTIC_V2 and self.__pydantic_extra__:
+            paths.update((name,) for name in self.__pydantic_extra__)
+        if self.state_management_snapshot() == StateSnapshot.HASH:
+            paths = {path[:1] for path in paths}
+        tracked = resolve_paths(self, paths, self.get_settings().keep_nulls)
+        tracked.pop(("revision_id",), None)
+        return tracked
+
+    def _get_tracked_state(
+        self, tracked: Dict[Tuple[str, ...], Any]
+    ) -> Dict[Tuple[str, ...], Any]:
+        """
+        Encode the values of the tracked paths the same way
+        the whole document is encoded. Internal method
+        :param tracked: Dict[Tuple[str, ...], Any] - values by the paths
+        :return: Dict[Tuple[str, ...], Any] - encoded values by the paths
+        """
+        keys = {path[0] for path in tracked if len(path) == 1}
+        state: Dict[Tuple[str, ...], Any] = {
+            (key,): value for key, value in self._get_state(keys).items()
+        }
+        encoder = Encoder(
+            custom_encoders=get_document_encoding_plan(
+                type(self)
+            ).custom_encoders,
+            to_db=True,
+            keep_nulls=self.get_settings().keep_nulls,
+        )
+        for path, value in tracked.items():
+            if len(path) > 1:
+                state[path] = encoder.encode(value)
+        return state
+
+    def _get_state(self, keys: Optional[Set[str]] = None) -> Dict[str, Any]:
+        """
+        Encode the document or only the given fields of it
+        to compare with the saved state. Internal method
+        :param keys: Optional[Set[str]] - keys of the fields to encode
+        :return: Dict[str, Any]
+        """
+        state = get_dict(
+            self,
+            to_db=True,
+            keep_nulls=self.get_settings().keep_nulls,
+            exclude={"revision_id"},
+            include=keys,
+        )
+        if keys is not None:
+            # the class id is not a field and can't be changed
+            state = {k: v for k, v in state.items() if k in keys}
+        return state
+
+    def _get_changed_nones(self) -> Dict[str, Any]:
+        """
+        Top level fields with None values, which could be changed.
+        They are unset on save, when the nulls are not kept
+        :return: Dict[str, Any]
+        """
+        tracked = self._get_tracked_fields()
+        if tracked is None:
+            return get_top_level_nones(self)
+        return {
+            path[0]: None
+            for path, value in tracked.items()
+            if len(path) == 1 and value is None
+        }
+
     def _save_state(self) -> None:
         """
         Save current document state. Internal method
@@ -976,38 +1550,79 @@ class Document(
             if self.state_management_save_previous():
                 self._previous_saved_state = self._saved_state
 
-            self._saved_state = get_dict(
-                self,
-                to_db=True,
-                keep_nulls=self.get_settings().keep_nulls,
-                exclude={"revision_id"},
-            )
+            snapshot = self.state_management_snapshot()
+            tracked = self._get_tracked_fields()
+            state = None
+            if tracked is not None and self._saved_state is not None:
+                state = self._update_saved_state(tracked)
+            if state is None:
+                self._saved_state = make_snapshot(self._get_state(), snapshot)
+            else:
+                self._saved_state = (
+                    make_snapshot(state, snapshot)
+                    if snapshot == StateSnapshot.BSON
+                    else state
+                )
+            if self.state_management_track_changes():
+                if self._changed_paths is None:
+                    track_fields(self)
+                self._changed_paths = set()
+
+    def _update_saved_state(
+        self, tracked: Dict[Tuple[str, ...], Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Saved state with the current values of the tracked paths.
+        It is a new dict, the previous state is kept as is.
+        Internal method
+        :param tracked: Dict[Tuple[str, ...], Any] - values by the paths
+        :return: Optional[Dict[str, Any]] - state or None
+        if the paths are not in the saved state
+        """
+        encoded = self._get_tracked_state(tracked)
+        normalized = normalize_state(
+            {".".join(path): value for path, value in encoded.items()},
+            self.state_management_snapshot(),
+        )
+        state = read_snapshot(self._saved_state)  # type: ignore
+        try:
+            for path, value in zip(encoded, normalized.values()):
+                state = set_state_path(state, path, value)
+        except (KeyError, IndexError, ValueError):
+            return None
+        # the top level nulls are not kept
+        removed = {path[0] for path in tracked if path not in encoded}
+        if removed:
+            state = {k: v for k, v in state.items() if k not in removed}
+        return state
 
     def get_saved_state(self) -> Optional[Dict[str, Any]]:
         """
         Saved state getter. It is protected property.
+        Hash snapshots return the hashes of the fields
         :return: Optional[Dict[str, Any]] - saved state
         """
-        return self._saved_state
+        if self._saved_state is None:
+            return None
+        return read_snapshot(self._saved_state)
 
     def get_previous_saved_state(self) -> Optional[Dict[str, Any]]:
         """
         Previous state getter. It is a protected property.
+        Hash snapshots return the hashes of the fields
         :return: Optional[Dict[str, Any]] - previous state
         """
-        return self._previous_saved_state
+        if self._previous_saved_state is None:
+            return None
+        return read_snapshot(self._previous_saved_state)
 
     @property
     @saved_state_needed
     def is_changed(self) -> bool:
-        if self._saved_state == get_dict(
-            self,
-            to_db=True,
-            keep_nulls=self.get_settings().keep_nulls,
-            exclude={"revision_id"},
-        ):
-            return False
-        return True
+        saved_state, state = self._get_states_to_compare()
+        return saved_state != normalize_state(
+            state, self.state_management_snapshot()
+        )
 
     @property
     @saved_state_needed
@@ -1059,33 +1674,205 @@ class Document(
 
         return updates
 
+    def _get_states_to_compare(
+        self,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Saved and current states of the document. Only the tracked
+        fields are encoded and compared, if the changes are tracked.
+        Internal method
+        :return: Tuple[Dict[str, Any], Dict[str, Any]] - values of the
+        snapshot and the encoded state
+        """
+        saved_state = read_snapshot(self._saved_state)  # type: ignore
+        tracked = self._get_tracked_fields()
+        if tracked is None:
+            return saved_state, self._get_state()
+        saved_values = {}
+        for path in tracked:
+            found, value = get_state_path(saved_state, path)
+            if found:
+                saved_values[".".join(path)] = value
+        return saved_values, {
+            ".".join(path): value
+            for path, value in self._get_tracked_state(tracked).items()
+        }
+
     @saved_state_needed
     def get_changes(self) -> Dict[str, Any]:
+        snapshot = self.state_management_snapshot()
+        saved_state, state = self._get_states_to_compare()
+        if snapshot == StateSnapshot.HASH:
+            # old values are unknown, changed fields are replaced as a whole
+            hashes = normalize_state(state, snapshot)
+            if saved_state.keys() - hashes.keys():
+                return state
+            return {
+                k: v
+                for k, v in state.items()
+                if hashes[k] != saved_state.get(k)
+            }
         return self._collect_updates(
-            self._saved_state,  # type: ignore
-            get_dict(
-                self,
-                to_db=True,
-                keep_nulls=self.get_settings().keep_nulls,
-                exclude={"revision_id"},
-            ),
+            saved_state, normalize_state(state, snapshot)
         )
 
+    def _collect_operators(
+        self,
+        old_dict: Dict[str, Any],
+        new_dict: Dict[str, Any],
+        operators: Dict[str, Dict[str, Any]],
+        prefix: str = "",
+    ) -> None:
+        """
+        Compares old_dict with new_dict like `_collect_updates` does,
+        but changes of the arrays are collected as appends, removals
+        and updates of the elements when possible
+        Args:
+            old_dict: dict1
+            new_dict: dict2
+            operators: updates by the update operators to fill
+            prefix: path of the compared dicts
+        """
+        if old_dict.keys() - new_dict.keys():
+            if prefix:
+                operators.setdefault("$set", {})[prefix[:-1]] = new_dict
+            else:
+                operators.setdefault("$set", {}).update(new_dict)
+            return
+        replace_objects = self.state_management_replace_objects()
+        for field_name, field_value in new_dict.items():
+            old_value = old_dict.get(field_name)
+            if field_value == old_value and field_name in old_dict:
+                continue
+            path = f"{prefix}{field_name}"
+            if (
+                not replace_objects
+                and isinstance(field_value, dict)
+                and isinstance(old_value, dict)
+            ):
+                self._collect_operators(
+                    old_value, field_value, operators, f"{path}."
+                )
+            elif isinstance(field_value, list) and isinstance(old_value, list):
+                self._collect_array_operators(
+                    old_value, field_value, operators, path
+                )
+            else:
+                operators.setdefault("$set", {})[path] = field_value
+
+    def _collect_array_operators(
+        self,
+        old_list: List[Any],
+        new_list: List[Any],
+        operators: Dict[str, Dict[str, Any]],
+        path: str,
+    ) -> None:
+        """
+        Collect the changes of the array as `$push` of the appended
+        elements, `$pullAll` of the removed ones or `$set` of
+        the changed elements. The whole array is set, if the changes
+        are mixed or too many elements are changed
+        Args:
+            old_list: list1
+            new_list: list2
+            operators: updates by the update operators to fill
+            path: path of the array
+        """
+        limit = self.get_settings().state_management_array_updates_limit * len(
+            old_list
+        )
+        old_len, new_len = len(old_list), len(new_list)
+        if new_len > old_len and new_list[:old_len] == old_list:
+            operators.setdefault("$push", {})[path] = {
+                "$each": new_list[old_len:]
+            }
+            return
+        if new_len < old_len:
+            removed = []
+            kept = 0
+            for value in old_list:
+                if kept < new_len and value == new_list[kept]:
+                    kept += 1
+                else:
+                    removed.append(value)
+            # $pullAll removes all the equal elements
+            if (
+                kept == new_len
+                and len(removed) <= limit
+                and all(value not in new_list for value in removed)
+            ):
+                operators.setdefault("$pullAll", {})[path] = removed
+                return
+        if new_len == old_len:
+            changed = [
+                index
+                for index in range(new_len)
+                if new_list[index] != old_list[index]
+            ]
+            if len(changed) <= limit:
+                for index in changed:
+                    old_value, new_value = old_list[index], new_list[index]
+                    if (
+                        not self.state_management_replace_objects()
+                        and isinstance(new_value, dict)
+                        and isinstance(old_value, dict)
+                    ):
+                        self._collect_operators(
+                            old_value, new_value, operators, f"{path}.{index}."
+                        )
+                    else:
+                        operators.setdefault("$set", {})[
+                            f"{path}.{index}"
+                        ] = new_value
+                return
+        operators.setdefault("$set", {})[path] = new_list
+
+    def _get_changes_operators(self) -> List[Any]:
+        """
+        Update operators, which save the changes of the document.
+        Internal method
+        :return: List[Any]
+        """
+        snapshot = self.state_management_snapshot()
+        settings = self.get_settings()
+        arguments: List[Any]
+        if (
+            settings.state_management_array_updates
+            and snapshot != StateSnapshot.HASH
+        ):
+            saved_state, state = self._get_states_to_compare()
+            operators: Dict[str, Dict[str, Any]] = {}
+            self._collect_operators(
+                saved_state, normalize_state(state, snapshot), operators
+            )
+            arguments = [
+                {operator: updates} for operator, updates in operators.items()
+            ]
+        else:
+            arguments = [SetOperator(self.get_changes())]
+        if settings.keep_nulls is False:
+            arguments.append(Unset(self._get_changed_nones()))
+        return arguments
+
     @saved_state_needed
     @previous_saved_state_needed
     def get_previous_changes(self) -> Dict[str, Any]:
         if self._previous_saved_state is None:
             return {}
+        self._check_snapshot_values()
 
         return self._collect_updates(
-            self._previous_saved_state,
-            self._saved_state,  # type: ignore
+            read_snapshot(self._previous_saved_state),
+            read_snapshot(self._saved_state),  # type: ignore
         )
 
     @saved_state_needed
     def rollback(self) -> None:
+        self._check_snapshot_values()
         if self.is_changed:
-            for key, value in self._saved_state.items():  # type: ignore
+            for key, value in read_snapshot(
+                self._saved_state  # type: ignore
+            ).items():
                 if key == "_id":
                     setattr(self, "id", value)
                 else:
@@ -1254,9 +2041,10 @@ class DocumentWithSoftDelete(Document):
         sort: Union[None, str, List[Tuple[str, SortDirection]]] = None,
         session: Optional[ClientSession] = None,
         ignore_cache: bool = False,
-        fetch_links: bool = False,
+        fetch_links: FetchLinksType = False,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
         **pymongo_kwargs,
@@ -1271,6 +2059,7 @@ class DocumentWithSoftDelete(Document):
             ignore_cache=ignore_cache,
             fetch_links=fetch_links,
             lazy_parse=lazy_parse,
+            raw_bson=raw_bson,
             nesting_depth=nesting_depth,
             nesting_depths_per_field=nesting_depths_per_field,
             **pymongo_kwargs,
@@ -1286,9 +2075,10 @@ class DocumentWithSoftDelete(Document):
         sort: Union[None, str, List[Tuple[str, SortDirection]]] = None,
         session: Optional[ClientSession] = None,
         ignore_cache: bool = False,
-        fetch_links: bool = False,
+        fetch_links: FetchLinksType = False,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
         **pymongo_kwargs,
@@ -1306,6 +2096,7 @@ class DocumentWithSoftDelete(Document):
             ignore_cache=ignore_cache,
             fetch_links=fetch_links,
             lazy_parse=lazy_parse,
+            raw_bson=raw_bson,
             nesting_depth=nesting_depth,
             nesting_depths_per_field=nesting_depths_per_field,
             **pymongo_kwargs,
@@ -1322,6 +2113,7 @@ class DocumentWithSoftDelete(Document):
         with_children: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
+        raw_bson: bool = False,
         **pymongo_kwargs,
     ) -> Union[FindOne[FindType], FindOne["DocumentProjectionType"]]:
         args = cls._add_class_id_filter(args, with_children) + (
@@ -1335,5 +2127,6 @@ class DocumentWithSoftDelete(Document):
             fetch_links=fetch_links,
             nesting_depth=nesting_depth,
             nesting_depths_per_field=nesting_depths_per_field,
+            raw_bson=raw_bson,
             **pymongo_kwargs,
         )
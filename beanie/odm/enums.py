@@ -19,3 +19,13 @@ class InspectionStatuses(str, Enum):
 
     FAIL = "FAIL"
     OK = "OK"
+
+
+class StateSnapshot(str, Enum):
+    """
+    Representations of the saved state of the document
+    """
+
+    DICT = "DICT"
+    BSON = "BSON"
+    HASH = "HASH"
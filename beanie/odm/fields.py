@@ -9,6 +9,7 @@ from typing import (
     Dict,
     Generic,
     List,
+    Mapping,
     Optional,
     Type,
     TypeVar,
@@ -29,6 +30,7 @@ from pydantic import BaseModel
 from pymongo import ASCENDING, IndexModel
 
 from beanie.odm.enums import SortDirection
+from beanie.odm.identity_map import IdentityMap
 from beanie.odm.operators.find.comparison import (
     GT,
     GTE,
@@ -46,6 +48,7 @@ from beanie.odm.utils.pydantic import (
     get_model_fields,
     parse_object_as,
 )
+from beanie.odm.utils.raw_bson import decode_dbref
 
 if IS_PYDANTIC_V2:
     from pydantic import (
@@ -289,9 +292,19 @@ class Link(Generic[T]):
         self.document_class = document_class
 
     async def fetch(self, fetch_links: bool = False) -> Union[T, "Link"]:
-        result = await self.document_class.get(  # type: ignore
-            self.ref.id, with_children=True, fetch_links=fetch_links
-        )
+        identity_map = IdentityMap.current()
+        if identity_map is not None:
+            result = (
+                await identity_map.fetch(
+                    self.document_class,  # type: ignore
+                    [self.ref.id],
+                    fetch_links=fetch_links,
+                )
+            )[0]
+        else:
+            result = await self.document_class.get(  # type: ignore
+                self.ref.id, with_children=True, fetch_links=fetch_links
+            )
         return result or self
 
     @classmethod
@@ -322,7 +335,15 @@ class Link(Generic[T]):
                         )
                 ids_to_fetch.append(link.ref.id)
 
-        if ids_to_fetch:
+        identity_map = IdentityMap.current()
+        if ids_to_fetch and identity_map is not None:
+            documents = await identity_map.fetch(
+                document_class, ids_to_fetch, fetch_links=fetch_links  # type: ignore
+            )
+            for doc_id, document in zip(ids_to_fetch, documents):
+                if document is not None:
+                    data[doc_id] = document
+        elif ids_to_fetch:
             fetched_models = await document_class.find(  # type: ignore
                 In("_id", ids_to_fetch),
                 with_children=True,
@@ -348,10 +369,33 @@ class Link(Generic[T]):
 
     @classmethod
     async def fetch_many(cls, links: List["Link"]):
-        coros = []
+        identity_map = IdentityMap.current()
+        if identity_map is None:
+            coros = []
+            for link in links:
+                coros.append(link.fetch())
+            return await asyncio.gather(*coros)
+
+        # One fetch per document class
+        ids_by_class: Dict[Any, List[Any]] = {}
         for link in links:
-            coros.append(link.fetch())
-        return await asyncio.gather(*coros)
+            ids_by_class.setdefault(link.document_class, []).append(
+                link.ref.id
+            )
+        classes = list(ids_by_class)
+        results = await asyncio.gather(
+            *(
+                identity_map.fetch(
+                    document_class, ids_by_class[document_class]
+                )
+                for document_class in classes
+            )
+        )
+        documents = {
+            document_class: iter(documents)
+            for document_class, documents in zip(classes, results)
+        }
+        return [next(documents[link.document_class]) or link for link in links]
 
     if IS_PYDANTIC_V2:
 
@@ -366,6 +410,7 @@ class Link(Generic[T]):
             def validate(v: Union[DBRef, T], validation_info: ValidationInfo):
                 document_class = DocsRegistry.evaluate_fr(get_args(source_type)[0])  # type: ignore  # noqa: F821
 
+                v = decode_dbref(v)
                 if isinstance(v, DBRef):
                     return cls(ref=v, document_class=document_class)
                 if isinstance(v, Link):
@@ -380,7 +425,7 @@ class Link(Generic[T]):
                         ),
                         document_class=document_class,
                     )
-                if isinstance(v, dict) or isinstance(v, BaseModel):
+                if isinstance(v, (Mapping, BaseModel)):
                     return parse_obj(document_class, v)
                 new_id = TypeAdapter(
                     document_class.model_fields["id"].annotation
@@ -427,11 +472,12 @@ class Link(Generic[T]):
         @classmethod
         def validate(cls, v: Union[DBRef, T], field: ModelField):
             document_class = field.sub_fields[0].type_  # type: ignore
+            v = decode_dbref(v)
             if isinstance(v, DBRef):
                 return cls(ref=v, document_class=document_class)
             if isinstance(v, Link):
                 return v
-            if isinstance(v, dict) or isinstance(v, BaseModel):
+            if isinstance(v, (Mapping, BaseModel)):
                 return parse_obj(document_class, v)
             new_id = parse_object_as(
                 get_field_type(get_model_fields(document_class)["id"]), v
@@ -464,7 +510,7 @@ class BackLink(Generic[T]):
         def build_validation(cls, handler, source_type):
             def validate(v: Union[DBRef, T], field):
                 document_class = DocsRegistry.evaluate_fr(get_args(source_type)[0])  # type: ignore  # noqa: F821
-                if isinstance(v, dict) or isinstance(v, BaseModel):
+                if isinstance(v, (Mapping, BaseModel)):
                     return parse_obj(document_class, v)
                 return cls(document_class=document_class)
 
@@ -487,7 +533,7 @@ class BackLink(Generic[T]):
         @classmethod
         def validate(cls, v: Union[DBRef, T], field: ModelField):
             document_class = field.sub_fields[0].type_  # type: ignore
-            if isinstance(v, dict) or isinstance(v, BaseModel):
+            if isinstance(v, (Mapping, BaseModel)):
                 return parse_obj(document_class, v)
             return cls(document_class=document_class)
 
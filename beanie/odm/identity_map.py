@@ -0,0 +1,166 @@
+import asyncio
+from contextvars import ContextVar, Token
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, cast
+
+from beanie.odm.cache import LRUCache
+from beanie.odm.operators.find.comparison import In
+
+if TYPE_CHECKING:
+    from beanie.odm.documents import Document
+
+_current_identity_map: ContextVar[Optional["IdentityMap"]] = ContextVar(
+    "beanie_identity_map", default=None
+)
+
+
+class IdentityMap:
+    """
+    Unit of work for the link fetching.
+
+    Inside the `with` block every document referenced by the links
+    is fetched and parsed once. All the links to it get
+    the same instance, so its changes are visible through all of them.
+    Documents, which were not found, are not fetched again either.
+
+    Example:
+
+    ```python
+    with IdentityMap():
+        orders = await Order.find_all().to_list()
+        await asyncio.gather(*(order.fetch_all_links() for order in orders))
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.documents: Dict[str, asyncio.Future] = {}
+        self._tokens: List[Token] = []
+
+    def __enter__(self) -> "IdentityMap":
+        self._tokens.append(_current_identity_map.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        _current_identity_map.reset(self._tokens.pop())
+
+    async def __aenter__(self) -> "IdentityMap":
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.__exit__(exc_type, exc, tb)
+
+    @staticmethod
+    def current() -> Optional["IdentityMap"]:
+        """
+        Get the identity map of the current context
+
+        :return: Optional[IdentityMap] - the innermost active identity map
+        """
+        return _current_identity_map.get()
+
+    def clear(self) -> None:
+        """
+        Forget all the fetched documents
+
+        :return: None
+        """
+        self.documents.clear()
+
+    @staticmethod
+    def _create_key(
+        document_class: Type["Document"], document_id: Any, fetch_links: bool
+    ) -> str:
+        # Children share the collection of the parent class
+        return LRUCache.create_key(
+            document_class.get_collection_name(), document_id, fetch_links
+        )
+
+    async def fetch(
+        self,
+        document_class: Type["Document"],
+        ids: List[Any],
+        fetch_links: bool = False,
+    ) -> List[Optional["Document"]]:
+        """
+        Get the documents by id. Only the documents,
+        which were not requested before, are fetched.
+        They are fetched with one query
+
+        :param document_class: Type[Document] - class of the documents
+        :param ids: List[Any] - ids of the documents
+        :param fetch_links: bool - fetch the links of the documents
+        :return: List[Optional[Document]] - documents in the order of ids,
+        None for the documents, which were not found
+        """
+        loop = asyncio.get_running_loop()
+        keys = [
+            self._create_key(document_class, document_id, fetch_links)
+            for document_id in ids
+        ]
+        while True:
+            to_fetch: Dict[str, Tuple[Any, asyncio.Future]] = {}
+            futures: Dict[str, asyncio.Future] = {}
+            for key, document_id in zip(keys, ids):
+                if key in futures:
+                    continue
+                future = self.documents.get(key)
+                if future is None or future.get_loop() is not loop:
+                    future = loop.create_future()
+                    self.documents[key] = future
+                    to_fetch[key] = (document_id, future)
+                futures[key] = future
+            if to_fetch:
+                await self._load(document_class, to_fetch, fetch_links)
+            results: Dict[str, Optional["Document"]] = {}
+            for key, future in futures.items():
+                try:
+                    # Shielded, as the other fetches share the future
+                    results[key] = await asyncio.shield(future)
+                except asyncio.CancelledError:
+                    # The fetch of another task was cancelled, not this one
+                    if not future.cancelled():
+                        raise
+                    break
+            else:
+                return [results[key] for key in keys]
+
+    async def _load(
+        self,
+        document_class: Type["Document"],
+        to_fetch: Dict[str, Tuple[Any, asyncio.Future]],
+        fetch_links: bool,
+    ) -> None:
+        ids = [document_id for document_id, _ in to_fetch.values()]
+        try:
+            if len(ids) == 1:
+                document = await document_class.get(
+                    ids[0], with_children=True, fetch_links=fetch_links
+                )
+                documents = [document] if document is not None else []
+            else:
+                documents = await document_class.find(
+                    In("_id", ids),
+                    with_children=True,
+                    fetch_links=fetch_links,
+                ).to_list()
+        except BaseException as e:
+            # Failed fetches are not remembered, the next ones retry
+            for key, (_, future) in to_fetch.items():
+                if self.documents.get(key) is future:
+                    del self.documents[key]
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+                    # Mark the exception as retrieved,
+                    # there could be no other fetches waiting for it
+                    future.exception()
+            raise
+
+        found = {
+            self._create_key(
+                document_class, document.id, fetch_links
+            ): document
+            for document in cast(List["Document"], documents)
+        }
+        for key, (_, future) in to_fetch.items():
+            future.set_result(found.get(key))
@@ -25,6 +25,7 @@ class AggregateInterface:
         projection_model: None = None,
         session: Optional[ClientSession] = None,
         ignore_cache: bool = False,
+        raw_bson: bool = False,
         **pymongo_kwargs,
     ) -> AggregationQuery[Dict[str, Any]]:
         ...
@@ -37,6 +38,7 @@ class AggregateInterface:
         projection_model: Type[DocumentProjectionType],
         session: Optional[ClientSession] = None,
         ignore_cache: bool = False,
+        raw_bson: bool = False,
         **pymongo_kwargs,
     ) -> AggregationQuery[DocumentProjectionType]:
         ...
@@ -48,6 +50,7 @@ class AggregateInterface:
         projection_model: Optional[Type[DocumentProjectionType]] = None,
         session: Optional[ClientSession] = None,
         ignore_cache: bool = False,
+        raw_bson: bool = False,
         **pymongo_kwargs,
     ) -> Union[
         AggregationQuery[Dict[str, Any]],
@@ -60,6 +63,7 @@ class AggregateInterface:
         :param projection_model: Type[BaseModel]
         :param session: Optional[ClientSession]
         :param ignore_cache: bool
+        :param raw_bson: bool - decode the raw BSON results on the field access
         :param **pymongo_kwargs: pymongo native parameters for aggregate operation
         :return: [AggregationQuery](query.md#aggregationquery)
         """
@@ -68,5 +72,6 @@ class AggregateInterface:
             projection_model=projection_model,
             session=session,
             ignore_cache=ignore_cache,
+            raw_bson=raw_bson,
             **pymongo_kwargs,
         )
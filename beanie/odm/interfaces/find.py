@@ -24,6 +24,7 @@ from beanie.odm.enums import SortDirection
 from beanie.odm.interfaces.detector import ModelType
 from beanie.odm.queries.find import FindMany, FindOne
 from beanie.odm.settings.base import ItemSettings
+from beanie.odm.utils.batched_links import FetchLinksType
 
 if TYPE_CHECKING:
     from beanie.odm.documents import Document
@@ -65,6 +66,7 @@ class FindInterface:
         with_children: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
+        raw_bson: bool = False,
         **pymongo_kwargs,
     ) -> FindOne[FindType]:
         ...
@@ -81,6 +83,7 @@ class FindInterface:
         with_children: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
+        raw_bson: bool = False,
         **pymongo_kwargs,
     ) -> FindOne["DocumentProjectionType"]:
         ...
@@ -96,6 +99,7 @@ class FindInterface:
         with_children: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
+        raw_bson: bool = False,
         **pymongo_kwargs,
     ) -> Union[FindOne[FindType], FindOne["DocumentProjectionType"]]:
         """
@@ -107,6 +111,7 @@ class FindInterface:
         :param projection_model: Optional[Type[BaseModel]] - projection model
         :param session: Optional[ClientSession] - pymongo session instance
         :param ignore_cache: bool
+        :param raw_bson: bool - read the raw BSON document and decode its fields on the first access
         :param **pymongo_kwargs: pymongo native parameters for find operation (if Document class contains links, this parameter must fit the respective parameter of the aggregate MongoDB function)
         :return: [FindOne](query.md#findone) - find query instance
         """
@@ -119,6 +124,7 @@ class FindInterface:
             fetch_links=fetch_links,
             nesting_depth=nesting_depth,
             nesting_depths_per_field=nesting_depths_per_field,
+            raw_bson=raw_bson,
             **pymongo_kwargs,
         )
 
@@ -133,9 +139,10 @@ class FindInterface:
         sort: Union[None, str, List[Tuple[str, SortDirection]]] = None,
         session: Optional[ClientSession] = None,
         ignore_cache: bool = False,
-        fetch_links: bool = False,
+        fetch_links: FetchLinksType = False,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
         **pymongo_kwargs,
@@ -153,9 +160,10 @@ class FindInterface:
         sort: Union[None, str, List[Tuple[str, SortDirection]]] = None,
         session: Optional[ClientSession] = None,
         ignore_cache: bool = False,
-        fetch_links: bool = False,
+        fetch_links: FetchLinksType = False,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
         **pymongo_kwargs,
@@ -172,9 +180,10 @@ class FindInterface:
         sort: Union[None, str, List[Tuple[str, SortDirection]]] = None,
         session: Optional[ClientSession] = None,
         ignore_cache: bool = False,
-        fetch_links: bool = False,
+        fetch_links: FetchLinksType = False,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
         **pymongo_kwargs,
@@ -190,7 +199,9 @@ class FindInterface:
         :param projection_model: Optional[Type[BaseModel]] - projection model
         :param session: Optional[ClientSession] - pymongo session
         :param ignore_cache: bool
+        :param fetch_links: Union[bool, str] - fetch the linked documents, "batched" fetches them with one `$in` query per linked collection and nesting level
         :param lazy_parse: bool
+        :param raw_bson: bool - read the raw BSON documents and decode their fields on the first access
         :param **pymongo_kwargs: pymongo native parameters for find operation (if Document class contains links, this parameter must fit the respective parameter of the aggregate MongoDB function)
         :return: [FindMany](query.md#findmany) - query instance
         """
@@ -205,6 +216,7 @@ class FindInterface:
             ignore_cache=ignore_cache,
             fetch_links=fetch_links,
             lazy_parse=lazy_parse,
+            raw_bson=raw_bson,
             nesting_depth=nesting_depth,
             nesting_depths_per_field=nesting_depths_per_field,
             **pymongo_kwargs,
@@ -221,9 +233,10 @@ class FindInterface:
         sort: Union[None, str, List[Tuple[str, SortDirection]]] = None,
         session: Optional[ClientSession] = None,
         ignore_cache: bool = False,
-        fetch_links: bool = False,
+        fetch_links: FetchLinksType = False,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
         **pymongo_kwargs,
@@ -241,9 +254,10 @@ class FindInterface:
         sort: Union[None, str, List[Tuple[str, SortDirection]]] = None,
         session: Optional[ClientSession] = None,
         ignore_cache: bool = False,
-        fetch_links: bool = False,
+        fetch_links: FetchLinksType = False,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
         **pymongo_kwargs,
@@ -260,9 +274,10 @@ class FindInterface:
         sort: Union[None, str, List[Tuple[str, SortDirection]]] = None,
         session: Optional[ClientSession] = None,
         ignore_cache: bool = False,
-        fetch_links: bool = False,
+        fetch_links: FetchLinksType = False,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
         **pymongo_kwargs,
@@ -281,6 +296,7 @@ class FindInterface:
             fetch_links=fetch_links,
             with_children=with_children,
             lazy_parse=lazy_parse,
+            raw_bson=raw_bson,
             nesting_depth=nesting_depth,
             nesting_depths_per_field=nesting_depths_per_field,
             **pymongo_kwargs,
@@ -298,6 +314,7 @@ class FindInterface:
         ignore_cache: bool = False,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
         **pymongo_kwargs,
@@ -316,6 +333,7 @@ class FindInterface:
         ignore_cache: bool = False,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
         **pymongo_kwargs,
@@ -333,6 +351,7 @@ class FindInterface:
         ignore_cache: bool = False,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
         **pymongo_kwargs,
@@ -358,6 +377,7 @@ class FindInterface:
             ignore_cache=ignore_cache,
             with_children=with_children,
             lazy_parse=lazy_parse,
+            raw_bson=raw_bson,
             nesting_depth=nesting_depth,
             nesting_depths_per_field=nesting_depths_per_field,
             **pymongo_kwargs,
@@ -375,6 +395,7 @@ class FindInterface:
         ignore_cache: bool = False,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
         **pymongo_kwargs,
@@ -393,6 +414,7 @@ class FindInterface:
         ignore_cache: bool = False,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
         **pymongo_kwargs,
@@ -410,6 +432,7 @@ class FindInterface:
         ignore_cache: bool = False,
         with_children: bool = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
         **pymongo_kwargs,
@@ -426,6 +449,7 @@ class FindInterface:
             ignore_cache=ignore_cache,
             with_children=with_children,
             lazy_parse=lazy_parse,
+            raw_bson=raw_bson,
             nesting_depth=nesting_depth,
             nesting_depths_per_field=nesting_depths_per_field,
             **pymongo_kwargs,
@@ -17,6 +17,7 @@ from beanie.odm.interfaces.clone import CloneInterface
 from beanie.odm.interfaces.session import SessionMethods
 from beanie.odm.queries.cursor import BaseCursorQuery
 from beanie.odm.utils.projection import get_projection
+from beanie.odm.utils.raw_bson import get_raw_collection
 
 if TYPE_CHECKING:
     from beanie.odm.documents import DocType
@@ -41,6 +42,7 @@ class AggregationQuery(
         find_query: Mapping[str, Any],
         projection_model: Optional[Type[BaseModel]] = None,
         ignore_cache: bool = False,
+        raw_bson: bool = False,
         **pymongo_kwargs,
     ):
         self.aggregation_pipeline: List[
@@ -51,6 +53,7 @@ class AggregationQuery(
         self.find_query = find_query
         self.session = None
         self.ignore_cache = ignore_cache
+        self.raw_bson = raw_bson
         self.pymongo_kwargs = pymongo_kwargs
 
     @property
@@ -63,25 +66,10 @@ class AggregationQuery(
                 "projection": get_projection(self.projection_model)
                 if self.projection_model
                 else None,
+                "raw_bson": self.raw_bson,
             }
         )
 
-    def _get_cache(self):
-        if (
-            self.document_model.get_settings().use_cache
-            and self.ignore_cache is False
-        ):
-            return self.document_model._cache.get(self._cache_key)  # type: ignore
-        else:
-            return None
-
-    def _set_cache(self, data):
-        if (
-            self.document_model.get_settings().use_cache
-            and self.ignore_cache is False
-        ):
-            return self.document_model._cache.set(self._cache_key, data)  # type: ignore
-
     def get_aggregation_pipeline(
         self,
     ) -> List[Mapping[str, Any]]:
@@ -98,7 +86,10 @@ class AggregationQuery(
     @property
     def motor_cursor(self) -> AgnosticCommandCursor:
         aggregation_pipeline = self.get_aggregation_pipeline()
-        return self.document_model.get_motor_collection().aggregate(
+        collection = self.document_model.get_motor_collection()
+        if self.raw_bson:
+            collection = get_raw_collection(collection)
+        return collection.aggregate(
             aggregation_pipeline, session=self.session, **self.pymongo_kwargs
         )
 
@@ -1,6 +1,11 @@
+import asyncio
 from abc import abstractmethod
+from collections import deque
 from typing import (
+    TYPE_CHECKING,
     Any,
+    AsyncIterator,
+    Deque,
     Dict,
     Generic,
     List,
@@ -11,11 +16,27 @@ from typing import (
 )
 
 from pydantic.main import BaseModel
+from pymongo.client_session import ClientSession
 
+from beanie.odm.cache import (
+    DocumentCache,
+    LRUCache,
+    copy_value,
+    get_cached,
+    get_size,
+    set_cached,
+)
 from beanie.odm.utils.parsing import parse_obj
 
+if TYPE_CHECKING:
+    from beanie.odm.documents import Document
+
 CursorResultType = TypeVar("CursorResultType")
 
+# Number of the documents read at once by the iteration,
+# when their links are fetched after the query
+ITER_BATCH_SIZE = 100
+
 
 class BaseCursorQuery(Generic[CursorResultType]):
     """
@@ -24,7 +45,14 @@ class BaseCursorQuery(Generic[CursorResultType]):
     """
 
     cursor = None
+    _iter_buffer: Deque[Dict[str, Any]]
     lazy_parse = False
+    raw_bson = False
+    ignore_cache = False
+    parse_offload: Optional[bool] = None
+    document_model: Type["Document"]
+    session: Optional[ClientSession]
+    pymongo_kwargs: Dict[str, Any]
 
     @abstractmethod
     def get_projection_model(self) -> Optional[Type[BaseModel]]:
@@ -41,49 +69,238 @@ class BaseCursorQuery(Generic[CursorResultType]):
     def __aiter__(self):
         if self.cursor is None:
             self.cursor = self.motor_cursor
+            self._iter_buffer = deque()
         return self
 
     async def __anext__(self) -> CursorResultType:
         if self.cursor is None:
             raise RuntimeError("cursor was not set")
-        next_item = await self.cursor.__anext__()
+        if self._fetches_linked():
+            # The links of a batch of documents are fetched together
+            if not self._iter_buffer:
+                motor_list = await self.cursor.to_list(ITER_BATCH_SIZE)
+                if not motor_list:
+                    raise StopAsyncIteration
+                self._iter_buffer.extend(await self._fetch_linked(motor_list))
+            next_item = self._iter_buffer.popleft()
+        else:
+            next_item = await self.cursor.__anext__()
         projection = self.get_projection_model()
         if projection is None:
             return next_item
-        return parse_obj(projection, next_item, lazy_parse=self.lazy_parse)  # type: ignore
+        return parse_obj(projection, next_item, lazy_parse=self._lazy_parse)  # type: ignore
 
+    @property
     @abstractmethod
-    def _get_cache(self) -> List[Dict[str, Any]]:
+    def _cache_key(self) -> str:
         ...
 
-    @abstractmethod
-    def _set_cache(self, data):
-        ...
+    @property
+    def _lazy_parse(self) -> bool:
+        # Raw documents are decoded on the field access,
+        # so they are always parsed lazily
+        return self.lazy_parse or self.raw_bson
 
-    async def to_list(
-        self, length: Optional[int] = None
-    ) -> List[CursorResultType]:  # noqa
+    def _get_cache_storage(self) -> Optional[DocumentCache]:
+        if (
+            self.document_model.get_settings().use_cache
+            and self.ignore_cache is False
+        ):
+            return self.document_model._cache
+        return None
+
+    def _fetches_linked(self) -> bool:
         """
-        Get list of documents
+        If the linked documents are fetched after the query
 
-        :param length: Optional[int] - length of the list
-        :return: Union[List[BaseModel], List[Dict[str, Any]]]
+        :return: bool
         """
+        return False
+
+    async def _fetch_linked(
+        self, motor_list: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch the linked documents of the raw results,
+        which were not fetched by the query itself
+
+        :param motor_list: List[Dict[str, Any]] - raw results
+        :return: List[Dict[str, Any]]
+        """
+        return motor_list
+
+    async def _load_list(self, length: Optional[int]) -> List[Dict[str, Any]]:
+        # The cursor is created here, so the coalesced
+        # and the cached queries don't send it
         cursor = self.motor_cursor
         if cursor is None:
             raise RuntimeError("self.motor_cursor was not set")
-        motor_list: List[Dict[str, Any]] = self._get_cache()
+        return await self._fetch_linked(await cursor.to_list(length))
 
-        if motor_list is None:
-            motor_list = await cursor.to_list(length)
-            self._set_cache(motor_list)
-        projection = self.get_projection_model()
+    async def _fetch_list(
+        self,
+        length: Optional[int],
+        projection: Optional[Type[BaseModel]],
+    ) -> List[Dict[str, Any]]:
+        single_flight = self.document_model._single_flight
+        if single_flight is None:
+            return await self._load_list(length)
+        key = LRUCache.create_key(
+            self._cache_key, length, self.session, self.pymongo_kwargs
+        )
+        motor_list, shared = await single_flight.do(
+            key, lambda: self._load_list(length)
+        )
+        # Raw documents are returned as is, so they must not be shared
+        if shared and projection is None:
+            return copy_value(motor_list)
+        return motor_list
+
+    def _parse_list(
+        self,
+        motor_list: List[Dict[str, Any]],
+        projection: Optional[Type[BaseModel]],
+    ) -> List[CursorResultType]:
         if projection is not None:
             return cast(
                 List[CursorResultType],
                 [
-                    parse_obj(projection, i, lazy_parse=self.lazy_parse)
+                    parse_obj(projection, i, lazy_parse=self._lazy_parse)
                     for i in motor_list
                 ],
             )
         return cast(List[CursorResultType], motor_list)
+
+    def offload_parsing(self, offload: bool = True):
+        """
+        Parse the results in the executor threads, not in the event loop.
+        Overrides the `parse_offload_threshold` setting of the model
+
+        :param offload: bool - offload the parsing
+        :return: self
+        """
+        self.parse_offload = offload
+        return self
+
+    def _should_offload(self, count: int) -> bool:
+        if self._lazy_parse:
+            return False
+        if self.parse_offload is not None:
+            return self.parse_offload
+        threshold = self.document_model.get_settings().parse_offload_threshold
+        return threshold is not None and count >= threshold
+
+    async def _parse_list_async(
+        self,
+        motor_list: List[Dict[str, Any]],
+        projection: Optional[Type[BaseModel]],
+    ) -> List[CursorResultType]:
+        if projection is None or not self._should_offload(len(motor_list)):
+            return self._parse_list(motor_list, projection)
+        settings = self.document_model.get_settings()
+        loop = asyncio.get_running_loop()
+        size = settings.parse_offload_batch_size
+        result: List[CursorResultType] = []
+        # Every batch is awaited separately,
+        # so other tasks can run between the batches
+        for start in range(0, len(motor_list), size):
+            result += await loop.run_in_executor(
+                settings.parse_offload_executor,
+                self._parse_list,
+                motor_list[start : start + size],
+                projection,
+            )
+        return result
+
+    async def iter_batches(
+        self, size: int = 100, batch_size: Optional[int] = None
+    ) -> AsyncIterator[List[CursorResultType]]:
+        """
+        Iterate over the results in lists of parsed documents.
+        Every list is parsed as soon as the driver delivers it,
+        so only one batch of the raw documents is kept in memory.
+        The cache is not used
+
+        :param size: int - number of documents in the yielded lists
+        :param batch_size: Optional[int] - number of documents
+        in the driver batches. Equal to `size` by default
+        :return: AsyncIterator[List[CursorResultType]]
+        """
+        if size < 1:
+            raise ValueError("size must be positive")
+        cursor = self.motor_cursor
+        if cursor is None:
+            raise RuntimeError("self.motor_cursor was not set")
+        cursor.batch_size(batch_size or size)
+        projection = self.get_projection_model()
+        while True:
+            motor_list = await cursor.to_list(size)
+            if not motor_list:
+                break
+            yield await self._parse_list_async(
+                await self._fetch_linked(motor_list), projection
+            )
+            if len(motor_list) < size:
+                break
+
+    async def stream(
+        self, size: int = 100, batch_size: Optional[int] = None
+    ) -> AsyncIterator[CursorResultType]:
+        """
+        Iterate over the parsed documents,
+        which are fetched and parsed in batches
+
+        :param size: int - number of documents parsed at once
+        :param batch_size: Optional[int] - number of documents
+        in the driver batches. Equal to `size` by default
+        :return: AsyncIterator[CursorResultType]
+        """
+        async for batch in self.iter_batches(size, batch_size):
+            for item in batch:
+                yield item
+
+    async def to_list(
+        self, length: Optional[int] = None
+    ) -> List[CursorResultType]:  # noqa
+        """
+        Get list of documents
+
+        :param length: Optional[int] - length of the list
+        :return: Union[List[BaseModel], List[Dict[str, Any]]]
+        """
+        projection = self.get_projection_model()
+        cache = self._get_cache_storage()
+        if cache is None:
+            return await self._parse_list_async(
+                await self._fetch_list(length, projection), projection
+            )
+
+        # Parsed models are cached only for the regular parsing.
+        # The projection model is a part of the key,
+        # as different models could share the same projection
+        parse_cached = (
+            isinstance(cache, LRUCache)
+            and projection is not None
+            and not self._lazy_parse
+            and self.document_model.get_settings().cache_parsed_results
+        )
+        cache_key = LRUCache.create_key(
+            self._cache_key, length, projection if parse_cached else None
+        )
+        cached = await get_cached(cache, cache_key)
+        if cached is not None:
+            if parse_cached:
+                return copy_value(cached)
+            return await self._parse_list_async(cached, projection)
+
+        motor_list: List[Dict[str, Any]] = await self._fetch_list(
+            length, projection
+        )
+        if not parse_cached:
+            await set_cached(cache, cache_key, motor_list)
+            return await self._parse_list_async(motor_list, projection)
+        cache = cast(LRUCache, cache)
+        size = get_size(motor_list) if cache.max_size is not None else None
+        result = await self._parse_list_async(motor_list, projection)
+        cache.set(cache_key, copy_value(result), size=size)
+        return result
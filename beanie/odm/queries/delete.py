@@ -6,6 +6,7 @@ from pymongo.client_session import ClientSession
 from pymongo.results import DeleteResult
 
 from beanie.odm.bulk import BulkWriter, Operation
+from beanie.odm.cache import get_document_ids
 from beanie.odm.interfaces.clone import CloneInterface
 from beanie.odm.interfaces.session import SessionMethods
 
@@ -31,6 +32,11 @@ class DeleteQuery(SessionMethods, CloneInterface):
         self.bulk_writer = bulk_writer
         self.pymongo_kwargs: Dict[str, Any] = pymongo_kwargs
 
+    async def _invalidate_cache(self):
+        await self.document_model._invalidate_cache_on_write(
+            get_document_ids(self.find_query)
+        )
+
 
 class DeleteMany(DeleteQuery):
     def __await__(
@@ -41,7 +47,7 @@ class DeleteMany(DeleteQuery):
         :return:
         """
         if self.bulk_writer is None:
-            return (
+            result = (
                 yield from self.document_model.get_motor_collection()
                 .delete_many(
                     self.find_query,
@@ -50,15 +56,17 @@ class DeleteMany(DeleteQuery):
                 )
                 .__await__()
             )
+            yield from self._invalidate_cache().__await__()
+            return result
         else:
-            self.bulk_writer.add_operation(
+            yield from self.bulk_writer.add(
                 Operation(
                     operation=DeleteManyPyMongo,
                     first_query=self.find_query,
                     object_class=self.document_model,
                     pymongo_kwargs=self.pymongo_kwargs,
                 )
-            )
+            ).__await__()
             return None
 
 
@@ -71,7 +79,7 @@ class DeleteOne(DeleteQuery):
         :return:
         """
         if self.bulk_writer is None:
-            return (
+            result = (
                 yield from self.document_model.get_motor_collection()
                 .delete_one(
                     self.find_query,
@@ -80,13 +88,15 @@ class DeleteOne(DeleteQuery):
                 )
                 .__await__()
             )
+            yield from self._invalidate_cache().__await__()
+            return result
         else:
-            self.bulk_writer.add_operation(
+            yield from self.bulk_writer.add(
                 Operation(
                     operation=DeleteOnePyMongo,
                     first_query=self.find_query,
                     object_class=self.document_model,
                     pymongo_kwargs=self.pymongo_kwargs,
                 )
-            )
+            ).__await__()
             return None
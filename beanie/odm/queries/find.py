@@ -22,9 +22,18 @@ from pymongo import ReplaceOne
 from pymongo.client_session import ClientSession
 from pymongo.results import UpdateResult
 
-from beanie.exceptions import DocumentNotFound
+from beanie.exceptions import DocumentNotFound, NotSupported
 from beanie.odm.bulk import BulkWriter, Operation
-from beanie.odm.cache import LRUCache
+from beanie.odm.cache import (
+    QUERY_TAG,
+    DocumentCache,
+    LRUCache,
+    copy_value,
+    get_cached,
+    get_document_ids,
+    get_id_tag,
+    get_size,
+)
 from beanie.odm.enums import SortDirection
 from beanie.odm.interfaces.aggregation_methods import AggregateMethods
 from beanie.odm.interfaces.clone import CloneInterface
@@ -43,11 +52,27 @@ from beanie.odm.queries.update import (
     UpdateQuery,
     UpdateResponse,
 )
+from beanie.odm.utils.batch_loader import split_id_query
+from beanie.odm.utils.batched_links import (
+    BATCHED,
+    FetchLinksType,
+    fetch_links_batched,
+)
 from beanie.odm.utils.dump import get_dict
 from beanie.odm.utils.encoder import Encoder
-from beanie.odm.utils.find import construct_lookup_queries, split_text_query
+from beanie.odm.utils.find import (
+    get_fetched_link_fields,
+    get_link_field_names,
+    get_linked_document_paths,
+    get_lookup_queries,
+    lookups_keep_count,
+    merge_queries,
+    split_lookup_query,
+    split_text_query,
+)
 from beanie.odm.utils.parsing import parse_obj
 from beanie.odm.utils.projection import get_projection
+from beanie.odm.utils.raw_bson import get_raw_collection
 from beanie.odm.utils.relations import convert_ids
 
 if TYPE_CHECKING:
@@ -83,6 +108,7 @@ class FindQuery(
         self.fetch_links: bool = False
         self.pymongo_kwargs: Dict[str, Any] = {}
         self.lazy_parse = False
+        self.raw_bson = False
         self.nesting_depth: Optional[int] = None
         self.nesting_depths_per_field: Optional[Dict[str, int]] = None
 
@@ -179,6 +205,7 @@ class FindMany(
         self.sort_expressions: List[Tuple[str, SortDirection]] = []
         self.skip_number: int = 0
         self.limit_number: int = 0
+        self.batch_links: bool = False
 
     @overload
     def find_many(
@@ -190,8 +217,9 @@ class FindMany(
         sort: Union[None, str, List[Tuple[str, SortDirection]]] = None,
         session: Optional[ClientSession] = None,
         ignore_cache: bool = False,
-        fetch_links: bool = False,
+        fetch_links: FetchLinksType = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
         **pymongo_kwargs,
@@ -208,8 +236,9 @@ class FindMany(
         sort: Union[None, str, List[Tuple[str, SortDirection]]] = None,
         session: Optional[ClientSession] = None,
         ignore_cache: bool = False,
-        fetch_links: bool = False,
+        fetch_links: FetchLinksType = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
         **pymongo_kwargs,
@@ -225,8 +254,9 @@ class FindMany(
         sort: Union[None, str, List[Tuple[str, SortDirection]]] = None,
         session: Optional[ClientSession] = None,
         ignore_cache: bool = False,
-        fetch_links: bool = False,
+        fetch_links: FetchLinksType = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
         **pymongo_kwargs,
@@ -245,6 +275,11 @@ class FindMany(
         :param projection_model: Optional[Type[BaseModel]] - projection model
         :param session: Optional[ClientSession] - pymongo session
         :param ignore_cache: bool
+        :param fetch_links: Union[bool, str] - fetch the linked documents
+        with the `$lookup` stages, or with one `$in` query per linked
+        collection and nesting level, if it is "batched"
+        :param raw_bson: bool - read the raw BSON documents and decode
+        their fields on the first access
         :param **pymongo_kwargs: pymongo native parameters for find operation (if Document class contains links, this parameter must fit the respective parameter of the aggregate MongoDB function)
         :return: FindMany - query instance
         """
@@ -255,12 +290,20 @@ class FindMany(
         self.project(projection_model)
         self.set_session(session=session)
         self.ignore_cache = ignore_cache
-        self.fetch_links = fetch_links
+        if isinstance(fetch_links, str) and fetch_links != BATCHED:
+            raise ValueError(
+                f"fetch_links must be a bool or {BATCHED!r}, "
+                f"not {fetch_links!r}"
+            )
+        self.batch_links = fetch_links == BATCHED
+        self.fetch_links = bool(fetch_links) and not self.batch_links
         self.pymongo_kwargs.update(pymongo_kwargs)
         self.nesting_depth = nesting_depth
         self.nesting_depths_per_field = nesting_depths_per_field
         if lazy_parse is True:
             self.lazy_parse = lazy_parse
+        if raw_bson is True:
+            self.raw_bson = raw_bson
         return self
 
     # TODO probably merge FindOne and FindMany to one class to avoid this
@@ -305,8 +348,9 @@ class FindMany(
         sort: Union[None, str, List[Tuple[str, SortDirection]]] = None,
         session: Optional[ClientSession] = None,
         ignore_cache: bool = False,
-        fetch_links: bool = False,
+        fetch_links: FetchLinksType = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
         **pymongo_kwargs,
@@ -323,8 +367,9 @@ class FindMany(
         sort: Union[None, str, List[Tuple[str, SortDirection]]] = None,
         session: Optional[ClientSession] = None,
         ignore_cache: bool = False,
-        fetch_links: bool = False,
+        fetch_links: FetchLinksType = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
         **pymongo_kwargs,
@@ -340,8 +385,9 @@ class FindMany(
         sort: Union[None, str, List[Tuple[str, SortDirection]]] = None,
         session: Optional[ClientSession] = None,
         ignore_cache: bool = False,
-        fetch_links: bool = False,
+        fetch_links: FetchLinksType = False,
         lazy_parse: bool = False,
+        raw_bson: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
         **pymongo_kwargs,
@@ -361,6 +407,7 @@ class FindMany(
             ignore_cache=ignore_cache,
             fetch_links=fetch_links,
             lazy_parse=lazy_parse,
+            raw_bson=raw_bson,
             nesting_depth=nesting_depth,
             nesting_depths_per_field=nesting_depths_per_field,
             **pymongo_kwargs,
@@ -537,6 +584,7 @@ class FindMany(
         projection_model: None = None,
         session: Optional[ClientSession] = None,
         ignore_cache: bool = False,
+        raw_bson: bool = False,
         **pymongo_kwargs,
     ) -> AggregationQuery[Dict[str, Any]]:
         ...
@@ -548,6 +596,7 @@ class FindMany(
         projection_model: Type[FindQueryProjectionType],
         session: Optional[ClientSession] = None,
         ignore_cache: bool = False,
+        raw_bson: bool = False,
         **pymongo_kwargs,
     ) -> AggregationQuery[FindQueryProjectionType]:
         ...
@@ -558,6 +607,7 @@ class FindMany(
         projection_model: Optional[Type[FindQueryProjectionType]] = None,
         session: Optional[ClientSession] = None,
         ignore_cache: bool = False,
+        raw_bson: bool = False,
         **pymongo_kwargs,
     ) -> Union[
         AggregationQuery[Dict[str, Any]],
@@ -571,6 +621,7 @@ class FindMany(
         :param projection_model: Type[BaseModel] - Projection Model
         :param session: Optional[ClientSession] - PyMongo session
         :param ignore_cache: bool
+        :param raw_bson: bool - decode the raw BSON results on the field access
         :return:[AggregationQuery](query.md#aggregationquery)
         """
         self.set_session(session=session)
@@ -580,6 +631,7 @@ class FindMany(
             find_query={},
             projection_model=projection_model,
             ignore_cache=ignore_cache,
+            raw_bson=raw_bson,
             **pymongo_kwargs,
         ).set_session(session=self.session)
 
@@ -593,99 +645,133 @@ class FindMany(
                 "projection": get_projection(self.projection_model),
                 "skip": self.skip_number,
                 "limit": self.limit_number,
+                "fetch_links": self.fetch_links,
+                "batch_links": self.batch_links,
+                "nesting_depth": self.nesting_depth,
+                "nesting_depths_per_field": self.nesting_depths_per_field,
+                "raw_bson": self.raw_bson,
             }
         )
 
-    def _get_cache(self):
-        if (
-            self.document_model.get_settings().use_cache
-            and self.ignore_cache is False
-        ):
-            return self.document_model._cache.get(  # type: ignore
-                self._cache_key
-            )
-        else:
-            return None
-
-    def _set_cache(self, data):
-        if (
-            self.document_model.get_settings().use_cache
-            and self.ignore_cache is False
-        ):
-            return self.document_model._cache.set(  # type: ignore
-                self._cache_key, data
-            )
+    def build_aggregation_pipeline(
+        self,
+        *extra_stages,
+        projection: Optional[Mapping[str, Any]] = None,
+    ):
+        """
+        Build the aggregation pipeline of the query
 
-    def build_aggregation_pipeline(self, *extra_stages):
+        :param extra_stages: stages to run after the filtering
+        :param projection: Optional[Mapping[str, Any]] - projection of the
+        results. Only the links it uses are fetched. All the links
+        are fetched, if it is None or there are extra stages
+        :return: List[Dict[str, Any]]
+        """
+        text_queries, non_text_queries = split_text_query(
+            self.get_filter_query()
+        )
         if self.fetch_links:
-            aggregation_pipeline: List[
-                Dict[str, Any]
-            ] = construct_lookup_queries(
+            lookup_stages: List[Dict[str, Any]] = get_lookup_queries(
                 self.document_model,
                 nesting_depth=self.nesting_depth,
                 nesting_depths_per_field=self.nesting_depths_per_field,
+                fields=get_fetched_link_fields(
+                    self.document_model,
+                    None if extra_stages else projection,
+                    non_text_queries,
+                    [i[0] for i in self.sort_expressions],
+                ),
             )
         else:
-            aggregation_pipeline = []
-        filter_query = self.get_filter_query()
-
-        if filter_query:
-            text_queries, non_text_queries = split_text_query(filter_query)
-
-            if text_queries:
-                aggregation_pipeline.insert(
-                    0,
-                    {
-                        "$match": (
-                            {"$and": text_queries}
-                            if len(text_queries) > 1
-                            else text_queries[0]
-                        )
-                    },
-                )
-
-            if non_text_queries:
-                aggregation_pipeline.append(
-                    {
-                        "$match": (
-                            {"$and": non_text_queries}
-                            if len(non_text_queries) > 1
-                            else non_text_queries[0]
-                        )
-                    }
-                )
+            lookup_stages = []
+        local_queries: List[Dict[str, Any]] = []
+        link_field_names = get_link_field_names(self.document_model)
+        if lookup_stages:
+            # Queries on the local fields run before the lookups,
+            # so only the matched documents are joined
+            local_queries, non_text_queries = split_lookup_query(
+                non_text_queries, link_field_names
+            )
 
-        if extra_stages:
-            aggregation_pipeline.extend(extra_stages)
         sort_pipeline = {"$sort": {i[0]: i[1] for i in self.sort_expressions}}
+        pagination_pipeline: List[Dict[str, Any]] = []
         if sort_pipeline["$sort"]:
-            aggregation_pipeline.append(sort_pipeline)
+            pagination_pipeline.append(sort_pipeline)
         if self.skip_number != 0:
-            aggregation_pipeline.append({"$skip": self.skip_number})
+            pagination_pipeline.append({"$skip": self.skip_number})
         if self.limit_number != 0:
-            aggregation_pipeline.append({"$limit": self.limit_number})
+            pagination_pipeline.append({"$limit": self.limit_number})
+        # Pagination runs before the lookups, if it doesn't use
+        # the linked documents and the lookups keep the documents count
+        push_pagination = (
+            bool(lookup_stages)
+            and not non_text_queries
+            and not extra_stages
+            and not any(
+                i[0].split(".", 1)[0] in link_field_names
+                for i in self.sort_expressions
+            )
+            and lookups_keep_count(self.document_model)
+        )
+
+        aggregation_pipeline: List[Dict[str, Any]] = []
+        if text_queries:
+            aggregation_pipeline.append(
+                {"$match": merge_queries(text_queries)}
+            )
+        if local_queries:
+            aggregation_pipeline.append(
+                {"$match": merge_queries(local_queries)}
+            )
+        if push_pagination:
+            aggregation_pipeline.extend(pagination_pipeline)
+        aggregation_pipeline.extend(lookup_stages)
+        if non_text_queries:
+            aggregation_pipeline.append(
+                {"$match": merge_queries(non_text_queries)}
+            )
+        if extra_stages:
+            aggregation_pipeline.extend(extra_stages)
+        if not push_pagination:
+            aggregation_pipeline.extend(pagination_pipeline)
         return aggregation_pipeline
 
     @property
     def motor_cursor(self):
+        collection = self.document_model.get_motor_collection()
+        if self.raw_bson:
+            collection = get_raw_collection(collection)
         if self.fetch_links:
+            projection = get_projection(self.projection_model)
             aggregation_pipeline: List[
                 Dict[str, Any]
-            ] = self.build_aggregation_pipeline()
-
-            projection = get_projection(self.projection_model)
+            ] = self.build_aggregation_pipeline(projection=projection)
 
             if projection is not None:
                 aggregation_pipeline.append({"$project": projection})
 
-            return self.document_model.get_motor_collection().aggregate(
+            return collection.aggregate(
                 aggregation_pipeline,
                 session=self.session,
                 **self.pymongo_kwargs,
             )
 
-        return self.document_model.get_motor_collection().find(
-            filter=self.get_filter_query(),
+        filter_query = self.get_filter_query()
+        if self.batch_links:
+            # The linked documents are fetched after the query
+            linked_paths = get_linked_document_paths(
+                self.document_model,
+                [filter_query],
+                [i[0] for i in self.sort_expressions],
+            )
+            if linked_paths:
+                raise NotSupported(
+                    "Queries with batched link fetching can't filter "
+                    "or sort by the fields of the linked documents: "
+                    f"{', '.join(linked_paths)}. Use fetch_links=True"
+                )
+        return collection.find(
+            filter=filter_query,
             sort=self.sort_expressions,
             projection=get_projection(self.projection_model),
             skip=self.skip_number,
@@ -694,6 +780,22 @@ class FindMany(
             **self.pymongo_kwargs,
         )
 
+    def _fetches_linked(self) -> bool:
+        return self.batch_links
+
+    async def _fetch_linked(
+        self, motor_list: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        if not self.batch_links:
+            return motor_list
+        return await fetch_links_batched(
+            self.document_model,
+            motor_list,
+            nesting_depth=self.nesting_depth,
+            nesting_depths_per_field=self.nesting_depths_per_field,
+            session=self.session,
+        )
+
     async def first_or_none(self) -> Optional[FindQueryResultType]:
         """
         Returns the first found element or None if no elements were found
@@ -711,7 +813,7 @@ class FindMany(
         if self.fetch_links:
             aggregation_pipeline: List[
                 Dict[str, Any]
-            ] = self.build_aggregation_pipeline()
+            ] = self.build_aggregation_pipeline(projection={})
 
             aggregation_pipeline.append({"$count": "count"})
 
@@ -779,6 +881,7 @@ class FindOne(FindQuery[FindQueryResultType]):
         fetch_links: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
+        raw_bson: bool = False,
         **pymongo_kwargs,
     ) -> "FindOne[FindQueryResultType]":
         ...
@@ -793,6 +896,7 @@ class FindOne(FindQuery[FindQueryResultType]):
         fetch_links: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
+        raw_bson: bool = False,
         **pymongo_kwargs,
     ) -> "FindOne[FindQueryProjectionType]":
         ...
@@ -806,6 +910,7 @@ class FindOne(FindQuery[FindQueryResultType]):
         fetch_links: bool = False,
         nesting_depth: Optional[int] = None,
         nesting_depths_per_field: Optional[Dict[str, int]] = None,
+        raw_bson: bool = False,
         **pymongo_kwargs,
     ) -> Union[
         "FindOne[FindQueryResultType]", "FindOne[FindQueryProjectionType]"
@@ -817,6 +922,8 @@ class FindOne(FindQuery[FindQueryResultType]):
         :param projection_model: Optional[Type[BaseModel]] - projection model
         :param session: Optional[ClientSession] - pymongo session
         :param ignore_cache: bool
+        :param raw_bson: bool - read the raw BSON document and decode
+        its fields on the first access
         :param **pymongo_kwargs: pymongo native parameters for find operation (if Document class contains links, this parameter must fit the respective parameter of the aggregate MongoDB function)
         :return: FindOne - query instance
         """
@@ -828,6 +935,7 @@ class FindOne(FindQuery[FindQueryResultType]):
         self.pymongo_kwargs.update(pymongo_kwargs)
         self.nesting_depth = nesting_depth
         self.nesting_depths_per_field = nesting_depths_per_field
+        self.raw_bson = raw_bson
         return self
 
     def update(
@@ -960,9 +1068,10 @@ class FindOne(FindQuery[FindQueryResultType]):
         """
         self.set_session(session=session)
         if bulk_writer is None:
+            filter_query = self.get_filter_query()
             result: UpdateResult = (
                 await self.document_model.get_motor_collection().replace_one(
-                    self.get_filter_query(),
+                    filter_query,
                     get_dict(
                         document,
                         to_db=True,
@@ -975,9 +1084,12 @@ class FindOne(FindQuery[FindQueryResultType]):
 
             if not result.raw_result["updatedExisting"]:
                 raise DocumentNotFound
+            await self.document_model._invalidate_cache_on_write(
+                get_document_ids(filter_query)
+            )
             return result
         else:
-            bulk_writer.add_operation(
+            await bulk_writer.add(
                 Operation(
                     operation=ReplaceOne,
                     first_query=self.get_filter_query(),
@@ -1002,11 +1114,29 @@ class FindOne(FindQuery[FindQueryResultType]):
                 projection_model=self.projection_model,
                 nesting_depth=self.nesting_depth,
                 nesting_depths_per_field=self.nesting_depths_per_field,
+                raw_bson=self.raw_bson,
                 **self.pymongo_kwargs,
             ).first_or_none()
-        return await self.document_model.get_motor_collection().find_one(
-            filter=self.get_filter_query(),
-            projection=get_projection(self.projection_model),
+        filter_query = self.get_filter_query()
+        projection = get_projection(self.projection_model)
+        collection = self.document_model.get_motor_collection()
+        if self.raw_bson:
+            collection = get_raw_collection(collection)
+        batch_loader = self.document_model._batch_loader
+        if (
+            batch_loader is not None
+            and not self.raw_bson
+            and self.session is None
+            and not self.pymongo_kwargs
+            and (projection is None or projection.get("_id", 1))
+        ):
+            id_query = split_id_query(filter_query)
+            if id_query is not None:
+                document_id, query = id_query
+                return await batch_loader.load(document_id, query, projection)
+        return await collection.find_one(
+            filter=filter_query,
+            projection=projection,
             session=self.session,
             **self.pymongo_kwargs,
         )
@@ -1018,34 +1148,90 @@ class FindOne(FindQuery[FindQueryResultType]):
         Run the query
         :return: BaseModel
         """
-        # projection = get_projection(self.projection_model)
+        settings = self.document_model.get_settings()
+        if not (settings.use_cache and self.ignore_cache is False):
+            document = yield from self._get_document().__await__()
+            return self._parse_document(document)
+
+        cache: DocumentCache = self.document_model._cache  # type: ignore
+        filter_query = self.get_filter_query()
+        cache_key = LRUCache.create_key(
+            "FindOne",
+            filter_query,
+            self.projection_model,
+            self.session,
+            self.fetch_links,
+            self.nesting_depth,
+            self.nesting_depths_per_field,
+            self.raw_bson,
+        )
+        cached = yield from get_cached(cache, cache_key).__await__()
+        if cached is not None:
+            if isinstance(cached, BaseModel):
+                return cast(FindQueryResultType, copy_value(cached))
+            return self._parse_document(cached)
+
+        document = yield from self._get_document().__await__()
+        if document is None:
+            return None
+        # Lookups by id depend on a single document only,
+        # so they are kept on writes to other documents
+        document_ids = get_document_ids(filter_query)
         if (
-            self.document_model.get_settings().use_cache
-            and self.ignore_cache is False
+            document_ids is not None
+            and len(document_ids) == 1
+            and not self.fetch_links
         ):
-            cache_key = LRUCache.create_key(
-                "FindOne",
-                self.get_filter_query(),
-                self.projection_model,
-                self.session,
-                self.fetch_links,
-            )
-            document: Dict[str, Any] = self.document_model._cache.get(  # type: ignore
-                cache_key
-            )
-            if document is None:
-                document = yield from self._find_one().__await__()  # type: ignore
-                self.document_model._cache.set(  # type: ignore
-                    cache_key, document
-                )
+            tags = [get_id_tag(document_ids[0])]
         else:
-            document = yield from self._find_one().__await__()  # type: ignore
+            tags = [QUERY_TAG]
+        if isinstance(cache, LRUCache):
+            size = get_size(document) if cache.max_size is not None else None
+            # Documents with fetched links come already parsed.
+            # Raw documents are parsed lazily, so they are kept raw
+            if (
+                settings.cache_parsed_results and not self.raw_bson
+            ) or isinstance(document, BaseModel):
+                result = self._parse_document(document)
+                cache.set(cache_key, copy_value(result), size=size, tags=tags)
+                return result
+            cache.set(cache_key, document, size=size, tags=tags)
+        elif not isinstance(document, BaseModel):
+            yield from cache.set(cache_key, document, tags=tags).__await__()
+        return self._parse_document(document)
+
+    async def _get_document(self) -> Any:
+        single_flight = self.document_model._single_flight
+        if single_flight is None:
+            return await self._find_one()
+        key = LRUCache.create_key(
+            "FindOne",
+            self.get_filter_query(),
+            self.projection_model,
+            self.session,
+            self.fetch_links,
+            self.nesting_depth,
+            self.nesting_depths_per_field,
+            self.raw_bson,
+            self.pymongo_kwargs,
+        )
+        document, shared = await single_flight.do(key, self._find_one)
+        if shared:
+            return copy_value(document)
+        return document
+
+    def _parse_document(
+        self, document: Optional[Dict[str, Any]]
+    ) -> Optional[FindQueryResultType]:
         if document is None:
             return None
         if type(document) == self.projection_model:
             return cast(FindQueryResultType, document)
         return cast(
-            FindQueryResultType, parse_obj(self.projection_model, document)
+            FindQueryResultType,
+            parse_obj(
+                self.projection_model, document, lazy_parse=self.raw_bson
+            ),
         )
 
     async def count(self) -> int:
@@ -20,6 +20,7 @@ from pymongo.client_session import ClientSession
 from pymongo.results import InsertOneResult, UpdateResult
 
 from beanie.odm.bulk import BulkWriter, Operation
+from beanie.odm.cache import get_document_ids
 from beanie.odm.interfaces.clone import CloneInterface
 from beanie.odm.interfaces.session import SessionMethods
 from beanie.odm.interfaces.update import (
@@ -95,6 +96,11 @@ class UpdateQuery(UpdateMethods, SessionMethods, CloneInterface):
                 raise TypeError("Wrong expression type")
         return Encoder(custom_encoders=self.encoders).encode(query)
 
+    async def _invalidate_cache(self):
+        await self.document_model._invalidate_cache_on_write(
+            get_document_ids(self.find_query)
+        )
+
     @abstractmethod
     async def _update(self) -> UpdateResult:
         ...
@@ -171,7 +177,7 @@ class UpdateMany(UpdateQuery):
 
     async def _update(self):
         if self.bulk_writer is None:
-            return (
+            result = (
                 await self.document_model.get_motor_collection().update_many(
                     self.find_query,
                     self.update_query,
@@ -179,8 +185,10 @@ class UpdateMany(UpdateQuery):
                     **self.pymongo_kwargs,
                 )
             )
+            await self._invalidate_cache()
+            return result
         else:
-            self.bulk_writer.add_operation(
+            await self.bulk_writer.add(
                 Operation(
                     operation=UpdateManyPyMongo,
                     first_query=self.find_query,
@@ -309,12 +317,14 @@ class UpdateOne(UpdateQuery):
     async def _update(self):
         if not self.bulk_writer:
             if self.response_type == UpdateResponse.UPDATE_RESULT:
-                return await self.document_model.get_motor_collection().update_one(
+                result = await self.document_model.get_motor_collection().update_one(
                     self.find_query,
                     self.update_query,
                     session=self.session,
                     **self.pymongo_kwargs,
                 )
+                await self._invalidate_cache()
+                return result
             else:
                 result = await self.document_model.get_motor_collection().find_one_and_update(
                     self.find_query,
@@ -325,11 +335,12 @@ class UpdateOne(UpdateQuery):
                     else ReturnDocument.AFTER,
                     **self.pymongo_kwargs,
                 )
+                await self._invalidate_cache()
                 if result is not None:
                     result = parse_obj(self.document_model, result)
                 return result
         else:
-            self.bulk_writer.add_operation(
+            await self.bulk_writer.add(
                 Operation(
                     operation=UpdateOnePyMongo,
                     first_query=self.find_query,
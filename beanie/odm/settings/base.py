@@ -1,9 +1,11 @@
+from concurrent.futures import Executor
 from datetime import timedelta
 from typing import Any, Dict, Optional, Type
 
 from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
 from pydantic import BaseModel, Field
 
+from beanie.odm.cache import CacheBackend
 from beanie.odm.utils.pydantic import IS_PYDANTIC_V2
 
 if IS_PYDANTIC_V2:
@@ -16,6 +18,18 @@ class ItemSettings(BaseModel):
     use_cache: bool = False
     cache_capacity: int = 32
     cache_expiration_time: timedelta = timedelta(minutes=10)
+    cache_max_bytes: Optional[int] = None
+    cache_parsed_results: bool = False
+    # The cached results are kept on the writes until they expire,
+    # unless the invalidation is turned on
+    cache_invalidate_on_write: bool = False
+    cache_backend: Optional[CacheBackend] = None
+    coalesce_queries: bool = False
+    batch_get: bool = False
+    batch_get_window: timedelta = timedelta(0)
+    parse_offload_threshold: Optional[int] = None
+    parse_offload_batch_size: int = 1000
+    parse_offload_executor: Optional[Executor] = None
     bson_encoders: Dict[Any, Any] = Field(default_factory=dict)
     projection: Optional[Dict[str, Any]] = None
 
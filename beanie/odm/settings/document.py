@@ -2,6 +2,7 @@ from typing import List, Optional
 
 from pydantic import Field
 
+from beanie.odm.enums import StateSnapshot
 from beanie.odm.fields import IndexModelField
 from beanie.odm.settings.base import ItemSettings
 from beanie.odm.settings.timeseries import TimeSeriesConfig
@@ -15,6 +16,10 @@ class DocumentSettings(ItemSettings):
     use_state_management: bool = False
     state_management_replace_objects: bool = False
     state_management_save_previous: bool = False
+    state_management_track_changes: bool = False
+    state_management_snapshot: StateSnapshot = StateSnapshot.DICT
+    state_management_array_updates: bool = False
+    state_management_array_updates_limit: float = 0.5
     validate_on_save: bool = False
     use_revision: bool = False
     single_root_inheritance: bool = False
@@ -1,11 +1,14 @@
 from typing import ClassVar, Dict, Optional, Type
 
 from beanie.exceptions import UnionDocNotInited
+from beanie.odm.cache import DocumentCache
 from beanie.odm.interfaces.aggregate import AggregateInterface
 from beanie.odm.interfaces.detector import DetectionInterface, ModelType
 from beanie.odm.interfaces.find import FindInterface
 from beanie.odm.interfaces.getters import OtherGettersInterface
 from beanie.odm.settings.union_doc import UnionDocSettings
+from beanie.odm.utils.batch_loader import BatchLoader
+from beanie.odm.utils.single_flight import SingleFlight
 
 
 class UnionDoc(
@@ -18,6 +21,11 @@ class UnionDoc(
     _is_inited: ClassVar[bool] = False
     _settings: ClassVar[UnionDocSettings]
 
+    # Cache, query coalescing and batching
+    _cache: ClassVar[Optional[DocumentCache]] = None
+    _single_flight: ClassVar[Optional[SingleFlight]] = None
+    _batch_loader: ClassVar[Optional[BatchLoader]] = None
+
     @classmethod
     def get_settings(cls) -> UnionDocSettings:
         return cls._settings
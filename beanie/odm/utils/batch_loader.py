@@ -0,0 +1,167 @@
+import asyncio
+import uuid
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+
+import bson
+
+from beanie.odm.cache import LRUCache
+
+if TYPE_CHECKING:
+    from beanie.odm.documents import Document
+
+
+# Only the equality conditions with these values select a single document,
+# which has the same id. Operators, patterns, lists, embedded documents
+# and the values matching other types are queried as they are
+ID_TYPES = (bson.ObjectId, str, int, bytes, uuid.UUID)
+
+
+def _is_id_value(value: Any) -> bool:
+    return isinstance(value, ID_TYPES)
+
+
+def split_id_query(
+    query: Mapping[str, Any],
+) -> Optional[Tuple[Any, List[Mapping[str, Any]]]]:
+    """
+    Split the filter query into the single document id it selects
+    and the rest of the conditions
+
+    :param query: Mapping[str, Any] - encoded filter query
+    :return: Optional[Tuple[Any, List[Mapping[str, Any]]]] - id and
+    the other conditions or None if the query is not a lookup by id
+    """
+    if "_id" in query:
+        if not _is_id_value(query["_id"]):
+            return None
+        rest = {k: v for k, v in query.items() if k != "_id"}
+        return query["_id"], [rest] if rest else []
+    if list(query) == ["$and"] and isinstance(query["$and"], list):
+        for i, condition in enumerate(query["$and"]):
+            if (
+                isinstance(condition, Mapping)
+                and list(condition) == ["_id"]
+                and _is_id_value(condition["_id"])
+            ):
+                return (
+                    condition["_id"],
+                    query["$and"][:i] + query["$and"][i + 1 :],
+                )
+    return None
+
+
+class _Batch:
+    __slots__ = ("loop", "query", "projection", "ids", "futures")
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        query: List[Mapping[str, Any]],
+        projection: Optional[Mapping[str, Any]],
+    ):
+        self.loop = loop
+        self.query = query
+        self.projection = projection
+        self.ids: List[Any] = []
+        self.futures: Dict[str, asyncio.Future] = {}
+
+
+class BatchLoader:
+    """
+    Collects lookups of documents by id made within one event loop
+    iteration (or the given window) and fetches them
+    with a single `$in` query.
+    """
+
+    def __init__(
+        self, document_model: Type["Document"], window: float = 0
+    ) -> None:
+        self.document_model = document_model
+        self.window = window
+        self.batches: Dict[str, _Batch] = {}
+        self.tasks: Set[asyncio.Task] = set()
+
+    async def load(
+        self,
+        document_id: Any,
+        query: List[Mapping[str, Any]],
+        projection: Optional[Mapping[str, Any]] = None,
+    ) -> Optional[Mapping[str, Any]]:
+        """
+        Load raw document by id
+
+        :param document_id: Any - encoded document id
+        :param query: List[Mapping[str, Any]] - other conditions
+        of the lookup. Only lookups with the same conditions
+        and projection are batched together
+        :param projection: Optional[Mapping[str, Any]] - projection
+        :return: Optional[Mapping[str, Any]] - document or None
+        if it was not found
+        """
+        loop = asyncio.get_running_loop()
+        key = LRUCache.create_key(query, projection)
+        batch = self.batches.get(key)
+        if batch is None or batch.loop is not loop:
+            batch = _Batch(loop, query, projection)
+            self.batches[key] = batch
+            if self.window > 0:
+                loop.call_later(self.window, self._dispatch, key, batch)
+            else:
+                loop.call_soon(self._dispatch, key, batch)
+
+        id_key = LRUCache.create_key(document_id)
+        future = batch.futures.get(id_key)
+        if future is None:
+            future = loop.create_future()
+            batch.ids.append(document_id)
+            batch.futures[id_key] = future
+        # Shielded, as the other lookups of this id share the future
+        return await asyncio.shield(future)
+
+    def _dispatch(self, key: str, batch: _Batch) -> None:
+        if self.batches.get(key) is batch:
+            del self.batches[key]
+        task = batch.loop.create_task(self._fetch(batch))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def _fetch(self, batch: _Batch) -> None:
+        query: Mapping[str, Any] = {"_id": {"$in": batch.ids}}
+        if batch.query:
+            query = {"$and": [query, *batch.query]}
+        try:
+            documents = (
+                await self.document_model.get_motor_collection()
+                .find(query, projection=batch.projection)
+                .to_list(length=None)
+            )
+        except asyncio.CancelledError:
+            for future in batch.futures.values():
+                future.cancel()
+            raise
+        except Exception as e:
+            for future in batch.futures.values():
+                if not future.done():
+                    future.set_exception(e)
+                    # Mark the exception as retrieved,
+                    # all the lookups could be cancelled already
+                    future.exception()
+            return
+
+        found = {
+            LRUCache.create_key(document["_id"]): document
+            for document in documents
+        }
+        for id_key, future in batch.futures.items():
+            if not future.done():
+                future.set_result(found.get(id_key))
@@ -0,0 +1,192 @@
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+from bson import DBRef
+from pymongo.client_session import ClientSession
+from typing_extensions import Literal
+
+from beanie.odm.cache import LRUCache
+from beanie.odm.fields import LinkInfo
+from beanie.odm.utils.cascade import BACK_LINK_TYPES, DIRECT_LINK_TYPES
+from beanie.odm.utils.raw_bson import decode_dbref
+
+if TYPE_CHECKING:
+    from beanie.odm.documents import Document
+
+BATCHED = "batched"
+FetchLinksType = Union[bool, Literal["batched"]]
+
+# Raw document, link field to resolve in it and the nesting depth left
+_Node = Tuple[Dict[str, Any], LinkInfo, Optional[int]]
+
+
+def ref_ids(value: Any) -> List[Any]:
+    """
+    Get the ids of the references stored in the link field.
+    Lists are flattened, other values are skipped
+
+    :param value: Any - value of the link field
+    :return: List[Any] - referenced ids
+    """
+    ids = []
+    for item in value if isinstance(value, list) else [value]:
+        item = decode_dbref(item)
+        if isinstance(item, DBRef):
+            ids.append(item.id)
+    return ids
+
+
+async def fetch_links_batched(
+    document_class: Type["Document"],
+    documents: List[Dict[str, Any]],
+    nesting_depth: Optional[int] = None,
+    nesting_depths_per_field: Optional[Dict[str, int]] = None,
+    session: Optional[ClientSession] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Replace the references of the raw documents with the raw linked
+    documents, the same way the `$lookup` stages do.
+    The linked documents are fetched level by level. Every level
+    needs one `$in` query per linked collection, the queries of a level
+    run concurrently
+
+    :param document_class: Type[Document] - class of the documents
+    :param documents: List[Dict[str, Any]] - raw documents
+    :param nesting_depth: Optional[int] - nesting depth of all the links
+    :param nesting_depths_per_field: Optional[Dict[str, int]] - nesting
+    depths of the specific link fields
+    :param session: Optional[ClientSession] - pymongo session
+    :return: List[Dict[str, Any]] - documents with the fetched links
+    """
+    link_fields = document_class.get_link_fields()
+    if not link_fields or not documents:
+        return documents
+    # Raw BSON documents are read only
+    result: List[Dict[str, Any]] = [
+        document if isinstance(document, dict) else dict(document)
+        for document in documents
+    ]
+    nodes: List[_Node] = []
+    for link_info in link_fields.values():
+        depth = (
+            nesting_depths_per_field.get(link_info.field_name)
+            if nesting_depths_per_field is not None
+            else None
+        )
+        if depth is None:
+            depth = nesting_depth
+        nodes += [(document, link_info, depth) for document in result]
+    while nodes:
+        nodes = await _fetch_level(nodes, session)
+    return result
+
+
+async def _fetch_level(
+    nodes: List[_Node], session: Optional[ClientSession]
+) -> List[_Node]:
+    requests: Dict[Type["Document"], Dict[str, List[Any]]] = {}
+    seen: Set[Tuple[Type["Document"], str, str]] = set()
+    pending = []
+    for document, link_info, depth in nodes:
+        if link_info.is_fetchable is False or (
+            depth is not None and depth <= 0
+        ):
+            continue
+        if link_info.link_type in BACK_LINK_TYPES:
+            key = f"{link_info.lookup_field_name}.$id"
+            ids = [document["_id"]] if "_id" in document else []
+        else:
+            key = "_id"
+            ids = ref_ids(document.get(link_info.lookup_field_name))
+        if not ids:
+            continue
+        linked_class = cast(Type["Document"], link_info.document_class)
+        keys = requests.setdefault(linked_class, {})
+        for document_id in ids:
+            request = (linked_class, key, LRUCache.create_key(document_id))
+            if request not in seen:
+                seen.add(request)
+                keys.setdefault(key, []).append(document_id)
+        pending.append((document, link_info, depth, key, ids))
+    if not pending:
+        return []
+
+    classes = list(requests)
+    results = await asyncio.gather(
+        *(
+            _fetch_class(linked_class, requests[linked_class], session)
+            for linked_class in classes
+        )
+    )
+    found: Dict[Tuple[Type["Document"], str], Dict[str, List[Any]]] = {}
+    for linked_class, linked_documents in zip(classes, results):
+        for key in requests[linked_class]:
+            index = found.setdefault((linked_class, key), {})
+            for linked_document in linked_documents:
+                if key == "_id":
+                    key_ids = [linked_document["_id"]]
+                else:
+                    key_ids = ref_ids(linked_document.get(key[: -len(".$id")]))
+                for key_id in key_ids:
+                    index.setdefault(LRUCache.create_key(key_id), []).append(
+                        linked_document
+                    )
+
+    next_nodes: List[_Node] = []
+    visited: Set[Tuple[int, int]] = set()
+    for document, link_info, depth, key, ids in pending:
+        index = found[(cast(Type["Document"], link_info.document_class), key)]
+        matches = [
+            linked_document
+            for document_id in ids
+            for linked_document in index.get(
+                LRUCache.create_key(document_id), []
+            )
+        ]
+        if link_info.link_type in DIRECT_LINK_TYPES:
+            # Not found direct links stay references
+            if not matches:
+                continue
+            matches = matches[:1]
+            document[link_info.field_name] = matches[0]
+        else:
+            document[link_info.field_name] = matches
+        if not link_info.nested_links:
+            continue
+        new_depth = depth - 1 if depth is not None else None
+        for linked_document in matches:
+            for nested_link in link_info.nested_links.values():
+                # The same linked document is shared by all the documents
+                # of the level, which link it
+                if (id(linked_document), id(nested_link)) in visited:
+                    continue
+                visited.add((id(linked_document), id(nested_link)))
+                next_nodes.append((linked_document, nested_link, new_depth))
+    return next_nodes
+
+
+async def _fetch_class(
+    document_class: Type["Document"],
+    keys: Dict[str, List[Any]],
+    session: Optional[ClientSession],
+) -> List[Dict[str, Any]]:
+    conditions: List[Dict[str, Any]] = [
+        {key: {"$in": ids}} for key, ids in keys.items()
+    ]
+    query = conditions[0] if len(conditions) == 1 else {"$or": conditions}
+    return (
+        await document_class.get_motor_collection()
+        .find(query, session=session)
+        .to_list(length=None)
+    )
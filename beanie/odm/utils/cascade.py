@@ -0,0 +1,242 @@
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    cast,
+)
+
+from bson import DBRef
+from pymongo.client_session import ClientSession
+
+from beanie.odm.cache import LRUCache
+from beanie.odm.fields import Link, LinkTypes
+
+if TYPE_CHECKING:
+    from beanie import Document
+
+DIRECT_LINK_TYPES = [
+    LinkTypes.DIRECT,
+    LinkTypes.OPTIONAL_DIRECT,
+    LinkTypes.BACK_DIRECT,
+    LinkTypes.OPTIONAL_BACK_DIRECT,
+]
+LIST_LINK_TYPES = [
+    LinkTypes.LIST,
+    LinkTypes.OPTIONAL_LIST,
+    LinkTypes.BACK_LIST,
+    LinkTypes.OPTIONAL_BACK_LIST,
+]
+BACK_LINK_TYPES = [
+    LinkTypes.BACK_DIRECT,
+    LinkTypes.OPTIONAL_BACK_DIRECT,
+    LinkTypes.BACK_LIST,
+    LinkTypes.OPTIONAL_BACK_LIST,
+]
+
+
+def iter_link_values(
+    document: "Document", include_back_links: bool = True
+) -> Iterator[Any]:
+    """
+    Iterate over the values of the link fields.
+    Lists are flattened
+
+    :param document: Document - document to inspect
+    :param include_back_links: bool - include back link fields
+    :return: Iterator[Any] - documents, links and back links
+    """
+    link_fields = document.get_link_fields()
+    if link_fields is None:
+        return
+    for field_info in link_fields.values():
+        if not include_back_links and field_info.link_type in BACK_LINK_TYPES:
+            continue
+        value = getattr(document, field_info.field_name)
+        if field_info.link_type in DIRECT_LINK_TYPES:
+            if value is not None:
+                yield value
+        elif field_info.link_type in LIST_LINK_TYPES:
+            if isinstance(value, list):
+                yield from value
+
+
+def iter_linked_documents(
+    document: "Document", include_back_links: bool = True
+) -> Iterator["Document"]:
+    """
+    Iterate over the fetched documents of the link fields
+
+    :param document: Document - document to inspect
+    :param include_back_links: bool - include back link fields
+    :return: Iterator[Document]
+    """
+    from beanie import Document
+
+    for value in iter_link_values(document, include_back_links):
+        if isinstance(value, Document):
+            yield value
+
+
+def plan_cascade_write(
+    documents: Sequence["Document"], include_back_links: bool = True
+) -> List["Document"]:
+    """
+    Collect the documents linked from the given ones, to write them
+    before the given documents.
+    Every document is planned once. Linked documents go before
+    the documents that link them, cycles are cut at the first
+    visited document
+
+    :param documents: Sequence[Document] - documents to write
+    :param include_back_links: bool - follow the back links
+    of the given documents. Back links of the linked documents
+    are always followed
+    :return: List[Document] - linked documents in the write order
+    """
+    roots = {id(document) for document in documents}
+    visited: Set[int] = set(roots)
+    planned: List["Document"] = []
+    for root in documents:
+        stack: List[Tuple["Document", Iterator["Document"]]] = [
+            (root, iter_linked_documents(root, include_back_links))
+        ]
+        while stack:
+            document, linked_documents = stack[-1]
+            for linked_document in linked_documents:
+                if id(linked_document) not in visited:
+                    visited.add(id(linked_document))
+                    stack.append(
+                        (
+                            linked_document,
+                            iter_linked_documents(linked_document),
+                        )
+                    )
+                    break
+            else:
+                stack.pop()
+                if id(document) not in roots:
+                    planned.append(document)
+    return planned
+
+
+def group_by_class(
+    documents: Sequence["Document"],
+) -> Dict[Type["Document"], List["Document"]]:
+    """
+    Group the documents by their classes keeping the order
+
+    :param documents: Sequence[Document]
+    :return: Dict[Type[Document], List[Document]]
+    """
+    groups: Dict[Type["Document"], List["Document"]] = {}
+    for document in documents:
+        groups.setdefault(type(document), []).append(document)
+    return groups
+
+
+async def plan_cascade_delete(
+    document: "Document",
+    max_depth: int,
+    session: Optional[ClientSession] = None,
+) -> Tuple[List["Document"], Dict[Type["Document"], List[Any]]]:
+    """
+    Collect the documents linked from the given one to delete them
+    together with it.
+    Fetched documents are followed in memory. Unfetched links are
+    followed by reading the link fields of the linked documents,
+    with one query per document class and depth level,
+    up to `max_depth` levels from the given document
+
+    :param document: Document - document to delete
+    :param max_depth: int - max depth of the unfetched links to follow
+    :param session: Optional[ClientSession] - pymongo session
+    :return: Tuple[List[Document], Dict[Type[Document], List[Any]]] -
+    fetched linked documents and ids of all the linked documents
+    grouped by document class
+    """
+    from beanie import Document
+
+    seen: Set[str] = {
+        LRUCache.create_key(document.get_collection_name(), document.id)
+    }
+    fetched: List["Document"] = []
+    ids: Dict[Type["Document"], List[Any]] = {}
+
+    def add(document_class: Type["Document"], document_id: Any) -> bool:
+        key = LRUCache.create_key(
+            document_class.get_collection_name(), document_id
+        )
+        if key in seen:
+            return False
+        seen.add(key)
+        ids.setdefault(document_class, []).append(document_id)
+        return True
+
+    documents = [document]
+    links: Dict[Type["Document"], List[Any]] = {}
+    level = 0
+    while documents or links:
+        level += 1
+        next_documents: List["Document"] = []
+        next_links: Dict[Type["Document"], List[Any]] = {}
+
+        def visit(document_class: Type["Document"], value: Any) -> None:
+            if isinstance(value, Document):
+                if add(type(value), value.id):
+                    fetched.append(value)
+                    next_documents.append(value)
+            elif level <= max_depth:
+                if isinstance(value, Link):
+                    document_class, value = value.document_class, value.ref
+                if isinstance(value, DBRef) and add(document_class, value.id):
+                    next_links.setdefault(document_class, []).append(value.id)
+
+        for parent in documents:
+            for value in iter_link_values(parent):
+                visit(type(parent), value)
+
+        if level <= max_depth:
+            for document_class, class_ids in links.items():
+                link_fields = [
+                    field_info
+                    for field_info in (
+                        document_class.get_link_fields() or {}
+                    ).values()
+                    if field_info.link_type not in BACK_LINK_TYPES
+                ]
+                if not link_fields:
+                    continue
+                raw_documents = (
+                    await document_class.get_motor_collection()
+                    .find(
+                        {"_id": {"$in": class_ids}},
+                        projection={
+                            field_info.lookup_field_name: 1
+                            for field_info in link_fields
+                        },
+                        session=session,
+                    )
+                    .to_list(length=None)
+                )
+                for raw_document in raw_documents:
+                    for field_info in link_fields:
+                        value = raw_document.get(field_info.lookup_field_name)
+                        for item in (
+                            value if isinstance(value, list) else [value]
+                        ):
+                            visit(
+                                cast(
+                                    Type["Document"], field_info.document_class
+                                ),
+                                item,
+                            )
+
+        documents, links = next_documents, next_links
+    return fetched, ids
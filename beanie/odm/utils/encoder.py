@@ -6,17 +6,22 @@ import ipaddress
 import operator
 import pathlib
 import re
+import sys
 import uuid
 from enum import Enum
 from typing import (
     Any,
     Callable,
     Container,
+    Dict,
+    FrozenSet,
     Iterable,
     Mapping,
     MutableMapping,
     Optional,
     Tuple,
+    Type,
+    Union,
 )
 
 import bson
@@ -24,7 +29,21 @@ import pydantic
 
 import beanie
 from beanie.odm.fields import Link, LinkTypes
-from beanie.odm.utils.pydantic import IS_PYDANTIC_V2, get_model_fields
+from beanie.odm.utils.pydantic import (
+    IS_PYDANTIC_V2,
+    get_field_type,
+    get_model_fields,
+)
+
+if sys.version_info >= (3, 8):
+    from typing import get_args, get_origin
+else:
+    from typing_extensions import get_args, get_origin
+
+if sys.version_info >= (3, 10):
+    from types import UnionType as TypesUnionType
+else:
+    TypesUnionType = ()
 
 SingleArgCallable = Callable[[Any], Any]
 DEFAULT_CUSTOM_ENCODERS: MutableMapping[type, SingleArgCallable] = {
@@ -66,6 +85,247 @@ BSON_SCALAR_TYPES = (
 )
 
 
+class EncoderDispatch:
+    """
+    Lookup of encoders by the concrete type of the value.
+
+    The encoder is resolved using the MRO of the type once and the result
+    is cached, including the types without an encoder. The cache is reset
+    when the types of the encoders mapping are changed.
+    """
+
+    def __init__(self, encoders: Mapping[type, SingleArgCallable]):
+        self.encoders = encoders
+        self._types = tuple(encoders)
+        self._resolved: Dict[type, Optional[type]] = {}
+
+    def get(self, cls: type) -> Optional[SingleArgCallable]:
+        encoders = self.encoders
+        # The encoders of the same types could be replaced,
+        # they are looked up in the mapping on every call
+        if tuple(encoders) != self._types:
+            self.invalidate()
+        try:
+            encoder_cls = self._resolved[cls]
+        except KeyError:
+            encoder_cls = self._resolve(cls)
+            self._resolved[cls] = encoder_cls
+        if encoder_cls is None:
+            return None
+        return encoders[encoder_cls]
+
+    def invalidate(self) -> None:
+        self._resolved.clear()
+        self._types = tuple(self.encoders)
+
+    def _resolve(self, cls: type) -> Optional[type]:
+        encoders = self.encoders
+        for base in cls.__mro__:
+            if base in encoders:
+                return base
+        # abstract base classes can have virtual subclasses
+        for encoder_cls in encoders:
+            if issubclass(cls, encoder_cls):
+                return encoder_cls
+        return None
+
+
+DEFAULT_ENCODER_DISPATCH = EncoderDispatch(DEFAULT_CUSTOM_ENCODERS)
+
+_MAX_ENCODER_DISPATCHES = 256
+_encoder_dispatches: Dict[int, EncoderDispatch] = {}
+
+
+def get_encoder_dispatch(
+    encoders: Mapping[type, SingleArgCallable]
+) -> EncoderDispatch:
+    """
+    Get the dispatch cache of the encoders mapping.
+    Caches are shared by all the encoders, which use the same mapping
+    (e.g. the `bson_encoders` of the document settings).
+    """
+    if encoders is DEFAULT_CUSTOM_ENCODERS:
+        return DEFAULT_ENCODER_DISPATCH
+    dispatch = _encoder_dispatches.get(id(encoders))
+    if dispatch is None or dispatch.encoders is not encoders:
+        if len(_encoder_dispatches) >= _MAX_ENCODER_DISPATCHES:
+            _encoder_dispatches.clear()
+        dispatch = EncoderDispatch(encoders)
+        _encoder_dispatches[id(encoders)] = dispatch
+    return dispatch
+
+
+@dc.dataclass(frozen=True)
+class FieldEncodingPlan:
+    """
+    Precomputed encoding rules of a single model field
+    """
+
+    key: str
+    link_type: Optional[LinkTypes] = None
+    passthrough_types: FrozenSet[type] = frozenset()
+    model_types: FrozenSet[type] = frozenset()
+    encoders: Mapping[type, SingleArgCallable] = dc.field(default_factory=dict)
+    items: Optional["FieldEncodingPlan"] = None
+
+
+@dc.dataclass(frozen=True)
+class ModelEncodingPlan:
+    """
+    Precomputed encoding rules of a model class.
+
+    The plan is compiled against a specific custom encoders mapping
+    and can only be used by encoders which share that mapping.
+    """
+
+    model: Type[pydantic.BaseModel]
+    fields: Mapping[str, FieldEncodingPlan]
+    custom_encoders: Mapping[type, SingleArgCallable]
+    custom_encoders_size: int = 0
+
+
+_model_encoding_plans: Dict[type, ModelEncodingPlan] = {}
+
+
+def _get_annotation_types(annotation: Any) -> Tuple[Any, ...]:
+    origin = get_origin(annotation)
+    if origin is Union or origin is TypesUnionType:
+        result: Tuple[Any, ...] = ()
+        for arg in get_args(annotation):
+            result += _get_annotation_types(arg)
+        return result
+    return (annotation,)
+
+
+def compile_field_plan(
+    key: str,
+    annotation: Any,
+    custom_encoders: Mapping[type, SingleArgCallable],
+    link_type: Optional[LinkTypes] = None,
+) -> FieldEncodingPlan:
+    """
+    Build encoding rules for a field using its annotation.
+    Values of the annotated types are encoded without the generic
+    type dispatch. The resolution order is the same as in `Encoder.encode`.
+    """
+    passthrough_types = set()
+    model_types = set()
+    encoders = {}
+    items = None
+    custom_dispatch = (
+        get_encoder_dispatch(custom_encoders) if custom_encoders else None
+    )
+    for cls in _get_annotation_types(annotation) + (type(None),):
+        args = get_args(cls)
+        if get_origin(cls) is list and len(args) == 1:
+            if custom_dispatch is None or custom_dispatch.get(list) is None:
+                items = compile_field_plan(key, args[0], custom_encoders)
+            continue
+        if not isinstance(cls, type) or get_origin(cls) is not None:
+            continue
+        if custom_dispatch is not None:
+            encoder = custom_dispatch.get(cls)
+            if encoder is not None:
+                encoders[cls] = encoder
+                continue
+        if issubclass(cls, BSON_SCALAR_TYPES):
+            passthrough_types.add(cls)
+            # Indexed(str) and similar types store values of the base type
+            for base in cls.__mro__[1:]:
+                if base in BSON_SCALAR_TYPES:
+                    if (
+                        custom_dispatch is None
+                        or custom_dispatch.get(base) is None
+                    ):
+                        passthrough_types.add(base)
+                    break
+            continue
+        encoder = DEFAULT_ENCODER_DISPATCH.get(cls)
+        if encoder is not None:
+            encoders[cls] = encoder
+        elif (
+            issubclass(cls, pydantic.BaseModel)
+            and not issubclass(cls, beanie.Document)
+            and not (IS_PYDANTIC_V2 and issubclass(cls, pydantic.RootModel))
+        ):
+            model_types.add(cls)
+    return FieldEncodingPlan(
+        key=key,
+        link_type=link_type,
+        passthrough_types=frozenset(passthrough_types),
+        model_types=frozenset(model_types),
+        encoders=encoders,
+        items=items,
+    )
+
+
+def compile_encoding_plan(
+    model: Type[pydantic.BaseModel],
+    custom_encoders: Optional[Mapping[type, SingleArgCallable]] = None,
+) -> ModelEncodingPlan:
+    """
+    Build encoding rules for all the fields of the model class
+
+    :param model: Type[BaseModel] - model or document class
+    :param custom_encoders: Mapping[type, Callable] - encoders, which will
+    be used together with the plan
+    :return: ModelEncodingPlan
+    """
+    if custom_encoders is None:
+        custom_encoders = {}
+    link_fields = {}
+    if issubclass(model, beanie.Document):
+        link_fields = model.get_link_fields() or {}
+    fields = {}
+    for name, field in get_model_fields(model).items():
+        link_info = link_fields.get(name)
+        fields[name] = compile_field_plan(
+            key=field.alias or name,
+            annotation=get_field_type(field),
+            custom_encoders=custom_encoders,
+            link_type=link_info.link_type if link_info else None,
+        )
+    return ModelEncodingPlan(
+        model=model,
+        fields=fields,
+        custom_encoders=custom_encoders,
+        custom_encoders_size=len(custom_encoders),
+    )
+
+
+def get_encoding_plan(model: Type[pydantic.BaseModel]) -> ModelEncodingPlan:
+    """
+    Get the encoding plan of a model class, which doesn't use
+    custom encoders. Plans are compiled once per class.
+    """
+    plan = _model_encoding_plans.get(model)
+    if plan is None:
+        plan = compile_encoding_plan(model)
+        _model_encoding_plans[model] = plan
+    return plan
+
+
+def get_document_encoding_plan(
+    document_class: Type["beanie.Document"],
+) -> ModelEncodingPlan:
+    """
+    Get the encoding plan of a document class. The plan is compiled
+    against the `bson_encoders` of the document settings on the
+    initialization step and recompiled if the settings were changed.
+    """
+    plan = document_class._encoding_plan
+    bson_encoders = document_class.get_settings().bson_encoders
+    if (
+        plan is None
+        or plan.model is not document_class
+        or plan.custom_encoders is not bson_encoders
+        or plan.custom_encoders_size != len(bson_encoders)
+    ):
+        plan = compile_encoding_plan(document_class, bson_encoders)
+        document_class._encoding_plan = plan
+    return plan
+
+
 @dc.dataclass
 class Encoder:
     """
@@ -73,6 +333,7 @@ class Encoder:
     """
 
     exclude: Container[str] = frozenset()
+    include: Optional[Container[str]] = None
     custom_encoders: Mapping[type, SingleArgCallable] = dc.field(
         default_factory=dict
     )
@@ -90,37 +351,79 @@ class Encoder:
         if obj._class_id:
             obj_dict[settings.class_id] = obj._class_id
 
-        link_fields = obj.get_link_fields() or {}
+        plan = get_document_encoding_plan(type(obj))
         sub_encoder = Encoder(
-            # don't propagate self.exclude to subdocuments
-            custom_encoders=settings.bson_encoders,
+            # don't propagate self.exclude and self.include to subdocuments
+            custom_encoders=plan.custom_encoders,
             to_db=self.to_db,
             keep_nulls=self.keep_nulls,
         )
-        for key, value in self._iter_model_items(obj):
-            if key in link_fields:
-                link_type = link_fields[key].link_type
+        for key, field, value in self._iter_model_items(obj, plan):
+            if field is None:
+                obj_dict[key] = sub_encoder.encode(value)
+                continue
+            link_type = field.link_type
+            if link_type is not None:
                 if link_type in (LinkTypes.DIRECT, LinkTypes.OPTIONAL_DIRECT):
                     if value is not None:
-                        value = value.to_ref()
+                        value = sub_encoder._encode_ref(value.to_ref())
                 elif link_type in (LinkTypes.LIST, LinkTypes.OPTIONAL_LIST):
                     if value is not None:
-                        value = [link.to_ref() for link in value]
+                        value = [
+                            sub_encoder._encode_ref(link.to_ref())
+                            for link in value
+                        ]
                 elif self.to_db:
                     continue
-            obj_dict[key] = sub_encoder.encode(value)
+            obj_dict[key] = sub_encoder._encode_field(field, value)
         return obj_dict
 
+    def _encode_ref(self, ref: bson.DBRef) -> bson.DBRef:
+        # ids of other types, e.g. UUID, are not encoded by BSON itself
+        if isinstance(ref.id, BSON_SCALAR_TYPES):
+            return ref
+        return bson.DBRef(ref.collection, self.encode(ref.id), ref.database)
+
+    def _encode_model(self, obj: pydantic.BaseModel) -> Mapping[str, Any]:
+        plan = get_encoding_plan(type(obj))
+        if self.custom_encoders:
+            # the shared plan was compiled without custom encoders,
+            # so only the field keys can be taken from it
+            return {
+                key: self.encode(value)
+                for key, _, value in self._iter_model_items(obj, plan)
+            }
+        return {
+            key: self.encode(value)
+            if field is None
+            else self._encode_field(field, value)
+            for key, field, value in self._iter_model_items(obj, plan)
+        }
+
+    def _encode_field(self, field: FieldEncodingPlan, value: Any) -> Any:
+        value_type = type(value)
+        if value_type in field.passthrough_types:
+            return value
+        if value_type in field.model_types:
+            return self._encode_model(value)
+        if value_type is list and field.items is not None:
+            items = field.items
+            return [self._encode_field(items, item) for item in value]
+        encoder = field.encoders.get(value_type)
+        if encoder is not None:
+            return encoder(value)
+        return self.encode(value)
+
     def encode(self, obj: Any) -> Any:
         if self.custom_encoders:
-            encoder = _get_encoder(obj, self.custom_encoders)
+            encoder = get_encoder_dispatch(self.custom_encoders).get(type(obj))
             if encoder is not None:
                 return encoder(obj)
 
         if isinstance(obj, BSON_SCALAR_TYPES):
             return obj
 
-        encoder = _get_encoder(obj, DEFAULT_CUSTOM_ENCODERS)
+        encoder = DEFAULT_ENCODER_DISPATCH.get(type(obj))
         if encoder is not None:
             return encoder(obj)
 
@@ -129,8 +432,7 @@ class Encoder:
         if IS_PYDANTIC_V2 and isinstance(obj, pydantic.RootModel):
             return self.encode(obj.root)
         if isinstance(obj, pydantic.BaseModel):
-            items = self._iter_model_items(obj)
-            return {key: self.encode(value) for key, value in items}
+            return self._encode_model(obj)
         if isinstance(obj, Mapping):
             return {
                 key if isinstance(key, Enum) else str(key): self.encode(value)
@@ -142,25 +444,36 @@ class Encoder:
         raise ValueError(f"Cannot encode {obj!r}")
 
     def _iter_model_items(
-        self, obj: pydantic.BaseModel
-    ) -> Iterable[Tuple[str, Any]]:
-        exclude, keep_nulls = self.exclude, self.keep_nulls
-        get_model_field = get_model_fields(obj).get
+        self, obj: pydantic.BaseModel, plan: ModelEncodingPlan
+    ) -> Iterable[Tuple[str, Optional[FieldEncodingPlan], Any]]:
+        exclude, include, keep_nulls = (
+            self.exclude,
+            self.include,
+            self.keep_nulls,
+        )
+        get_field_plan = plan.fields.get
         for key, value in obj.__iter__():
-            field_info = get_model_field(key)
-            if field_info is not None:
-                key = field_info.alias or key
-            if key not in exclude and (value is not None or keep_nulls):
-                yield key, value
-
-
-def _get_encoder(
-    obj: Any, custom_encoders: Mapping[type, SingleArgCallable]
-) -> Optional[SingleArgCallable]:
-    encoder = custom_encoders.get(type(obj))
-    if encoder is not None:
-        return encoder
-    for cls, encoder in custom_encoders.items():
-        if isinstance(obj, cls):
-            return encoder
-    return None
+            field = get_field_plan(key)
+            if field is not None:
+                key = field.key
+            if key in exclude or (value is None and not keep_nulls):
+                continue
+            if include is not None and key not in include:
+                continue
+            yield key, field, value
+
+
+def decode_uuid(value: Any) -> Any:
+    """
+    Convert the UUID binary value, read with the default codec options,
+    back to UUID. Other values are returned as is
+
+    :param value: Any - value read from the database
+    :return: Any
+    """
+    if isinstance(value, bson.Binary):
+        if value.subtype == bson.binary.UUID_SUBTYPE:
+            return value.as_uuid()
+        if value.subtype == bson.binary.OLD_UUID_SUBTYPE:
+            return value.as_uuid(bson.binary.UuidRepresentation.PYTHON_LEGACY)
+    return value
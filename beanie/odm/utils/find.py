@@ -1,6 +1,18 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
 from beanie.odm.fields import LinkInfo, LinkTypes
+from beanie.odm.utils.cascade import BACK_LINK_TYPES
 
 if TYPE_CHECKING:
     from beanie import Document
@@ -10,15 +22,81 @@ if TYPE_CHECKING:
 #  appending subqueries to the queries var
 
 
+def get_lookup_queries(
+    cls: Type["Document"],
+    nesting_depth: Optional[int] = None,
+    nesting_depths_per_field: Optional[Dict[str, int]] = None,
+    fields: Optional[Mapping[str, Optional[AbstractSet[str]]]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Get the lookup stages of the links of the document class.
+    The stages are built once per parameters and reused.
+    The returned list is a new one, but the stages are shared
+    and must not be changed
+
+    :param cls: Type[Document] - document class
+    :param nesting_depth: Optional[int] - nesting depth of all the links
+    :param nesting_depths_per_field: Optional[Dict[str, int]] - nesting
+    depths of the specific link fields
+    :param fields: Optional[Mapping[str, Optional[AbstractSet[str]]]] -
+    link fields to fetch with the paths of the linked documents fields
+    to project. See `construct_lookup_queries`
+    :return: List[Dict[str, Any]] - lookup stages
+    """
+    memo = cls._lookup_queries
+    if memo is None:
+        return construct_lookup_queries(
+            cls, nesting_depth, nesting_depths_per_field, fields
+        )
+    key: Tuple[Any, ...] = (
+        nesting_depth,
+        tuple(sorted(nesting_depths_per_field.items()))
+        if nesting_depths_per_field is not None
+        else None,
+    )
+    if fields is not None:
+        key += (
+            tuple(
+                sorted(
+                    (name, tuple(sorted(paths)) if paths is not None else None)
+                    for name, paths in fields.items()
+                )
+            ),
+        )
+    queries = memo.get(key)
+    if queries is None:
+        queries = construct_lookup_queries(
+            cls, nesting_depth, nesting_depths_per_field, fields
+        )
+        memo[key] = queries
+    return list(queries)
+
+
 def construct_lookup_queries(
     cls: Type["Document"],
     nesting_depth: Optional[int] = None,
     nesting_depths_per_field: Optional[Dict[str, int]] = None,
+    fields: Optional[Mapping[str, Optional[AbstractSet[str]]]] = None,
 ) -> List[Dict[str, Any]]:
+    """
+    Build the lookup stages of the links of the document class
+
+    :param cls: Type[Document] - document class
+    :param nesting_depth: Optional[int] - nesting depth of all the links
+    :param nesting_depths_per_field: Optional[Dict[str, int]] - nesting
+    depths of the specific link fields
+    :param fields: Optional[Mapping[str, Optional[AbstractSet[str]]]] -
+    link fields to fetch. Values are the paths of the linked documents
+    fields to project, or None to fetch the whole documents.
+    All the links are fetched, if not set
+    :return: List[Dict[str, Any]] - lookup stages
+    """
     queries: List = []
     link_fields = cls.get_link_fields()
     if link_fields is not None:
         for link_info in link_fields.values():
+            if fields is not None and link_info.field_name not in fields:
+                continue
             final_nesting_depth = (
                 nesting_depths_per_field.get(link_info.field_name, None)
                 if nesting_depths_per_field is not None
@@ -26,15 +104,54 @@ def construct_lookup_queries(
             )
             if final_nesting_depth is None:
                 final_nesting_depth = nesting_depth
+            start = len(queries)
             construct_query(
                 link_info=link_info,
                 queries=queries,
                 database_major_version=cls._database_major_version,
                 current_depth=final_nesting_depth,
             )
+            paths = (
+                fields.get(link_info.field_name)
+                if fields is not None
+                else None
+            )
+            if paths is not None and len(queries) > start:
+                project_lookup(
+                    queries[start]["$lookup"],
+                    paths,
+                    cls._database_major_version,
+                )
     return queries
 
 
+def project_lookup(
+    lookup: Dict[str, Any],
+    paths: AbstractSet[str],
+    database_major_version: int,
+) -> None:
+    """
+    Add the projection to the pipeline of the lookup stage
+
+    :param lookup: Dict[str, Any] - value of the `$lookup` stage
+    :param paths: AbstractSet[str] - paths of the fields to keep
+    :param database_major_version: int
+    :return: None
+    """
+    if "pipeline" not in lookup:
+        # Pipeline with localField and foreignField needs MongoDB 5.0
+        if database_major_version < 5:
+            return
+        lookup["pipeline"] = []
+    # Paths inside the other projected paths would collide with them
+    kept_paths = sorted(
+        path
+        for path in paths
+        if not any(path.startswith(f"{other}.") for other in paths)
+    )
+    lookup["pipeline"].append({"$project": {path: 1 for path in kept_paths}})
+
+
 def construct_query(
     link_info: LinkInfo,
     queries: List,
@@ -373,11 +490,11 @@ def construct_query(
 
 
 def split_text_query(
-    query: Dict[str, Any]
+    query: Mapping[str, Any]
 ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     """Divide query into text and non-text matches
 
-    :param query: Dict[str, Any] - query dict
+    :param query: Mapping[str, Any] - query dict
     :return: Tuple[Dict[str, Any], Dict[str, Any]] - text and non-text queries,
         respectively
     """
@@ -401,3 +518,208 @@ def split_text_query(
             non_text_queries.append(match_case)
 
     return text_queries, non_text_queries
+
+
+def get_link_field_names(cls: Type["Document"]) -> Set[str]:
+    """
+    Names of the link fields, as they are used in the queries
+    before and after the lookup stages
+
+    :param cls: Type[Document] - document class
+    :return: Set[str]
+    """
+    names: Set[str] = set()
+    for link_info in (cls.get_link_fields() or {}).values():
+        names.add(link_info.field_name)
+        names.add(link_info.lookup_field_name)
+    return names
+
+
+def lookups_keep_count(cls: Type["Document"]) -> bool:
+    """
+    If the lookup stages return one document per document.
+    Back links of the direct type are unwound, so they can
+    multiply the documents
+
+    :param cls: Type[Document] - document class
+    :return: bool
+    """
+    return not any(
+        link_info.is_fetchable
+        and link_info.link_type
+        in [LinkTypes.BACK_DIRECT, LinkTypes.OPTIONAL_BACK_DIRECT]
+        for link_info in (cls.get_link_fields() or {}).values()
+    )
+
+
+def get_query_paths(query: Mapping[str, Any]) -> Optional[Set[str]]:
+    """
+    Paths of the fields used by the match query
+
+    :param query: Mapping[str, Any] - match query
+    :return: Optional[Set[str]] - field paths or None if the query
+    contains operators, which can use any field, like `$expr`
+    """
+    paths: Set[str] = set()
+    for key, value in query.items():
+        if key in ("$and", "$or", "$nor"):
+            for sub_query in value:
+                sub_paths = get_query_paths(sub_query)
+                if sub_paths is None:
+                    return None
+                paths |= sub_paths
+        elif key.startswith("$"):
+            return None
+        else:
+            paths.add(key)
+    return paths
+
+
+def split_lookup_query(
+    queries: List[Dict[str, Any]], link_field_names: Set[str]
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Divide match queries into the ones, which use the local fields only
+    and can run before the lookup stages, and the ones which need
+    the linked documents. Top level `$and` and the implicit and of
+    the query keys are split
+
+    :param queries: List[Dict[str, Any]] - match queries
+    :param link_field_names: Set[str] - names of the link fields
+    :return: Tuple[List[Dict[str, Any]], List[Dict[str, Any]]] - local and
+        linked queries, respectively
+    """
+    local_queries: List[Dict[str, Any]] = []
+    linked_queries: List[Dict[str, Any]] = []
+
+    def split(query: Mapping[str, Any]) -> None:
+        for key, value in query.items():
+            if key == "$and":
+                for sub_query in value:
+                    split(sub_query)
+                continue
+            paths = get_query_paths({key: value})
+            if paths is None or any(
+                path.split(".", 1)[0] in link_field_names for path in paths
+            ):
+                linked_queries.append({key: value})
+            else:
+                local_queries.append({key: value})
+
+    for query in queries:
+        split(query)
+    return local_queries, linked_queries
+
+
+def merge_queries(queries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Join match queries with `$and`
+
+    :param queries: List[Dict[str, Any]] - not empty list of match queries
+    :return: Dict[str, Any]
+    """
+    return {"$and": queries} if len(queries) > 1 else queries[0]
+
+
+def get_fetched_link_fields(
+    cls: Type["Document"],
+    projection: Optional[Mapping[str, Any]],
+    queries: List[Dict[str, Any]],
+    sort_paths: List[str],
+) -> Optional[Dict[str, Optional[Set[str]]]]:
+    """
+    Link fields, which are used by the projection, match queries or sorting,
+    with the paths of the used linked documents fields.
+    Direct back links are always fetched, as they can multiply the documents
+
+    :param cls: Type[Document] - document class
+    :param projection: Optional[Mapping[str, Any]] - projection of the
+    results. All the fields are used, if it is None
+    :param queries: List[Dict[str, Any]] - non-text match queries
+    :param sort_paths: List[str] - sorted fields
+    :return: Optional[Dict[str, Optional[Set[str]]]] - field names with the
+    used paths or None for the whole documents. None, if all the links
+    are needed
+    """
+    if projection is None:
+        return None
+    link_fields = cls.get_link_fields() or {}
+    names: Dict[str, str] = {}
+    fields: Dict[str, Optional[Set[str]]] = {}
+    for link_info in link_fields.values():
+        names[link_info.field_name] = link_info.field_name
+        names[link_info.lookup_field_name] = link_info.field_name
+        if link_info.link_type in [
+            LinkTypes.BACK_DIRECT,
+            LinkTypes.OPTIONAL_BACK_DIRECT,
+        ]:
+            fields[link_info.field_name] = {"_id"}
+
+    def use(path: str) -> None:
+        head, _, sub_path = path.partition(".")
+        name = names.get(head)
+        if name is None:
+            return
+        if not sub_path or sub_path.startswith("$"):
+            fields[name] = None
+            return
+        paths = fields.setdefault(name, set())
+        if paths is not None:
+            paths.add(sub_path)
+
+    for key, value in projection.items():
+        if isinstance(value, str) and value.startswith("$"):
+            if value.startswith("$$"):
+                return None
+            use(value[1:])
+        elif isinstance(value, (bool, int, float)) and value:
+            use(key)
+        else:
+            # Exclusions and expressions can use any field
+            return None
+    for query in queries:
+        paths = get_query_paths(query)
+        if paths is None:
+            return None
+        for path in paths:
+            use(path)
+    for path in sort_paths:
+        use(path)
+    return fields
+
+
+def get_linked_document_paths(
+    cls: Type["Document"],
+    queries: List[Mapping[str, Any]],
+    sort_paths: List[str],
+) -> List[str]:
+    """
+    Paths of the match queries and sorting, which use the fields
+    of the linked documents. The references and their ids
+    are stored in the document itself, so they are not included
+
+    :param cls: Type[Document] - document class
+    :param queries: List[Mapping[str, Any]] - match queries
+    :param sort_paths: List[str] - sorted fields
+    :return: List[str]
+    """
+    link_infos: Dict[str, LinkInfo] = {}
+    for link_info in (cls.get_link_fields() or {}).values():
+        link_infos[link_info.field_name] = link_info
+        link_infos[link_info.lookup_field_name] = link_info
+    if not link_infos:
+        return []
+    paths = list(sort_paths)
+    for query in queries:
+        paths += get_query_paths(query) or []
+    linked_paths = []
+    for path in paths:
+        head, _, sub_path = path.partition(".")
+        if head not in link_infos:
+            continue
+        # Back links are not stored in the document at all
+        if link_infos[head].link_type in BACK_LINK_TYPES or (
+            sub_path and sub_path != "$id"
+        ):
+            linked_paths.append(path)
+    return linked_paths
@@ -4,6 +4,7 @@ import sys
 from beanie.odm.utils.pydantic import (
     IS_PYDANTIC_V2,
     get_extra_field_info,
+    get_field_type,
     get_model_fields,
     parse_model,
 )
@@ -34,9 +35,13 @@ from pydantic import BaseModel
 from pydantic.fields import FieldInfo
 from pymongo import IndexModel
 
-from beanie.exceptions import Deprecation, MongoDBVersionError
+from beanie.exceptions import (
+    CollectionWasNotInitialized,
+    Deprecation,
+    MongoDBVersionError,
+)
 from beanie.odm.actions import ActionRegistry
-from beanie.odm.cache import LRUCache
+from beanie.odm.cache import LRUCache, SharedCache
 from beanie.odm.documents import DocType, Document
 from beanie.odm.fields import (
     BackLink,
@@ -51,6 +56,14 @@ from beanie.odm.settings.document import DocumentSettings, IndexModelField
 from beanie.odm.settings.union_doc import UnionDocSettings
 from beanie.odm.settings.view import ViewSettings
 from beanie.odm.union_doc import UnionDoc
+from beanie.odm.utils.batch_loader import BatchLoader
+from beanie.odm.utils.encoder import (
+    compile_encoding_plan,
+    get_encoder_dispatch,
+)
+from beanie.odm.utils.find import get_lookup_queries
+from beanie.odm.utils.single_flight import SingleFlight
+from beanie.odm.utils.tracking import install_tracking, is_trackable_type
 from beanie.odm.views import View
 
 
@@ -131,6 +144,10 @@ class Initializer:
     def __await__(self):
         for model in self.document_models:
             yield from self.init_class(model).__await__()
+        # Lookups refer to the linked classes,
+        # so they are built when all the classes are inited
+        for cls in self.inited_classes:
+            self.init_lookup_queries(cls)
 
     # General
     def fill_docs_registry(self):
@@ -356,18 +373,55 @@ class Initializer:
         cls._inheritance_inited = False
         cls._class_id = None
         cls._link_fields = None
+        cls._encoding_plan = None
 
     @staticmethod
     def init_cache(cls) -> None:
         """
-        Init model's cache
+        Init model's cache, query coalescing and batching
         :return: None
         """
-        if cls.get_settings().use_cache:
-            cls._cache = LRUCache(
-                capacity=cls.get_settings().cache_capacity,
-                expiration_time=cls.get_settings().cache_expiration_time,
-            )
+        settings = cls.get_settings()
+        cls._single_flight = (
+            SingleFlight() if settings.coalesce_queries else None
+        )
+        cls._batch_loader = (
+            BatchLoader(cls, window=settings.batch_get_window.total_seconds())
+            if settings.batch_get
+            else None
+        )
+        if settings.use_cache:
+            if settings.cache_backend is not None:
+                collection = cls.get_motor_collection()
+                cls._cache = SharedCache(
+                    backend=settings.cache_backend,
+                    namespace=f"{collection.full_name}:"
+                    f"{cls.__module__}.{cls.__qualname__}",
+                    expiration_time=settings.cache_expiration_time,
+                    codec_options=collection.codec_options,
+                )
+            else:
+                cls._cache = LRUCache(
+                    capacity=settings.cache_capacity,
+                    expiration_time=settings.cache_expiration_time,
+                    max_size=settings.cache_max_bytes,
+                )
+
+    @staticmethod
+    def init_lookup_queries(cls) -> None:
+        """
+        Build the lookup stages of the links for the default nesting
+        :return: None
+        """
+        cls._lookup_queries = {}
+        if not cls.get_link_fields():
+            return
+        try:
+            get_lookup_queries(cls)
+        except CollectionWasNotInitialized:
+            # Linked documents are not inited yet,
+            # the stages will be built on the first query
+            pass
 
     def init_document_fields(self, cls) -> None:
         """
@@ -402,6 +456,32 @@ class Initializer:
 
         cls.check_hidden_fields()
 
+    @staticmethod
+    def init_encoding_plan(cls) -> None:
+        """
+        Compile the BSON encoding plan of the document class
+        :return: None
+        """
+        bson_encoders = cls.get_settings().bson_encoders
+        if bson_encoders:
+            get_encoder_dispatch(bson_encoders).invalidate()
+        cls._encoding_plan = compile_encoding_plan(cls, bson_encoders)
+
+    @staticmethod
+    def init_state_management(cls) -> None:
+        """
+        Init the tracking of the changes, if it is turned on
+        :return: None
+        """
+        if not cls.get_settings().state_management_track_changes:
+            return
+        install_tracking(cls)
+        cls._untrackable_fields = frozenset(
+            name
+            for name, field in get_model_fields(cls).items()
+            if not is_trackable_type(get_field_type(field))
+        )
+
     @staticmethod
     def init_actions(cls):
         """
@@ -589,6 +669,8 @@ class Initializer:
             await self.init_document_collection(cls)
             await self.init_indexes(cls, self.allow_index_dropping)
             self.init_document_fields(cls)
+            self.init_state_management(cls)
+            self.init_encoding_plan(cls)
             self.init_cache(cls)
             self.init_actions(cls)
 
@@ -663,6 +745,7 @@ class Initializer:
         self.init_view_collection(cls)
         self.init_view_fields(cls)
         self.init_cache(cls)
+        cls.register_source()
 
         collection_names = await self.database.list_collection_names(
             authorizedCollections=True, nameOnly=True
@@ -694,6 +777,7 @@ class Initializer:
 
         cls._settings.motor_db = self.database
         cls._settings.motor_collection = self.database[cls._settings.name]
+        self.init_cache(cls)
         cls._is_inited = True
 
     # Deprecations
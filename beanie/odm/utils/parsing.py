@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Dict, Type, Union
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Type, Union
 
 from pydantic import BaseModel
 
@@ -9,6 +9,8 @@ from beanie.exceptions import (
 )
 from beanie.odm.interfaces.detector import ModelType
 from beanie.odm.utils.pydantic import get_config_value, parse_model
+from beanie.odm.utils.raw_bson import as_raw_document
+from beanie.odm.utils.state import make_snapshot
 
 if TYPE_CHECKING:
     from beanie.odm.documents import Document
@@ -104,7 +106,7 @@ def parse_obj(
         if model._document_models is None:  # type: ignore
             raise UnionHasNoRegisteredDocs
 
-        if isinstance(data, dict):
+        if isinstance(data, Mapping):
             class_name = data[model.get_settings().class_id]  # type: ignore
         else:
             class_name = data._class_id
@@ -121,7 +123,7 @@ def parse_obj(
         and model.get_model_type() == ModelType.Document  # type: ignore
         and model._inheritance_inited  # type: ignore
     ):
-        if isinstance(data, dict):
+        if isinstance(data, Mapping):
             class_name = data.get(model.get_settings().class_id)  # type: ignore
         elif hasattr(data, model.get_settings().class_id):  # type: ignore
             class_name = data._class_id
@@ -140,8 +142,11 @@ def parse_obj(
         and hasattr(model, "get_model_type")
         and model.get_model_type() == ModelType.Document  # type: ignore
     ):
-        o = model.lazy_parse(data, {"_id"})  # type: ignore
-        o._saved_state = {"_id": o.id}
+        o = model.lazy_parse(as_raw_document(data), {"_id"})  # type: ignore
+        o._saved_state = make_snapshot(
+            {"_id": o.id},
+            model.get_settings().state_management_snapshot,  # type: ignore
+        )
         return o
     result = parse_model(model, data)
     save_state(result)
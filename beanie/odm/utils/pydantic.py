@@ -25,6 +25,13 @@ def get_field_type(field):
         return field.outer_type_
 
 
+def get_field_default(field):
+    if IS_PYDANTIC_V2:
+        return field.get_default(call_default_factory=True)
+    else:
+        return field.get_default()
+
+
 def get_model_fields(model):
     if IS_PYDANTIC_V2:
         return model.model_fields
@@ -60,3 +67,10 @@ def get_model_dump(model, *args, **kwargs):
         return model.model_dump(*args, **kwargs)
     else:
         return model.dict(*args, **kwargs)
+
+
+def get_model_copy(model, *args, **kwargs):
+    if IS_PYDANTIC_V2:
+        return model.model_copy(*args, **kwargs)
+    else:
+        return model.copy(*args, **kwargs)
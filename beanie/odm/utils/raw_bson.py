@@ -0,0 +1,97 @@
+from typing import Any, ItemsView, ValuesView
+
+from bson import DBRef
+from bson.binary import UuidRepresentation
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+
+def get_raw_collection(
+    collection: AsyncIOMotorCollection,
+) -> AsyncIOMotorCollection:
+    """
+    Get the same collection, which returns `RawDocument` objects.
+    Raw documents decode their top level fields on the first access only
+
+    :param collection: AsyncIOMotorCollection
+    :return: AsyncIOMotorCollection
+    """
+    return collection.with_options(
+        codec_options=collection.codec_options.with_options(
+            document_class=RawDocument
+        )
+    )
+
+
+class RawDocument(RawBSONDocument):
+    """
+    Raw document, which returns the values of its fields decoded.
+    Embedded documents of the field are decoded to dicts, when the field
+    is accessed, so they are mutable and work as the usual values
+    """
+
+    def __getitem__(self, item: str) -> Any:
+        return decode_raw(super().__getitem__(item))
+
+    def items(self) -> ItemsView[str, Any]:  # type: ignore[override]
+        return {key: self[key] for key in self}.items()
+
+    def values(self) -> ValuesView[Any]:  # type: ignore[override]
+        return {key: self[key] for key in self}.values()
+
+
+def as_raw_document(value: Any) -> Any:
+    """
+    Wrap the raw BSON document to the `RawDocument`.
+    Other values are returned as is
+
+    :param value: Any
+    :return: Any
+    """
+    if isinstance(value, RawBSONDocument) and not isinstance(
+        value, RawDocument
+    ):
+        return RawDocument(
+            value.raw,
+            CodecOptions(
+                document_class=RawDocument,
+                uuid_representation=UuidRepresentation.STANDARD,
+            ),
+        )
+    return value
+
+
+def decode_raw(value: Any) -> Any:
+    """
+    Decode the embedded raw documents of the value recursively.
+    References are converted to `DBRef`
+
+    :param value: Any
+    :return: Any
+    """
+    if isinstance(value, RawBSONDocument):
+        value = decode_dbref(value)
+        if isinstance(value, DBRef):
+            return value
+        return {key: decode_raw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [decode_raw(item) for item in value]
+    return value
+
+
+def decode_dbref(value: Any) -> Any:
+    """
+    Raw documents keep the embedded references as raw documents too.
+    Convert such references to `DBRef`, other values are returned as is
+
+    :param value: Any
+    :return: Any
+    """
+    if (
+        isinstance(value, RawBSONDocument)
+        and "$ref" in value
+        and "$id" in value
+    ):
+        return DBRef(value["$ref"], value["$id"], value.get("$db"))
+    return value
@@ -0,0 +1,56 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls.
+    While the call with some key is in flight,
+    the other calls with the same key wait for its result
+    instead of running the function again.
+    """
+
+    def __init__(self) -> None:
+        self.calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(
+        self, key: Hashable, func: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, bool]:
+        """
+        Run the function or wait for the running call with the same key
+
+        :param key: Hashable - key of the call
+        :param func: Callable[[], Awaitable[Any]] - function to run
+        :return: Tuple[Any, bool] - result and if it was shared
+        with another call
+        """
+        future = self.calls.get(key)
+        if (
+            future is not None
+            and future.get_loop() is asyncio.get_running_loop()
+        ):
+            try:
+                return await asyncio.shield(future), True
+            except asyncio.CancelledError:
+                # The leading call was cancelled, not this one
+                if not future.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self.calls[key] = future
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved, there could be no waiters
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            if self.calls.get(key) is future:
+                del self.calls[key]
@@ -1,10 +1,32 @@
+import datetime
+import decimal
+import enum
+import hashlib
 import inspect
+import sys
+import typing
+import uuid
 from functools import wraps
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, Any, Dict, Tuple, TypeVar, Union
 
+import bson
+import typing_extensions
+from bson.binary import UuidRepresentation
+from bson.codec_options import CodecOptions
 from typing_extensions import ParamSpec
 
 from beanie.exceptions import StateManagementIsTurnedOff, StateNotSaved
+from beanie.odm.enums import StateSnapshot
+
+if sys.version_info >= (3, 8):
+    from typing import get_args, get_origin
+else:
+    from typing_extensions import get_args, get_origin
+
+if sys.version_info >= (3, 10):
+    from types import UnionType as TypesUnionType
+else:
+    TypesUnionType = ()
 
 if TYPE_CHECKING:
     from beanie.odm.documents import AnyDocMethod, AsyncDocMethod, DocType
@@ -12,6 +34,163 @@ if TYPE_CHECKING:
 P = ParamSpec("P")
 R = TypeVar("R")
 
+# Values of these types can be changed by the field assignment only
+IMMUTABLE_TYPES = (
+    type(None),
+    str,
+    int,
+    float,
+    bytes,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    decimal.Decimal,
+    uuid.UUID,
+    enum.Enum,
+    bson.ObjectId,
+    bson.Decimal128,
+)
+
+LITERAL_TYPES = (
+    typing_extensions.Literal,
+    getattr(typing, "Literal", typing_extensions.Literal),
+)
+
+
+def is_flat_type(annotation: Any) -> bool:
+    """
+    Check if the values of the annotated field can be changed
+    by the field assignment only
+
+    :param annotation: Any - annotation of the field
+    :return: bool
+    """
+    origin = get_origin(annotation)
+    if origin in LITERAL_TYPES:
+        return True
+    if origin is Union or origin is TypesUnionType:
+        return all(is_flat_type(arg) for arg in get_args(annotation))
+    return (
+        origin is None
+        and inspect.isclass(annotation)
+        and issubclass(annotation, IMMUTABLE_TYPES)
+    )
+
+
+# The state keeps the native UUID values, as the encoder does
+STATE_CODEC_OPTIONS: CodecOptions = CodecOptions(
+    uuid_representation=UuidRepresentation.STANDARD
+)
+
+
+def hash_value(value: Any) -> str:
+    """
+    Hash of the encoded value
+    :param value: Any - BSON compatible value
+    :return: str
+    """
+    return hashlib.blake2b(
+        bson.encode({"v": value}, codec_options=STATE_CODEC_OPTIONS),
+        digest_size=16,
+    ).hexdigest()
+
+
+def make_snapshot(
+    state: Dict[str, Any], snapshot: StateSnapshot
+) -> Union[Dict[str, Any], bytes]:
+    """
+    Convert the encoded state of the document to the snapshot
+    :param state: Dict[str, Any] - encoded state
+    :param snapshot: StateSnapshot - snapshot representation
+    :return: Union[Dict[str, Any], bytes] - the state itself,
+    its BSON bytes or the hashes of its fields
+    """
+    if snapshot == StateSnapshot.BSON:
+        return bson.encode(state, codec_options=STATE_CODEC_OPTIONS)
+    if snapshot == StateSnapshot.HASH:
+        return {key: hash_value(value) for key, value in state.items()}
+    return state
+
+
+def read_snapshot(saved: Union[Dict[str, Any], bytes]) -> Dict[str, Any]:
+    """
+    Read the values of the snapshot.
+    Hash snapshots return the hashes of the fields
+    :param saved: Union[Dict[str, Any], bytes] - snapshot
+    :return: Dict[str, Any]
+    """
+    if isinstance(saved, bytes):
+        return bson.decode(saved, codec_options=STATE_CODEC_OPTIONS)
+    return saved
+
+
+def normalize_state(
+    state: Dict[str, Any], snapshot: StateSnapshot
+) -> Dict[str, Any]:
+    """
+    Convert the encoded state to be comparable with the values
+    of the snapshot: BSON snapshots lose the precision of datetimes
+    and the time zones, hash snapshots keep the hashes only
+    :param state: Dict[str, Any] - encoded state
+    :param snapshot: StateSnapshot - snapshot representation
+    :return: Dict[str, Any]
+    """
+    if snapshot == StateSnapshot.BSON:
+        return bson.decode(
+            bson.encode(state, codec_options=STATE_CODEC_OPTIONS),
+            codec_options=STATE_CODEC_OPTIONS,
+        )
+    if snapshot == StateSnapshot.HASH:
+        return {key: hash_value(value) for key, value in state.items()}
+    return state
+
+
+def get_state_path(
+    state: Dict[str, Any], path: Tuple[str, ...]
+) -> Tuple[bool, Any]:
+    """
+    Get the value of the encoded state by the path of the keys
+    :param state: Dict[str, Any] - encoded state
+    :param path: Tuple[str, ...] - keys of the dicts and indexes of the lists
+    :return: Tuple[bool, Any] - if the path was found and its value
+    """
+    value: Any = state
+    for key in path:
+        if isinstance(value, dict) and key in value:
+            value = value[key]
+        elif (
+            isinstance(value, list) and key.isdigit() and int(key) < len(value)
+        ):
+            value = value[int(key)]
+        else:
+            return False, None
+    return True, value
+
+
+def set_state_path(state: Any, path: Tuple[str, ...], value: Any) -> Any:
+    """
+    Copy of the encoded state with the value set by the path.
+    Only the dicts and the lists along the path are copied
+    :param state: Any - encoded state
+    :param path: Tuple[str, ...] - keys of the dicts and indexes of the lists
+    :param value: Any - value to set
+    :return: Any - updated copy
+    :raises KeyError: if the parent of the value is not in the state
+    """
+    if not path:
+        return value
+    key, rest = path[0], path[1:]
+    if isinstance(state, list):
+        index = int(key)
+        new_list = list(state)
+        new_list[index] = set_state_path(state[index], rest, value)
+        return new_list
+    if not isinstance(state, dict) or (rest and key not in state):
+        raise KeyError(key)
+    new_dict = dict(state)
+    new_dict[key] = set_state_path(state.get(key), rest, value)
+    return new_dict
+
 
 def check_if_state_saved(self: "DocType"):
     if not self.use_state_management():
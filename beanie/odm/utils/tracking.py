@@ -0,0 +1,486 @@
+import inspect
+import sys
+import weakref
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+import pydantic
+
+import beanie
+from beanie.odm.utils.encoder import (
+    get_document_encoding_plan,
+    get_encoder_dispatch,
+    get_encoding_plan,
+)
+from beanie.odm.utils.pydantic import (
+    IS_PYDANTIC_V2,
+    get_field_type,
+    get_model_fields,
+)
+from beanie.odm.utils.state import (
+    IMMUTABLE_TYPES,
+    LITERAL_TYPES,
+    is_flat_type,
+)
+
+if sys.version_info >= (3, 8):
+    from typing import get_args, get_origin
+else:
+    from typing_extensions import get_args, get_origin
+
+if sys.version_info >= (3, 10):
+    from types import UnionType as TypesUnionType
+else:
+    TypesUnionType = ()
+
+# Path of the value from the document: names of the fields,
+# indexes of the list items and keys of the dict items
+Path = Tuple[Hashable, ...]
+PathT = TypeVar("PathT", bound=Tuple[Hashable, ...])
+
+# Parent of the value and the key of the value in it.
+# Items of the lists have no keys, they are found by their identity
+ParentRef = Tuple["weakref.ref[Any]", Optional[Hashable]]
+
+# BSON documents can't be nested deeper
+MAX_PATH_LENGTH = 100
+
+# Parents of the tracked nested models by their ids.
+# Models keep no attributes besides the fields,
+# so the parents are kept aside while the models are alive
+_model_parents: Dict[int, Tuple["weakref.ref[Any]", List[ParentRef]]] = {}
+
+
+class TrackedList(list):
+    """
+    List, which reports its changes to the document
+    """
+
+    __slots__ = ("_parents", "__weakref__")
+
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        self._parents: List[ParentRef] = []
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        # copies are plain lists, which are not tracked
+        return list, (list(self),)
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if isinstance(index, slice):
+            super().__setitem__(index, [track(item, self) for item in value])
+            mark_changed(self, ())
+        else:
+            super().__setitem__(index, track(value, self))
+            if index < 0:
+                index += len(self)
+            mark_changed(self, (index,))
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        mark_changed(self, ())
+
+    def __iadd__(self, values: Any) -> "TrackedList":  # type: ignore
+        self.extend(values)
+        return self
+
+    def __imul__(self, count: Any) -> "TrackedList":  # type: ignore
+        super().__imul__(count)
+        mark_changed(self, ())
+        return self
+
+    def append(self, value: Any) -> None:
+        super().append(track(value, self))
+        mark_changed(self, ())
+
+    def extend(self, values: Any) -> None:
+        super().extend([track(value, self) for value in values])
+        mark_changed(self, ())
+
+    def insert(self, index: Any, value: Any) -> None:
+        super().insert(index, track(value, self))
+        mark_changed(self, ())
+
+    def pop(self, *args: Any) -> Any:
+        value = super().pop(*args)
+        mark_changed(self, ())
+        return value
+
+    def remove(self, value: Any) -> None:
+        super().remove(value)
+        mark_changed(self, ())
+
+    def clear(self) -> None:
+        super().clear()
+        mark_changed(self, ())
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        mark_changed(self, ())
+
+    def reverse(self) -> None:
+        super().reverse()
+        mark_changed(self, ())
+
+
+class TrackedDict(dict):
+    """
+    Dict, which reports its changes to the document
+    """
+
+    __slots__ = ("_parents", "__weakref__")
+
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        self._parents: List[ParentRef] = []
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        # copies are plain dicts, which are not tracked
+        return dict, (dict(self),)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, track(value, self, key))
+        mark_changed(self, (key,))
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        mark_changed(self, ())
+
+    def __ior__(self, values: Any) -> "TrackedDict":  # type: ignore
+        self.update(values)
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            super().__setitem__(key, track(value, self, key))
+        mark_changed(self, ())
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, *args: Any) -> Any:
+        value = super().pop(*args)
+        mark_changed(self, ())
+        return value
+
+    def popitem(self) -> Any:
+        item = super().popitem()
+        mark_changed(self, ())
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        mark_changed(self, ())
+
+
+def _is_nested_model(value: Any) -> bool:
+    return (
+        isinstance(value, pydantic.BaseModel)
+        and not isinstance(value, beanie.Document)
+        and not (IS_PYDANTIC_V2 and isinstance(value, pydantic.RootModel))
+    )
+
+
+def _add_parent(
+    parents: List[ParentRef], parent: Any, key: Optional[Hashable]
+) -> None:
+    for parent_ref, parent_key in parents:
+        if parent_ref() is parent and parent_key == key:
+            return
+    parents.append((weakref.ref(parent), key))
+
+
+def track(value: Any, parent: Any, key: Optional[Hashable] = None) -> Any:
+    """
+    Make the changes of the nested models, lists and dicts
+    to be reported to the parent. Lists and dicts are replaced
+    with the tracked ones, other values are returned as is
+
+    :param value: Any - value of the field or of the item
+    :param parent: Any - model, list or dict, which keeps the value
+    :param key: Optional[Hashable] - field name or dict key of the value
+    :return: Any - value to keep in the parent
+    """
+    value_type = type(value)
+    if value_type in IMMUTABLE_TYPES:
+        return value
+    if value_type is TrackedList or value_type is TrackedDict:
+        _add_parent(value._parents, parent, key)
+        return value
+    if value_type is list:
+        tracked_list = TrackedList(value)
+        tracked_list._parents.append((weakref.ref(parent), key))
+        for index, item in enumerate(value):
+            tracked_item = track(item, tracked_list)
+            if tracked_item is not item:
+                list.__setitem__(tracked_list, index, tracked_item)
+        return tracked_list
+    if value_type is dict:
+        tracked_dict = TrackedDict(value)
+        tracked_dict._parents.append((weakref.ref(parent), key))
+        for item_key, item in value.items():
+            tracked_item = track(item, tracked_dict, item_key)
+            if tracked_item is not item:
+                dict.__setitem__(tracked_dict, item_key, tracked_item)
+        return tracked_dict
+    if _is_nested_model(value):
+        entry = _model_parents.get(id(value))
+        if entry is not None and entry[0]() is value:
+            _add_parent(entry[1], parent, key)
+            return value
+        install_tracking(value_type)
+        model_id = id(value)
+        _model_parents[model_id] = (
+            weakref.ref(value, lambda _: _model_parents.pop(model_id, None)),
+            [(weakref.ref(parent), key)],
+        )
+        track_fields(value)
+    return value
+
+
+def track_fields(model: pydantic.BaseModel) -> None:
+    """
+    Track the values of all the fields of the model or document
+
+    :param model: BaseModel - model or document
+    :return: None
+    """
+    values = model.__dict__
+    for name, value in list(values.items()):
+        tracked_value = track(value, model, name)
+        if tracked_value is not value:
+            values[name] = tracked_value
+
+
+def _get_parents(value: Any) -> List[ParentRef]:
+    if type(value) is TrackedList or type(value) is TrackedDict:
+        return value._parents
+    entry = _model_parents.get(id(value))
+    if entry is None or entry[0]() is not value:
+        return []
+    return entry[1]
+
+
+def _find_keys(
+    parent: Any, key: Optional[Hashable], value: Any
+) -> List[Hashable]:
+    if type(parent) is TrackedList:
+        return [index for index, item in enumerate(parent) if item is value]
+    if type(parent) is TrackedDict:
+        if key in parent and parent[key] is value:
+            return [key]
+        return [item_key for item_key, item in parent.items() if item is value]
+    if parent.__dict__.get(key) is value:
+        return [key]  # type: ignore
+    return []
+
+
+def mark_changed(value: Any, path: Path) -> None:
+    """
+    Report the changed path of the value to the documents, which keep it.
+    The values, which were moved away, are not reported anymore
+
+    :param value: Any - changed model, list or dict
+    :param path: Path - path of the change from the value
+    :return: None
+    """
+    if isinstance(value, beanie.Document):
+        changed_paths = value._changed_paths
+        if changed_paths is not None:
+            changed_paths.add(path)
+        return
+    if len(path) >= MAX_PATH_LENGTH:
+        return
+    parents = _get_parents(value)
+    for parent_ref, key in list(parents):
+        parent = parent_ref()
+        keys = [] if parent is None else _find_keys(parent, key, value)
+        if not keys:
+            parents.remove((parent_ref, key))
+        for parent_key in keys:
+            mark_changed(parent, (parent_key,) + path)
+
+
+def _is_tracked(model: pydantic.BaseModel) -> bool:
+    if isinstance(model, beanie.Document):
+        return model._changed_paths is not None
+    entry = _model_parents.get(id(model))
+    return entry is not None and entry[0]() is model
+
+
+def _tracking_setattr(
+    setattr_: Callable[[Any, str, Any], None]
+) -> Callable[[Any, str, Any], None]:
+    def __setattr__(self: Any, name: str, value: Any) -> None:
+        setattr_(self, name, value)
+        if not name.startswith("_") and _is_tracked(self):
+            values = self.__dict__
+            if name in values:
+                field_value = values[name]
+                tracked_value = track(field_value, self, name)
+                if tracked_value is not field_value:
+                    values[name] = tracked_value
+            mark_changed(self, (name,))
+
+    __setattr__.tracks_changes = True  # type: ignore
+    return __setattr__
+
+
+def install_tracking(cls: type) -> None:
+    """
+    Make the field assignments of the model or document class
+    to be reported, when its instances are tracked
+
+    :param cls: type - model or document class
+    :return: None
+    """
+    setattr_ = cls.__setattr__
+    if not getattr(setattr_, "tracks_changes", False):
+        cls.__setattr__ = _tracking_setattr(setattr_)  # type: ignore
+
+
+def _collapse_paths(paths: Iterable[PathT]) -> List[PathT]:
+    # the changes of the nested values are included in the changes of
+    # the values, which contain them
+    collapsed: Set[PathT] = set()
+    for path in sorted(paths, key=len):
+        if not any(
+            path[:length] in collapsed for length in range(1, len(path))
+        ):
+            collapsed.add(path)
+    return list(collapsed)
+
+
+def resolve_paths(
+    document: "beanie.Document", paths: Iterable[Path], keep_nulls: bool
+) -> Dict[Tuple[str, ...], Any]:
+    """
+    Get the values of the changed paths and convert the paths to
+    the database keys. The paths are cut at the values, which are
+    encoded as a whole: values with the custom encoders, dicts with
+    the keys, which can't be used in the paths, and the models,
+    whose fields are changed to null, when the nulls are not kept.
+    The paths, which are not in the document anymore, are cut too
+
+    :param document: Document - document with the changes
+    :param paths: Iterable[Path] - changed paths
+    :param keep_nulls: bool - if the nulls are kept by the encoder
+    :return: Dict[Tuple[str, ...], Any] - values by the paths of keys
+    """
+    plan = get_document_encoding_plan(type(document))
+    custom_dispatch = (
+        get_encoder_dispatch(plan.custom_encoders)
+        if plan.custom_encoders
+        else None
+    )
+    resolved: Dict[Tuple[str, ...], Any] = {}
+    for path in _collapse_paths(paths):
+        value: Any = document
+        keys: List[str] = []
+        for part in path:
+            if (
+                keys
+                and custom_dispatch is not None
+                and custom_dispatch.get(type(value)) is not None
+            ):
+                break
+            if isinstance(value, pydantic.BaseModel):
+                if not isinstance(part, str) or not hasattr(value, part):
+                    break
+                item = getattr(value, part)
+                if item is None and keys and not keep_nulls:
+                    break
+                fields = (
+                    plan.fields
+                    if value is document
+                    else get_encoding_plan(type(value)).fields
+                )
+                field = fields.get(part)
+                key = field.key if field is not None else part
+            elif isinstance(value, list):
+                if not isinstance(part, int) or not 0 <= part < len(value):
+                    break
+                item = value[part]
+                key = str(part)
+            elif isinstance(value, dict):
+                if (
+                    not isinstance(part, str)
+                    or part not in value
+                    or "." in part
+                    or part.startswith("$")
+                ):
+                    break
+                item = value[part]
+                key = part
+            else:
+                break
+            keys.append(key)
+            value = item
+        if keys:
+            resolved[tuple(keys)] = value
+    return {path: resolved[path] for path in _collapse_paths(resolved)}
+
+
+def is_trackable_type(
+    annotation: Any, models: Optional[Set[type]] = None
+) -> bool:
+    """
+    Check if the changes of the annotated values can be tracked:
+    they are immutable or nested models, lists and dicts of such values
+
+    :param annotation: Any - annotation of the field
+    :param models: Optional[Set[type]] - models, which are checked already
+    :return: bool
+    """
+    if models is None:
+        models = set()
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin in LITERAL_TYPES:
+        return True
+    if origin is Union or origin is TypesUnionType:
+        return all(is_trackable_type(arg, models) for arg in args)
+    if origin is list:
+        return len(args) == 1 and is_trackable_type(args[0], models)
+    if origin is dict:
+        return len(args) == 2 and is_trackable_type(args[1], models)
+    if origin is tuple:
+        # the items of the tuples are not tracked
+        return bool(args) and all(
+            arg is Ellipsis or is_flat_type(arg) for arg in args
+        )
+    if origin is not None:
+        # links keep the references only
+        return inspect.isclass(origin) and issubclass(
+            origin, (beanie.Link, beanie.BackLink)
+        )
+    if not inspect.isclass(annotation):
+        return False
+    if issubclass(annotation, IMMUTABLE_TYPES):
+        return True
+    if (
+        not issubclass(annotation, pydantic.BaseModel)
+        or issubclass(annotation, beanie.Document)
+        or (IS_PYDANTIC_V2 and issubclass(annotation, pydantic.RootModel))
+    ):
+        return False
+    if annotation in models:
+        return True
+    models.add(annotation)
+    return all(
+        is_trackable_type(get_field_type(field), models)
+        for field in get_model_fields(annotation).values()
+    )
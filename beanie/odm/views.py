@@ -1,15 +1,18 @@
 import asyncio
-from typing import Any, ClassVar, Dict, Optional, Union
+from typing import Any, ClassVar, Dict, List, Optional, Type, Union
 
 from pydantic import BaseModel
 
 from beanie.exceptions import ViewWasNotInitialized
+from beanie.odm.cache import DocumentCache, invalidate_cached
 from beanie.odm.fields import Link, LinkInfo
 from beanie.odm.interfaces.aggregate import AggregateInterface
 from beanie.odm.interfaces.detector import DetectionInterface, ModelType
 from beanie.odm.interfaces.find import FindInterface
 from beanie.odm.interfaces.getters import OtherGettersInterface
 from beanie.odm.settings.view import ViewSettings
+from beanie.odm.utils.batch_loader import BatchLoader
+from beanie.odm.utils.single_flight import SingleFlight
 
 
 class View(
@@ -29,6 +32,15 @@ class View(
 
     # Relations
     _link_fields: ClassVar[Optional[Dict[str, LinkInfo]]] = None
+    _lookup_queries: ClassVar[Optional[Dict[Any, List[Dict[str, Any]]]]] = None
+
+    # Cache, query coalescing and batching
+    _cache: ClassVar[Optional[DocumentCache]] = None
+    _single_flight: ClassVar[Optional[SingleFlight]] = None
+    _batch_loader: ClassVar[Optional[BatchLoader]] = None
+
+    # Views by the full names of their source collections
+    _source_views: ClassVar[Dict[str, Dict[Type["View"], None]]] = {}
 
     # Settings
     _settings: ClassVar[ViewSettings]
@@ -69,3 +81,44 @@ class View(
     @classmethod
     def get_model_type(cls) -> ModelType:
         return ModelType.View
+
+    @classmethod
+    def register_source(cls) -> None:
+        """
+        Register the view to be invalidated on the writes
+        to its source collection
+
+        :return: None
+        """
+        database = cls.get_motor_collection().database
+        source = f"{database.name}.{cls.get_settings().source}"
+        View._source_views.setdefault(source, {})[cls] = None
+
+    @staticmethod
+    async def invalidate_source_caches(
+        source: str, on_write: bool = False
+    ) -> None:
+        """
+        Invalidate cached results of the views of the collection.
+        The views of these views are invalidated too.
+        The pipeline could change the ids, so all the cache is invalidated
+
+        :param source: str - full name of the source collection
+        :param on_write: bool - invalidate only the views
+        with `cache_invalidate_on_write` setting
+        :return: None
+        """
+        sources = [source]
+        visited = set()
+        while sources:
+            for view in View._source_views.get(sources.pop(), {}):
+                if view in visited:
+                    continue
+                visited.add(view)
+                if view._cache is not None and (
+                    not on_write
+                    or view.get_settings().cache_invalidate_on_write
+                ):
+                    await invalidate_cached(view._cache)
+                collection = view.get_motor_collection()
+                sources.append(f"{collection.database.name}.{collection.name}")
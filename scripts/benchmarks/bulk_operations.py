@@ -0,0 +1,101 @@
+"""
+Compare the per-operation overhead of the bulk writer records
+with the pydantic models used before.
+
+Usage:
+    python scripts/benchmarks/bulk_operations.py [number]
+
+Only the collecting of the operations and building of the pymongo
+requests is measured, MongoDB is not needed.
+"""
+import sys
+import time
+from typing import Any, Dict, Mapping, Optional, Type, Union
+
+from bson import ObjectId
+from pydantic import BaseModel, Field
+from pymongo import (
+    DeleteMany,
+    DeleteOne,
+    InsertOne,
+    ReplaceOne,
+    UpdateMany,
+    UpdateOne,
+)
+
+from beanie import Document
+from beanie.odm.bulk import Operation
+from beanie.odm.utils.pydantic import IS_PYDANTIC_V2
+
+if IS_PYDANTIC_V2:
+    from pydantic import ConfigDict
+
+
+class PydanticOperation(BaseModel):
+    operation: Union[
+        Type[InsertOne],
+        Type[DeleteOne],
+        Type[DeleteMany],
+        Type[ReplaceOne],
+        Type[UpdateOne],
+        Type[UpdateMany],
+    ]
+    first_query: Mapping[str, Any]
+    second_query: Optional[Dict[str, Any]] = None
+    pymongo_kwargs: Dict[str, Any] = Field(default_factory=dict)
+    object_class: Type
+
+    if IS_PYDANTIC_V2:
+        model_config = ConfigDict(
+            arbitrary_types_allowed=True,
+        )
+    else:
+
+        class Config:
+            arbitrary_types_allowed = True
+
+
+class Sample(Document):
+    num: int
+
+
+def to_request(op: Any) -> Any:
+    if op.operation in (InsertOne, DeleteOne):
+        return op.operation(op.first_query, **op.pymongo_kwargs)
+    return op.operation(op.first_query, op.second_query, **op.pymongo_kwargs)
+
+
+def run(operation_class: Type, number: int) -> float:
+    queries = [
+        (UpdateOne, {"_id": ObjectId()}, {"$set": {"num": i}})
+        for i in range(1000)
+    ]
+    start = time.perf_counter()
+    for _ in range(number // len(queries)):
+        operations = [
+            operation_class(
+                operation=operation,
+                first_query=first_query,
+                second_query=second_query,
+                object_class=Sample,
+            )
+            for operation, first_query, second_query in queries
+        ]
+        [to_request(op) for op in operations]
+    return time.perf_counter() - start
+
+
+def main(number: int = 1_000_000):
+    for name, operation_class in (
+        ("pydantic", PydanticOperation),
+        ("slots", Operation),
+    ):
+        elapsed = run(operation_class, number)
+        print(
+            f"{name:>9}: {elapsed:.2f} s for {number} operations, "
+            f"{elapsed / number * 1e6:.2f} us per operation"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
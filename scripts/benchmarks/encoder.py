@@ -0,0 +1,131 @@
+"""
+Compare the compiled encoding plans with the generic per-value dispatch.
+
+Usage:
+    python scripts/benchmarks/encoder.py [mongodb_dsn]
+
+MongoDB is needed only for the `init_beanie` call.
+"""
+import asyncio
+import datetime
+import sys
+import timeit
+from enum import Enum
+from typing import Any, List, Mapping, Optional
+from uuid import UUID, uuid4
+
+import pydantic
+from motor.motor_asyncio import AsyncIOMotorClient
+from pydantic import BaseModel
+
+from beanie import Document, init_beanie
+from beanie.odm.utils.encoder import Encoder
+from beanie.odm.utils.pydantic import get_model_fields
+
+
+class Status(str, Enum):
+    NEW = "NEW"
+    DONE = "DONE"
+
+
+class LineItem(BaseModel):
+    sku: str
+    quantity: int
+    price: float
+
+
+class Address(BaseModel):
+    city: str
+    street: str
+    zip_code: Optional[str] = None
+
+
+class Order(Document):
+    number: int
+    status: Status
+    customer_id: UUID
+    created_at: datetime.datetime
+    comment: Optional[str] = None
+    address: Address
+    items: List[LineItem]
+    tags: List[str]
+
+
+class GenericEncoder(Encoder):
+    """
+    Encoder without encoding plans - every key and value goes
+    through the generic type dispatch.
+    """
+
+    def _encode_document(self, obj: Document) -> Mapping[str, Any]:
+        obj.parse_store()
+        settings = obj.get_settings()
+        sub_encoder = GenericEncoder(
+            custom_encoders=settings.bson_encoders,
+            to_db=self.to_db,
+            keep_nulls=self.keep_nulls,
+        )
+        return {
+            key: sub_encoder.encode(value)
+            for key, value in self._iter_generic_items(obj)
+        }
+
+    def _encode_model(self, obj: pydantic.BaseModel) -> Mapping[str, Any]:
+        return {
+            key: self.encode(value)
+            for key, value in self._iter_generic_items(obj)
+        }
+
+    def _iter_generic_items(self, obj: pydantic.BaseModel):
+        get_model_field = get_model_fields(obj).get
+        for key, value in obj.__iter__():
+            field_info = get_model_field(key)
+            if field_info is not None:
+                key = field_info.alias or key
+            if key not in self.exclude and (
+                value is not None or self.keep_nulls
+            ):
+                yield key, value
+
+
+def build_order(i: int) -> Order:
+    return Order(
+        number=i,
+        status=Status.NEW,
+        customer_id=uuid4(),
+        created_at=datetime.datetime.now(),
+        address=Address(city="Berlin", street="Main str. 1"),
+        items=[
+            LineItem(sku=f"sku-{j}", quantity=j, price=j * 1.5)
+            for j in range(10)
+        ],
+        tags=["a", "b", "c"],
+    )
+
+
+async def main(dsn: str, number: int = 2000, repeat: int = 5):
+    client = AsyncIOMotorClient(dsn)
+    await init_beanie(database=client.beanie_bench, document_models=[Order])
+    orders = [build_order(i) for i in range(100)]
+
+    for name, encoder in (
+        ("generic", GenericEncoder(to_db=True, exclude={"_id"})),
+        ("compiled plan", Encoder(to_db=True, exclude={"_id"})),
+    ):
+        assert encoder.encode(orders[0]) == Encoder(
+            to_db=True, exclude={"_id"}
+        ).encode(orders[0])
+        best = min(
+            timeit.repeat(
+                lambda: [encoder.encode(order) for order in orders],
+                number=number // len(orders),
+                repeat=repeat,
+            )
+        )
+        print(f"{name:>14}: {best / number * 1e6:.1f} us per document")
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        main(sys.argv[1] if len(sys.argv) > 1 else "mongodb://localhost:27017")
+    )
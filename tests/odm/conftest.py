@@ -18,25 +18,35 @@ from tests.odm.models import (
     DocumentForEncodingTestDate,
     DocumentMultiModelOne,
     DocumentMultiModelTwo,
+    DocumentMultiModelWithCache,
     DocumentTestModel,
     DocumentTestModelFailInspection,
     DocumentTestModelIndexFlagsAnnotated,
+    DocumentTestModelWithBatchedGet,
+    DocumentTestModelWithCacheInvalidation,
+    DocumentTestModelWithCoalescing,
     DocumentTestModelWithComplexIndex,
     DocumentTestModelWithCustomCollectionName,
     DocumentTestModelWithIndexFlags,
     DocumentTestModelWithIndexFlagsAliases,
     DocumentTestModelWithLink,
+    DocumentTestModelWithParsedCache,
+    DocumentTestModelWithSharedCache,
     DocumentTestModelWithSimpleIndex,
     DocumentTestModelWithSoftDelete,
     DocumentToBeLinked,
+    DocumentToBeLinkedWithUUID,
     DocumentToTestSync,
     DocumentUnion,
+    DocumentUnionWithCache,
     DocumentWithActions,
     DocumentWithActions2,
+    DocumentWithArrayUpdates,
     DocumentWithBackLink,
     DocumentWithBackLinkForNesting,
     DocumentWithBsonBinaryField,
     DocumentWithBsonEncodersFiledsTypes,
+    DocumentWithBsonSnapshot,
     DocumentWithComplexDictKey,
     DocumentWithCustomFiledsTypes,
     DocumentWithCustomIdInt,
@@ -45,6 +55,7 @@ from tests.odm.models import (
     DocumentWithDecimalField,
     DocumentWithDeprecatedHiddenField,
     DocumentWithExtras,
+    DocumentWithHashSnapshot,
     DocumentWithHttpUrlField,
     DocumentWithIndexedObjectId,
     DocumentWithIndexMerging1,
@@ -58,17 +69,24 @@ from tests.odm.models import (
     DocumentWithListOfLinks,
     DocumentWithOptionalBackLink,
     DocumentWithOptionalListBackLink,
+    DocumentWithParseOffload,
     DocumentWithPydanticConfig,
     DocumentWithRevisionTurnedOn,
     DocumentWithRootModelAsAField,
     DocumentWithStringField,
     DocumentWithTextIndexAndLink,
     DocumentWithTimeStampToTestConsistency,
+    DocumentWithTrackedArrayUpdates,
+    DocumentWithTrackedChanges,
     DocumentWithTurnedOffStateManagement,
     DocumentWithTurnedOnReplaceObjects,
     DocumentWithTurnedOnSavePrevious,
     DocumentWithTurnedOnStateManagement,
     DocumentWithTurnedOnStateManagementWithCustomId,
+    DocumentWithUUIDBsonSnapshot,
+    DocumentWithUUIDHashSnapshot,
+    DocumentWithUUIDLinks,
+    DocumentWithUUIDRevision,
     DocumentWithValidationOnSave,
     DocWithCallWrapper,
     Door,
@@ -104,7 +122,11 @@ from tests.odm.models import (
     Yard,
     YardWithRevision,
 )
-from tests.odm.views import ViewForTest, ViewForTestWithLink
+from tests.odm.views import (
+    ViewForTest,
+    ViewForTestWithCache,
+    ViewForTestWithLink,
+)
 
 
 @pytest.fixture
@@ -202,6 +224,11 @@ async def init(db):
         DocumentTestModel,
         DocumentTestModelWithSoftDelete,
         DocumentTestModelWithLink,
+        DocumentTestModelWithParsedCache,
+        DocumentTestModelWithCacheInvalidation,
+        DocumentTestModelWithSharedCache,
+        DocumentTestModelWithBatchedGet,
+        DocumentTestModelWithCoalescing,
         DocumentTestModelWithCustomCollectionName,
         DocumentTestModelWithSimpleIndex,
         DocumentTestModelWithIndexFlags,
@@ -219,9 +246,19 @@ async def init(db):
         DocumentWithTurnedOnStateManagement,
         DocumentWithTurnedOnReplaceObjects,
         DocumentWithTurnedOnSavePrevious,
+        DocumentWithTrackedChanges,
+        DocumentWithTrackedArrayUpdates,
+        DocumentWithBsonSnapshot,
+        DocumentWithHashSnapshot,
+        DocumentWithUUIDBsonSnapshot,
+        DocumentWithUUIDHashSnapshot,
+        DocumentWithArrayUpdates,
+        DocumentWithParseOffload,
         DocumentWithTurnedOffStateManagement,
         DocumentWithValidationOnSave,
         DocumentWithRevisionTurnedOn,
+        DocumentWithUUIDLinks,
+        DocumentWithUUIDRevision,
         DocumentWithHttpUrlField,
         House,
         Window,
@@ -236,9 +273,12 @@ async def init(db):
         DocumentWithStringField,
         ViewForTest,
         ViewForTestWithLink,
+        ViewForTestWithCache,
         DocumentMultiModelOne,
         DocumentMultiModelTwo,
         DocumentUnion,
+        DocumentUnionWithCache,
+        DocumentMultiModelWithCache,
         HouseWithRevision,
         WindowWithRevision,
         LockWithRevision,
@@ -273,6 +313,7 @@ async def init(db):
         DocumentWithListBackLink,
         DocumentWithListOfLinks,
         DocumentToBeLinked,
+        DocumentToBeLinkedWithUUID,
         DocumentWithTimeStampToTestConsistency,
         DocumentWithIndexMerging1,
         DocumentWithIndexMerging2,
@@ -1,9 +1,17 @@
+import asyncio
+from unittest.mock import patch
+
 import pytest
 from pymongo.errors import BulkWriteError
 
+from beanie import PydanticObjectId
 from beanie.odm.bulk import BulkWriter
 from beanie.odm.operators.update.general import Set
-from tests.odm.models import DocumentTestModel, SubDocument
+from tests.odm.models import (
+    DocumentTestModel,
+    DocumentTestModelWithSoftDelete,
+    SubDocument,
+)
 
 
 async def test_insert(documents_not_inserted):
@@ -182,3 +190,131 @@ async def test_native_upsert_not_found(documents, document_not_inserted):
         await bulk_writer.commit()
 
     assert await DocumentTestModel.count() == 6
+
+
+async def test_auto_flush(documents_not_inserted):
+    documents = documents_not_inserted(5)
+    bulk_writer = BulkWriter(max_operations=2)
+    for document in documents:
+        await DocumentTestModel.insert_one(document, bulk_writer=bulk_writer)
+    assert len(bulk_writer.operations) == 1
+    await asyncio.sleep(0.1)
+    assert await DocumentTestModel.count() == 4
+
+    result = await bulk_writer.commit()
+    assert result.inserted_count == 5
+    assert await DocumentTestModel.count() == 5
+    assert await bulk_writer.commit() is None
+
+
+async def test_auto_flush_by_size(documents_not_inserted):
+    documents = documents_not_inserted(5)
+    async with BulkWriter(max_bytes=1) as bulk_writer:
+        for document in documents:
+            await DocumentTestModel.insert_one(
+                document, bulk_writer=bulk_writer
+            )
+            assert len(bulk_writer.operations) == 0
+    assert await DocumentTestModel.count() == 5
+
+
+async def test_multiple_models(documents_not_inserted):
+    async with BulkWriter(max_operations=3) as bulk_writer:
+        for i, document in enumerate(documents_not_inserted(4)):
+            await DocumentTestModel.insert_one(
+                document, bulk_writer=bulk_writer
+            )
+            await DocumentTestModelWithSoftDelete.insert_one(
+                DocumentTestModelWithSoftDelete(test_int=i, test_str="foo"),
+                bulk_writer=bulk_writer,
+            )
+    assert await DocumentTestModel.count() == 4
+    assert await DocumentTestModelWithSoftDelete.count() == 4
+
+
+async def test_aggregated_result(documents):
+    await documents(3)
+    async with BulkWriter(max_operations=2) as bulk_writer:
+        for i in [0, 1, 3, 2]:
+            await DocumentTestModel.find_one(
+                DocumentTestModel.test_int == i
+            ).update_one(
+                Set({DocumentTestModel.test_str: "updated"}),
+                bulk_writer=bulk_writer,
+                upsert=True,
+            )
+        result = await bulk_writer.commit()
+    assert result.matched_count == 3
+    assert result.upserted_count == 1
+    assert list(result.upserted_ids) == [2]
+
+
+async def test_ordered_auto_flush_error(documents_not_inserted):
+    documents = documents_not_inserted(4)
+    for document in documents:
+        document.id = PydanticObjectId()
+    documents[3].id = documents[2].id
+    with pytest.raises(BulkWriteError) as e:
+        async with BulkWriter(max_operations=2) as bulk_writer:
+            for document in documents[:3]:
+                await DocumentTestModel.insert_one(
+                    document, bulk_writer=bulk_writer
+                )
+            await DocumentTestModel.insert_one(
+                documents[3], bulk_writer=bulk_writer
+            )
+            await DocumentTestModel.insert_one(
+                documents[1], bulk_writer=bulk_writer
+            )
+    assert e.value.details["nInserted"] == 3
+    assert [error["index"] for error in e.value.details["writeErrors"]] == [3]
+    assert await DocumentTestModel.count() == 3
+
+
+async def test_reused_writer_error(documents_not_inserted):
+    documents = documents_not_inserted(4)
+    for document in documents:
+        document.id = PydanticObjectId()
+    bulk_writer = BulkWriter(max_operations=2)
+    for document in documents[:3]:
+        await DocumentTestModel.insert_one(document, bulk_writer=bulk_writer)
+    result = await bulk_writer.commit()
+    assert result.inserted_count == 3
+
+    await DocumentTestModel.insert_one(documents[3], bulk_writer=bulk_writer)
+    await DocumentTestModel.insert_one(documents[0], bulk_writer=bulk_writer)
+    with pytest.raises(BulkWriteError) as e:
+        await bulk_writer.commit()
+    assert e.value.details["nInserted"] == 1
+    assert [error["index"] for error in e.value.details["writeErrors"]] == [1]
+
+
+async def test_concurrent_flushes(documents_not_inserted):
+    collection_class = type(DocumentTestModel.get_motor_collection())
+    bulk_write = collection_class.bulk_write
+    in_flight = 0
+    max_in_flight = 0
+
+    async def slow_bulk_write(self, *args, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        try:
+            return await bulk_write(self, *args, **kwargs)
+        finally:
+            in_flight -= 1
+
+    with patch.object(collection_class, "bulk_write", slow_bulk_write):
+        async with BulkWriter(
+            ordered=False, max_operations=2, max_concurrent_flushes=3
+        ) as bulk_writer:
+            for document in documents_not_inserted(20):
+                await DocumentTestModel.insert_one(
+                    document, bulk_writer=bulk_writer
+                )
+                assert len(bulk_writer._flushes) <= 3
+        assert bulk_writer._flushes == []
+
+    assert max_in_flight == 3
+    assert await DocumentTestModel.count() == 20
@@ -1,10 +1,13 @@
 import pytest
-from pymongo.errors import DuplicateKeyError
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
 from beanie.odm.fields import PydanticObjectId
 from tests.odm.models import (
     DocumentTestModel,
+    DocumentWithActions,
     DocumentWithKeepNullsFalse,
+    DocumentWithRevisionTurnedOn,
+    DocumentWithValidationOnSave,
     ModelWithOptionalField,
 )
 
@@ -24,6 +27,60 @@ async def test_insert_many(documents_not_inserted):
     assert len(documents) == 10
 
 
+async def test_insert_many_assigns_ids(documents_not_inserted):
+    documents = documents_not_inserted(5)
+    result = await DocumentTestModel.insert_many(documents, chunk_size=2)
+    assert [document.id for document in documents] == result.inserted_ids
+    assert all(
+        isinstance(document.id, PydanticObjectId) for document in documents
+    )
+    assert await DocumentTestModel.count() == 5
+
+
+async def test_insert_many_actions_and_state():
+    documents = [DocumentWithActions(name=f"name {i}") for i in range(3)]
+    await DocumentWithActions.insert_many(documents)
+    for document in documents:
+        assert document.name.startswith("Name")
+        assert document.num_1 == 1
+        assert document.num_2 == 9
+
+    documents = [DocumentWithActions(name="name") for i in range(3)]
+    await DocumentWithActions.insert_many(
+        documents, skip_actions=["num_2_change"]
+    )
+    assert all(document.num_2 == 10 for document in documents)
+
+    documents = [
+        DocumentWithRevisionTurnedOn(num_1=i, num_2=i) for i in range(3)
+    ]
+    await DocumentWithRevisionTurnedOn.insert_many(documents)
+    for document in documents:
+        assert document.revision_id is not None
+        assert document.get_saved_state()["_id"] == document.id
+        assert not document.is_changed
+
+
+async def test_insert_many_validation():
+    documents = [
+        DocumentWithValidationOnSave(num_1=i, num_2=i) for i in range(3)
+    ]
+    await DocumentWithValidationOnSave.insert_many(documents)
+    assert [document.num_2 for document in documents] == [1, 2, 3]
+
+
+async def test_insert_many_partial_failure(documents_not_inserted):
+    documents = documents_not_inserted(4)
+    existing = await documents_not_inserted(1)[0].insert()
+    documents[2].id = existing.id
+    with pytest.raises(BulkWriteError):
+        await DocumentTestModel.insert_many(documents, chunk_size=2)
+    assert documents[0].id is not None
+    assert documents[1].id is not None
+    assert documents[3].id is None
+    assert await DocumentTestModel.count() == 3
+
+
 async def test_create(document_not_inserted):
     await document_not_inserted.insert()
     assert isinstance(document_not_inserted.id, PydanticObjectId)
@@ -0,0 +1,138 @@
+from unittest.mock import patch
+from uuid import UUID
+
+import pytest
+
+from beanie.exceptions import StateNotSaved
+from tests.odm.models import (
+    DocumentTestModel,
+    DocumentWithRevisionTurnedOn,
+    DocumentWithTurnedOnStateManagement,
+    DocumentWithUUIDRevision,
+    InternalDoc,
+)
+
+
+async def test_save_changes_many():
+    docs = [
+        DocumentWithTurnedOnStateManagement(
+            num_1=i, num_2=i, internal=InternalDoc()
+        )
+        for i in range(3)
+    ]
+    await DocumentWithTurnedOnStateManagement.insert_many(docs)
+    docs[0].num_1 = 100
+    docs[1].internal.num = 200
+
+    result = await DocumentWithTurnedOnStateManagement.save_changes_many(docs)
+    assert result.saved == docs[:2]
+    assert result.unchanged == docs[2:]
+    assert result.conflicts == []
+    assert not any(doc.is_changed for doc in docs)
+
+    new_docs = await DocumentWithTurnedOnStateManagement.find_all().to_list()
+    assert new_docs == docs
+
+
+async def test_save_changes_many_unchanged():
+    docs = [
+        DocumentWithTurnedOnStateManagement(
+            num_1=i, num_2=i, internal=InternalDoc()
+        )
+        for i in range(2)
+    ]
+    await DocumentWithTurnedOnStateManagement.insert_many(docs)
+    collection = DocumentWithTurnedOnStateManagement.get_motor_collection()
+
+    with patch.object(
+        type(collection), "bulk_write", autospec=True
+    ) as bulk_write, patch.object(
+        type(collection), "find", autospec=True
+    ) as find:
+        result = await DocumentWithTurnedOnStateManagement.save_changes_many(
+            docs
+        )
+    assert result.unchanged == docs
+    assert bulk_write.call_count == 0
+    assert find.call_count == 0
+
+
+async def test_save_changes_many_state_not_saved():
+    doc = DocumentWithTurnedOnStateManagement(
+        num_1=1, num_2=1, internal=InternalDoc()
+    )
+    with pytest.raises(StateNotSaved):
+        await DocumentWithTurnedOnStateManagement.save_changes_many([doc])
+
+
+async def test_save_changes_many_conflicts():
+    docs = [DocumentWithRevisionTurnedOn(num_1=i, num_2=i) for i in range(3)]
+    await DocumentWithRevisionTurnedOn.insert_many(docs)
+
+    other = await DocumentWithRevisionTurnedOn.get(docs[0].id)
+    other.num_2 = 100
+    await other.save_changes()
+    await docs[1].delete()
+
+    for doc in docs:
+        doc.num_1 += 10
+    result = await DocumentWithRevisionTurnedOn.save_changes_many(docs)
+    assert result.saved == [docs[2]]
+    assert result.conflicts == docs[:2]
+    assert docs[0].is_changed
+    assert not docs[2].is_changed
+
+    new_doc = await DocumentWithRevisionTurnedOn.get(docs[2].id)
+    assert new_doc.num_1 == 12
+    assert new_doc.revision_id == docs[2].revision_id
+
+    result = await DocumentWithRevisionTurnedOn.save_changes_many(
+        docs[:1], ignore_revision=True
+    )
+    assert result.saved == docs[:1]
+
+
+async def test_save_many(documents_not_inserted):
+    docs = documents_not_inserted(3)
+    await docs[0].insert()
+    docs[0].test_int = 100
+
+    result = await DocumentTestModel.save_many(docs)
+    assert result.saved == docs
+    assert all(doc.id is not None for doc in docs)
+    assert await DocumentTestModel.count() == 3
+    assert (await DocumentTestModel.get(docs[0].id)).test_int == 100
+
+
+async def test_save_many_revision_conflict():
+    docs = [DocumentWithRevisionTurnedOn(num_1=i, num_2=i) for i in range(2)]
+    await DocumentWithRevisionTurnedOn.insert_many(docs)
+    other = await DocumentWithRevisionTurnedOn.get(docs[0].id)
+    other.num_2 = 100
+    await other.save()
+
+    result = await DocumentWithRevisionTurnedOn.save_many(docs)
+    assert result.saved == docs[1:]
+    assert result.conflicts == docs[:1]
+
+
+async def test_save_many_uuid_id():
+    docs = [DocumentWithUUIDRevision(num=i) for i in range(3)]
+    result = await DocumentWithUUIDRevision.save_many(docs)
+    assert result.saved == docs
+    assert all(isinstance(doc.id, UUID) for doc in docs)
+    assert (await DocumentWithUUIDRevision.get(docs[1].id)).num == 1
+
+    other = await DocumentWithUUIDRevision.get(docs[0].id)
+    other.num = 100
+    await other.save_changes()
+    await docs[1].delete()
+
+    for doc in docs:
+        doc.num += 10
+    result = await DocumentWithUUIDRevision.save_changes_many(docs)
+    assert result.saved == [docs[2]]
+    assert result.conflicts == docs[:2]
+    new_doc = await DocumentWithUUIDRevision.get(docs[2].id)
+    assert new_doc.num == 12
+    assert new_doc.revision_id == docs[2].revision_id
@@ -46,8 +46,10 @@ from beanie import (
     DocumentWithSoftDelete,
     Indexed,
     Insert,
+    KeyValueCacheBackend,
     Replace,
     Save,
+    StateSnapshot,
     Update,
     ValidateOnSave,
 )
@@ -175,6 +177,82 @@ class DocumentTestModel(Document):
         use_state_management = True
 
 
+class DocumentTestModelWithParsedCache(Document):
+    test_int: int
+    test_list: List[SubDocument]
+
+    class Settings:
+        use_cache = True
+        cache_parsed_results = True
+        cache_max_bytes = 1024 * 1024
+        use_state_management = True
+
+
+class DocumentTestModelWithCacheInvalidation(Document):
+    test_int: int
+    test_str: str
+
+    class Settings:
+        use_cache = True
+        cache_invalidate_on_write = True
+
+
+class FakeKeyValueCacheBackend(KeyValueCacheBackend):
+    """
+    Key-value store, shared by the "processes"
+    """
+
+    def __init__(self):
+        self.values: Dict[str, bytes] = {}
+        self.sets: Dict[str, Set[str]] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self.values.get(key)
+
+    async def put(
+        self, key: str, value: bytes, ttl: datetime.timedelta
+    ) -> None:
+        self.values[key] = value
+
+    async def delete_many(self, keys: List[str]) -> None:
+        for key in keys:
+            self.values.pop(key, None)
+
+    async def add_to_set(
+        self, name: str, member: str, ttl: datetime.timedelta
+    ) -> None:
+        self.sets.setdefault(name, set()).add(member)
+
+    async def pop_set(self, name: str) -> List[str]:
+        return list(self.sets.pop(name, ()))
+
+
+class DocumentTestModelWithSharedCache(Document):
+    test_int: int
+    test_str: str
+
+    class Settings:
+        use_cache = True
+        cache_invalidate_on_write = True
+        cache_backend = FakeKeyValueCacheBackend()
+
+
+class DocumentTestModelWithCoalescing(Document):
+    test_int: int
+    test_str: str
+
+    class Settings:
+        coalesce_queries = True
+
+
+class DocumentTestModelWithBatchedGet(Document):
+    test_int: int
+    test_str: str
+
+    class Settings:
+        batch_get = True
+
+
 class DocumentTestModelWithLink(Document):
     test_link: Link[DocumentTestModel]
 
@@ -476,6 +554,93 @@ class DocumentWithTurnedOnSavePrevious(Document):
         state_management_save_previous = True
 
 
+class DocumentWithTrackedChanges(Document):
+    num_1: int
+    num_2: int
+    internal: InternalDoc
+    items: List[InternalDoc] = []
+    tags: List[str] = []
+    counters: Dict[str, int] = {}
+    labels: Set[str] = set()
+    note: Optional[str] = None
+
+    class Settings:
+        use_state_management = True
+        state_management_track_changes = True
+        keep_nulls = False
+
+
+class DocumentWithTrackedArrayUpdates(Document):
+    internal: InternalDoc
+    tags: List[str] = []
+
+    class Settings:
+        use_state_management = True
+        state_management_track_changes = True
+        state_management_array_updates = True
+
+
+class DocumentWithBsonSnapshot(Document):
+    num_1: int
+    num_2: int
+    internal: InternalDoc
+    created_at: datetime.datetime = Field(
+        default_factory=datetime.datetime.now
+    )
+
+    class Settings:
+        use_state_management = True
+        state_management_save_previous = True
+        state_management_snapshot = StateSnapshot.BSON
+
+
+class DocumentWithHashSnapshot(Document):
+    num_1: int
+    num_2: int
+    internal: InternalDoc
+
+    class Settings:
+        use_state_management = True
+        state_management_track_changes = True
+        state_management_snapshot = StateSnapshot.HASH
+
+
+class DocumentWithUUIDBsonSnapshot(Document):
+    id: UUID = Field(default_factory=uuid4)
+    num: int
+
+    class Settings:
+        use_state_management = True
+        state_management_snapshot = StateSnapshot.BSON
+
+
+class DocumentWithUUIDHashSnapshot(Document):
+    id: UUID = Field(default_factory=uuid4)
+    num: int
+
+    class Settings:
+        use_state_management = True
+        state_management_track_changes = True
+        state_management_snapshot = StateSnapshot.HASH
+
+
+class DocumentWithParseOffload(Document):
+    num: int
+
+    class Settings:
+        parse_offload_threshold = 5
+        parse_offload_batch_size = 2
+
+
+class DocumentWithArrayUpdates(Document):
+    events: List[str] = []
+    items: List[InternalDoc] = []
+
+    class Settings:
+        use_state_management = True
+        state_management_array_updates = True
+
+
 class DocumentWithTurnedOffStateManagement(Document):
     num_1: int
     num_2: int
@@ -504,6 +669,15 @@ class DocumentWithRevisionTurnedOn(Document):
         use_state_management = True
 
 
+class DocumentWithUUIDRevision(Document):
+    id: Optional[UUID] = None
+    num: int
+
+    class Settings:
+        use_revision = True
+        use_state_management = True
+
+
 class DocumentWithPydanticConfig(Document):
     if IS_PYDANTIC_V2:
         model_config = ConfigDict(validate_assignment=True)
@@ -629,6 +803,20 @@ class DocumentMultiModelTwo(Document):
         class_id = "123"
 
 
+class DocumentUnionWithCache(UnionDoc):
+    class Settings:
+        name = "multi_model_with_cache"
+        use_cache = True
+        cache_invalidate_on_write = True
+
+
+class DocumentMultiModelWithCache(Document):
+    int_filed: int = 0
+
+    class Settings:
+        union_doc = DocumentUnionWithCache
+
+
 class YardWithRevision(Document):
     v: int
     w: int
@@ -746,6 +934,8 @@ class SampleLazyParsing(Document):
     lst: List[int] = Field(
         [],
     )
+    meta: Dict[str, Any] = {}
+    value: Any = None
 
     if IS_PYDANTIC_V2:
         model_config = ConfigDict(
@@ -985,6 +1175,16 @@ class DocumentToBeLinked(Document):
     s: str = "TEST"
 
 
+class DocumentToBeLinkedWithUUID(Document):
+    id: Optional[UUID] = None
+    s: str = "TEST"
+
+
+class DocumentWithUUIDLinks(Document):
+    link: Link[DocumentToBeLinkedWithUUID]
+    links: List[Link[DocumentToBeLinkedWithUUID]]
+
+
 class DocumentWithListOfLinks(Document):
     links: List[Link[DocumentToBeLinked]]
     s: str = "TEST"
@@ -171,10 +171,7 @@ async def test_with_text_queries(
             else {"$match": {"$and": [text_query, text_query]}}
         )
 
-    expected_aggregation_pipeline.extend(
-        construct_lookup_queries(query.document_model)
-    )
-
+    # Queries on the local fields run before the lookups
     if non_text_query_count:
         expected_aggregation_pipeline.append(
             {"$match": non_text_query}
@@ -182,6 +179,10 @@ async def test_with_text_queries(
             else {"$match": {"$and": [non_text_query, non_text_query]}}
         )
 
+    expected_aggregation_pipeline.extend(
+        construct_lookup_queries(query.document_model)
+    )
+
     expected_aggregation_pipeline.extend(aggregation_pipeline)
 
     assert (
@@ -0,0 +1,67 @@
+import asyncio
+import re
+from unittest.mock import patch
+
+from bson import ObjectId, Regex
+
+from beanie.odm.utils.batch_loader import split_id_query
+from tests.odm.models import DocumentTestModelWithBatchedGet
+
+
+def test_split_id_query():
+    doc_id = ObjectId()
+    assert split_id_query({"_id": doc_id}) == (doc_id, [])
+    assert split_id_query({"_id": doc_id, "a": 1}) == (doc_id, [{"a": 1}])
+    assert split_id_query({"$and": [{"a": 1}, {"_id": doc_id}]}) == (
+        doc_id,
+        [{"a": 1}],
+    )
+    assert split_id_query({"_id": {"$in": [doc_id]}}) is None
+    assert split_id_query({"_id": re.compile("^a")}) is None
+    assert split_id_query({"_id": Regex("^a")}) is None
+    assert split_id_query({"_id": [doc_id]}) is None
+    assert split_id_query({"_id": {"a": 1}}) is None
+    assert split_id_query({"_id": None}) is None
+    assert split_id_query({"$and": [{"_id": re.compile("^a")}]}) is None
+    assert split_id_query({"$or": [{"_id": doc_id}]}) is None
+    assert split_id_query({"a": 1}) is None
+
+
+async def test_batched_get():
+    docs = [
+        DocumentTestModelWithBatchedGet(test_int=i, test_str="foo")
+        for i in range(3)
+    ]
+    for doc in docs:
+        await doc.insert()
+    collection = DocumentTestModelWithBatchedGet.get_motor_collection()
+
+    with patch.object(
+        type(collection),
+        "find",
+        autospec=True,
+        side_effect=type(collection).find,
+    ) as find, patch.object(
+        type(collection), "find_one", autospec=True
+    ) as find_one:
+        results = await asyncio.gather(
+            *[DocumentTestModelWithBatchedGet.get(doc.id) for doc in docs],
+            DocumentTestModelWithBatchedGet.get(str(docs[0].id)),
+            DocumentTestModelWithBatchedGet.get(ObjectId()),
+        )
+    assert find.call_count == 1
+    assert find_one.call_count == 0
+    assert results[:3] == docs
+    assert results[3] == docs[0]
+    assert results[3] is not results[0]
+    assert results[4] is None
+
+    doc = await DocumentTestModelWithBatchedGet.find_one(
+        {"_id": docs[1].id, "test_int": 1}
+    )
+    assert doc == docs[1]
+    doc = await DocumentTestModelWithBatchedGet.find_one(
+        {"_id": docs[1].id, "test_int": 2}
+    )
+    assert doc is None
+    assert DocumentTestModelWithBatchedGet._batch_loader.batches == {}
@@ -1,6 +1,21 @@
 import asyncio
+from datetime import timedelta
 
-from tests.odm.models import DocumentTestModel
+import pytest
+
+from beanie import BulkWriter
+from beanie.odm.cache import LRUCache, SharedCache, get_document_ids
+from tests.odm.models import (
+    DocumentMultiModelWithCache,
+    DocumentTestModel,
+    DocumentTestModelWithCacheInvalidation,
+    DocumentTestModelWithParsedCache,
+    DocumentTestModelWithSharedCache,
+    DocumentUnionWithCache,
+    FakeKeyValueCacheBackend,
+    SubDocument,
+)
+from tests.odm.views import ViewForTestWithCache
 
 
 async def test_find_one(documents):
@@ -100,3 +115,243 @@ async def test_capacity(documents):
 
     new_doc = await DocumentTestModel.find_one(DocumentTestModel.test_int == 9)
     assert docs[9] == new_doc
+
+
+async def test_parsed_results():
+    await DocumentTestModelWithParsedCache.insert_many(
+        [
+            DocumentTestModelWithParsedCache(
+                test_int=i, test_list=[SubDocument(test_str="foo")]
+            )
+            for i in range(3)
+        ]
+    )
+    docs = await DocumentTestModelWithParsedCache.find_all().to_list()
+    docs[0].test_list[0].test_str = "CHANGED"
+    docs[0].test_list.append(SubDocument(test_str="bar"))
+
+    new_docs = await DocumentTestModelWithParsedCache.find_all().to_list()
+    assert new_docs[0] is not docs[0]
+    assert new_docs[0].test_list == [SubDocument(test_str="foo")]
+    assert new_docs[0].is_changed is False
+
+    doc = await DocumentTestModelWithParsedCache.find_one(
+        DocumentTestModelWithParsedCache.test_int == 1
+    )
+    doc.test_int = 100
+    new_doc = await DocumentTestModelWithParsedCache.find_one(
+        DocumentTestModelWithParsedCache.test_int == 1
+    )
+    assert new_doc.test_int == 1
+
+    stats = DocumentTestModelWithParsedCache._cache.stats
+    assert stats.hits == 2
+    assert stats.misses == 2
+
+
+def test_create_key():
+    key = LRUCache.create_key({"a": 1, "b": [1, 2]}, DocumentTestModel)
+    assert key == LRUCache.create_key({"a": 1, "b": [1, 2]}, DocumentTestModel)
+    assert key != LRUCache.create_key({"b": [1, 2], "a": 1}, DocumentTestModel)
+    assert key != LRUCache.create_key(
+        {"a": 1.0, "b": [1, 2]}, DocumentTestModel
+    )
+    assert LRUCache.create_key({1: "not a string key"})
+
+
+def test_lru_cache_max_size():
+    cache = LRUCache(
+        capacity=10, expiration_time=timedelta(minutes=1), max_size=100
+    )
+    cache.set("a", 1, size=40)
+    cache.set("b", 2, size=40)
+    assert cache.get("a") == 1
+    cache.set("c", 3, size=40)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.size == 80
+
+    cache.set("d", 4, size=200)
+    assert cache.get("d") is None
+    assert cache.stats.evictions == 1
+    assert cache.stats.hits == 3
+    assert cache.stats.misses == 2
+
+
+def test_lru_cache_expiration():
+    cache = LRUCache(capacity=10, expiration_time=timedelta(seconds=0))
+    cache.set("a", 1)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+    assert cache.stats.expirations == 1
+
+
+def test_lru_cache_invalidate():
+    cache = LRUCache(capacity=10, expiration_time=timedelta(minutes=1))
+    cache.set("a", 1)
+    cache.set("b", 2, tags=["id:1"])
+    cache.set("c", 3, tags=["id:2"])
+    cache.invalidate(["query", "id:1"])
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.tags == {"id:2": {"c"}}
+
+
+def test_get_document_ids():
+    assert get_document_ids({"_id": 1, "revision_id": 2}) == [1]
+    assert get_document_ids({"_id": {"$in": [1, 2]}}) == [1, 2]
+    assert get_document_ids({"$and": [{"_id": 1}, {"_class_id": "A"}]}) == [1]
+    assert get_document_ids({"_id": {"$gt": 1}}) is None
+    assert get_document_ids({"test_int": 1}) is None
+
+
+async def test_invalidation_on_write():
+    await DocumentTestModelWithCacheInvalidation.insert_many(
+        [
+            DocumentTestModelWithCacheInvalidation(test_int=i, test_str="foo")
+            for i in range(5)
+        ]
+    )
+    docs = await DocumentTestModelWithCacheInvalidation.find_all().to_list()
+    assert len(docs) == 5
+
+    await DocumentTestModelWithCacheInvalidation(
+        test_int=5, test_str="foo"
+    ).insert()
+    docs = await DocumentTestModelWithCacheInvalidation.find_all().to_list()
+    assert len(docs) == 6
+
+    await DocumentTestModelWithCacheInvalidation.find(
+        DocumentTestModelWithCacheInvalidation.test_int > 2
+    ).set({DocumentTestModelWithCacheInvalidation.test_str: "bar"})
+    docs = await DocumentTestModelWithCacheInvalidation.find(
+        DocumentTestModelWithCacheInvalidation.test_str == "bar"
+    ).to_list()
+    assert len(docs) == 3
+
+    await docs[0].delete()
+    docs = await DocumentTestModelWithCacheInvalidation.find(
+        DocumentTestModelWithCacheInvalidation.test_str == "bar"
+    ).to_list()
+    assert len(docs) == 2
+
+    async with BulkWriter() as bulk_writer:
+        for doc in docs:
+            doc.test_str = "baz"
+            await doc.replace(bulk_writer=bulk_writer)
+    docs = await DocumentTestModelWithCacheInvalidation.find(
+        DocumentTestModelWithCacheInvalidation.test_str == "bar"
+    ).to_list()
+    assert docs == []
+
+
+async def test_invalidation_by_id():
+    doc_1 = await DocumentTestModelWithCacheInvalidation(
+        test_int=1, test_str="foo"
+    ).insert()
+    doc_2 = await DocumentTestModelWithCacheInvalidation(
+        test_int=2, test_str="foo"
+    ).insert()
+    await DocumentTestModelWithCacheInvalidation.get(doc_1.id)
+    await DocumentTestModelWithCacheInvalidation.get(doc_2.id)
+    await DocumentTestModelWithCacheInvalidation.find_all().to_list()
+
+    doc_2.test_str = "bar"
+    await doc_2.save()
+
+    stats = DocumentTestModelWithCacheInvalidation._cache.stats
+    hits = stats.hits
+    new_doc_1 = await DocumentTestModelWithCacheInvalidation.get(doc_1.id)
+    assert new_doc_1 == doc_1
+    assert stats.hits == hits + 1
+
+    new_doc_2 = await DocumentTestModelWithCacheInvalidation.get(doc_2.id)
+    assert new_doc_2.test_str == "bar"
+    assert stats.hits == hits + 1
+
+
+async def test_union_doc_invalidation_on_write():
+    await DocumentMultiModelWithCache(int_filed=1).insert()
+    docs = await DocumentUnionWithCache.all().to_list()
+    assert len(docs) == 1
+
+    await DocumentMultiModelWithCache(int_filed=2).insert()
+    docs = await DocumentUnionWithCache.all().to_list()
+    assert len(docs) == 2
+
+
+async def test_view_invalidation_on_write():
+    stats = ViewForTestWithCache._cache.stats
+    await ViewForTestWithCache.all().to_list()
+    await ViewForTestWithCache.all().to_list()
+    misses = stats.misses
+    assert stats.hits == 1
+
+    await DocumentTestModelWithCacheInvalidation(
+        test_int=1, test_str="foo"
+    ).insert()
+    await ViewForTestWithCache.all().to_list()
+    assert stats.misses == misses + 1
+
+
+async def test_key_value_cache_backend():
+    backend = FakeKeyValueCacheBackend()
+    await backend.set("a", b"1", timedelta(minutes=1), tags=["t1", "t2"])
+    await backend.set("b", b"2", timedelta(minutes=1), tags=["t2"])
+    await backend.set("c", b"3", timedelta(minutes=1), tags=["t3"])
+    assert await backend.get("a") == b"1"
+
+    await backend.invalidate(["t2"])
+    assert await backend.get("a") is None
+    assert await backend.get("b") is None
+    assert await backend.get("c") == b"3"
+
+    await backend.delete("c")
+    assert await backend.get("c") is None
+
+
+@pytest.fixture
+def shared_cache():
+    # Every test gets an empty backend, the one of the settings is kept
+    cache = DocumentTestModelWithSharedCache._cache
+    DocumentTestModelWithSharedCache._cache = SharedCache(
+        backend=FakeKeyValueCacheBackend(),
+        namespace=cache.namespace,
+        expiration_time=cache.expiration_time,
+        codec_options=cache.codec_options,
+    )
+    yield
+    DocumentTestModelWithSharedCache._cache = cache
+
+
+async def test_shared_cache(shared_cache):
+    await DocumentTestModelWithSharedCache.insert_many(
+        [
+            DocumentTestModelWithSharedCache(test_int=i, test_str="foo")
+            for i in range(3)
+        ]
+    )
+    docs = await DocumentTestModelWithSharedCache.find_all().to_list()
+    doc = await DocumentTestModelWithSharedCache.get(docs[0].id)
+    assert doc == docs[0]
+
+    # The cache of another process with the same backend
+    cache = DocumentTestModelWithSharedCache._cache
+    DocumentTestModelWithSharedCache._cache = SharedCache(
+        backend=cache.backend,
+        namespace=cache.namespace,
+        expiration_time=cache.expiration_time,
+        codec_options=cache.codec_options,
+    )
+    assert await DocumentTestModelWithSharedCache.find_all().to_list() == docs
+    assert await DocumentTestModelWithSharedCache.get(docs[0].id) == doc
+    assert DocumentTestModelWithSharedCache._cache.stats.hits == 2
+    assert DocumentTestModelWithSharedCache._cache.stats.misses == 0
+
+    await DocumentTestModelWithSharedCache.find_all().set(
+        {DocumentTestModelWithSharedCache.test_str: "bar"}
+    )
+    docs = await DocumentTestModelWithSharedCache.find_all().to_list()
+    assert [doc.test_str for doc in docs] == ["bar"] * 3
@@ -0,0 +1,142 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from beanie.odm.utils.single_flight import SingleFlight
+from tests.odm.models import DocumentTestModelWithCoalescing
+
+
+async def test_single_flight():
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def func():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"calls": calls}
+
+    results = await asyncio.gather(
+        *[single_flight.do("key", func) for _ in range(5)]
+    )
+    assert calls == 1
+    assert [shared for _, shared in results] == [False] + [True] * 4
+    assert all(result == {"calls": 1} for result, _ in results)
+    assert single_flight.calls == {}
+
+    await single_flight.do("key", func)
+    assert calls == 2
+
+
+async def test_single_flight_exception():
+    single_flight = SingleFlight()
+
+    async def func():
+        await asyncio.sleep(0.01)
+        raise ValueError
+
+    results = await asyncio.gather(
+        *[single_flight.do("key", func) for _ in range(3)],
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, ValueError) for result in results)
+    assert single_flight.calls == {}
+
+
+async def test_single_flight_leader_cancelled():
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def func():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    leader = asyncio.ensure_future(single_flight.do("key", func))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(single_flight.do("key", func))
+    await asyncio.sleep(0)
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert await follower == (2, False)
+
+
+async def test_coalesced_find():
+    await DocumentTestModelWithCoalescing.insert_many(
+        [
+            DocumentTestModelWithCoalescing(test_int=i, test_str="foo")
+            for i in range(3)
+        ]
+    )
+    doc = await DocumentTestModelWithCoalescing.find_one(
+        DocumentTestModelWithCoalescing.test_int == 1
+    )
+
+    collection = DocumentTestModelWithCoalescing.get_motor_collection()
+    collection_find_one = type(collection).find_one
+    collection_find = type(collection).find
+    single_flight_do = SingleFlight.do
+    callers = 5
+    joined = 0
+    released = asyncio.Event()
+
+    async def joining_do(self, key, func):
+        # The query is held, until all the callers have joined it,
+        # so the test does not depend on the database latency
+        nonlocal joined
+        joined += 1
+        if joined == callers:
+            released.set()
+        return await single_flight_do(self, key, func)
+
+    async def held_find_one(*args, **kwargs):
+        await asyncio.wait_for(released.wait(), 1)
+        return await collection_find_one(*args, **kwargs)
+
+    def held_find(*args, **kwargs):
+        cursor = collection_find(*args, **kwargs)
+        cursor_to_list = cursor.to_list
+
+        async def to_list(*to_list_args, **to_list_kwargs):
+            await asyncio.wait_for(released.wait(), 1)
+            return await cursor_to_list(*to_list_args, **to_list_kwargs)
+
+        cursor.to_list = to_list
+        return cursor
+
+    with patch.object(SingleFlight, "do", joining_do), patch.object(
+        type(collection),
+        "find_one",
+        autospec=True,
+        side_effect=held_find_one,
+    ) as find_one:
+        docs = await asyncio.gather(
+            *[
+                DocumentTestModelWithCoalescing.get(doc.id)
+                for _ in range(callers)
+            ]
+        )
+    assert find_one.call_count == 1
+    assert all(d == doc for d in docs)
+    assert len({id(d) for d in docs}) == callers
+
+    joined = 0
+    released.clear()
+    with patch.object(SingleFlight, "do", joining_do), patch.object(
+        type(collection),
+        "find",
+        autospec=True,
+        side_effect=held_find,
+    ) as find:
+        lists = await asyncio.gather(
+            *[
+                DocumentTestModelWithCoalescing.find_all().to_list()
+                for _ in range(callers)
+            ]
+        )
+    assert find.call_count == 1
+    assert all(len(docs) == 3 for docs in lists)
+    assert lists[0][0] is not lists[1][0]
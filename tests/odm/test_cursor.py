@@ -1,4 +1,9 @@
-from tests.odm.models import DocumentTestModel
+import threading
+
+import pytest
+
+from beanie.odm.queries import cursor
+from tests.odm.models import DocumentTestModel, DocumentWithParseOffload
 
 
 async def test_to_list(documents):
@@ -11,3 +16,118 @@ async def test_async_for(documents):
     await documents(10)
     async for document in DocumentTestModel.find_all():
         assert document.test_int in list(range(10))
+
+
+async def test_iter_batches(documents):
+    await documents(10)
+    batches = [
+        batch
+        async for batch in DocumentTestModel.find_all()
+        .sort("test_int")
+        .iter_batches(4)
+    ]
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert all(
+        isinstance(document, DocumentTestModel)
+        for batch in batches
+        for document in batch
+    )
+    assert [document.test_int for batch in batches for document in batch] == (
+        list(range(10))
+    )
+
+
+async def test_iter_batches_empty():
+    batches = [
+        batch async for batch in DocumentTestModel.find_all().iter_batches(4)
+    ]
+    assert batches == []
+
+
+async def test_iter_batches_aggregation(documents):
+    await documents(5)
+    batches = [
+        batch
+        async for batch in DocumentTestModel.aggregate(
+            [{"$sort": {"test_int": 1}}]
+        ).iter_batches(2, batch_size=10)
+    ]
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert batches[0][0]["test_int"] == 0
+
+
+async def test_stream(documents):
+    await documents(10)
+    result = [
+        document.test_int
+        async for document in DocumentTestModel.find_all()
+        .sort("test_int")
+        .stream(3)
+    ]
+    assert result == list(range(10))
+
+
+@pytest.fixture
+def parse_threads(monkeypatch):
+    threads = []
+    parse_obj = cursor.parse_obj
+
+    def recording_parse_obj(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return parse_obj(*args, **kwargs)
+
+    monkeypatch.setattr(cursor, "parse_obj", recording_parse_obj)
+    return threads
+
+
+class TestParseOffload:
+    async def test_threshold(self, parse_threads):
+        await DocumentWithParseOffload.insert_many(
+            [DocumentWithParseOffload(num=i) for i in range(5)]
+        )
+        result = (
+            await DocumentWithParseOffload.find_all().sort("num").to_list()
+        )
+        assert [doc.num for doc in result] == list(range(5))
+        assert len(parse_threads) == 5
+        assert threading.current_thread() not in parse_threads
+
+    async def test_below_threshold(self, parse_threads):
+        await DocumentWithParseOffload.insert_many(
+            [DocumentWithParseOffload(num=i) for i in range(4)]
+        )
+        result = await DocumentWithParseOffload.find_all().to_list()
+        assert len(result) == 4
+        assert set(parse_threads) == {threading.current_thread()}
+
+    async def test_query_option(self, documents, parse_threads):
+        await documents(3)
+        result = await DocumentTestModel.find_all().offload_parsing().to_list()
+        assert len(result) == 3
+        assert threading.current_thread() not in parse_threads
+
+        await DocumentWithParseOffload.insert_many(
+            [DocumentWithParseOffload(num=i) for i in range(5)]
+        )
+        parse_threads.clear()
+        await DocumentWithParseOffload.find_all().offload_parsing(
+            False
+        ).to_list()
+        assert set(parse_threads) == {threading.current_thread()}
+
+    async def test_iter_batches(self, parse_threads):
+        await DocumentWithParseOffload.insert_many(
+            [DocumentWithParseOffload(num=i) for i in range(6)]
+        )
+        batches = [
+            batch
+            async for batch in DocumentWithParseOffload.aggregate(
+                [{"$sort": {"num": 1}}],
+                projection_model=DocumentWithParseOffload,
+            ).iter_batches(3)
+        ]
+        assert [[doc.num for doc in batch] for batch in batches] == [
+            [0, 1, 2],
+            [3, 4, 5],
+        ]
+        assert set(parse_threads) == {threading.current_thread()}
@@ -1,17 +1,27 @@
 import re
 from datetime import date, datetime
+from enum import Enum
+from pathlib import PurePosixPath
 from uuid import uuid4
 
 import pytest
 from bson import Binary, Regex
 from pydantic import AnyUrl
 
-from beanie.odm.utils.encoder import Encoder
+from beanie.odm.utils.encoder import (
+    Encoder,
+    EncoderDispatch,
+    compile_encoding_plan,
+    get_document_encoding_plan,
+    get_encoder_dispatch,
+)
 from beanie.odm.utils.pydantic import IS_PYDANTIC_V2
 from tests.odm.models import (
     Child,
     DocumentForEncodingTest,
     DocumentForEncodingTestDate,
+    DocumentTestModel,
+    DocumentWithBsonEncodersFiledsTypes,
     DocumentWithComplexDictKey,
     DocumentWithDecimalField,
     DocumentWithHttpUrlField,
@@ -19,6 +29,7 @@ from tests.odm.models import (
     DocumentWithStringField,
     ModelWithOptionalField,
     SampleWithMutableObjects,
+    SubDocument,
 )
 
 
@@ -169,3 +180,82 @@ async def test_dict_with_complex_key():
 
     assert isinstance(new_doc.dict_field, dict)
     assert new_doc.dict_field.get(uuid) == dt
+
+
+def test_encoding_plan_is_compiled_on_init():
+    plan = DocumentTestModel._encoding_plan
+    assert plan is not None
+    assert plan.model is DocumentTestModel
+    assert plan.fields["id"].key == "_id"
+    assert str in plan.fields["test_str"].passthrough_types
+    assert SubDocument in plan.fields["test_doc"].model_types
+    assert SubDocument in plan.fields["test_list"].items.model_types
+    assert get_document_encoding_plan(DocumentTestModel) is plan
+
+
+def test_encoding_plan_respects_bson_encoders():
+    plan = get_document_encoding_plan(DocumentWithBsonEncodersFiledsTypes)
+    assert datetime not in plan.fields["timestamp"].passthrough_types
+    assert datetime in plan.fields["timestamp"].encoders
+
+    dt = datetime.now()
+    doc = DocumentWithBsonEncodersFiledsTypes(color="7fffd4", timestamp=dt)
+    encoded_doc = Encoder(to_db=True).encode(doc)
+    assert encoded_doc["timestamp"] == dt.isoformat(timespec="microseconds")
+
+
+def test_encoding_plan_fallback_to_generic_encoding():
+    plan = compile_encoding_plan(SubDocument)
+    assert str in plan.fields["test_str"].passthrough_types
+
+    # values of not annotated types are encoded with the generic encoder
+    doc = SubDocument(test_str="str")
+    doc.test_str = b"bytes"
+    encoded_doc = Encoder().encode(doc)
+    assert isinstance(encoded_doc["test_str"], Binary)
+
+
+def test_encoder_dispatch_uses_mro():
+    class Base:
+        pass
+
+    class Child(Base):
+        pass
+
+    class GrandChild(Child):
+        pass
+
+    dispatch = EncoderDispatch({Base: str, Child: repr})
+    assert dispatch.get(GrandChild) is repr
+    assert dispatch.get(Base) is str
+    assert dispatch.get(int) is None
+
+
+def test_encoder_dispatch_invalidation():
+    class StrEnum(str, Enum):
+        A = "A"
+
+    encoders = {}
+    encoders[Enum] = lambda e: e.name
+    dispatch = get_encoder_dispatch(encoders)
+    assert get_encoder_dispatch(encoders) is dispatch
+    assert dispatch.get(StrEnum)(StrEnum.A) == "A"
+    assert dispatch.get(PurePosixPath) is None
+
+    encoders[StrEnum] = lambda e: e.value.lower()
+    assert dispatch.get(StrEnum)(StrEnum.A) == "a"
+
+    del encoders[StrEnum]
+    encoders[PurePosixPath] = str
+    assert dispatch.get(StrEnum)(StrEnum.A) == "A"
+    assert dispatch.get(PurePosixPath) is str
+    assert Encoder(custom_encoders=encoders).encode(
+        [StrEnum.A, PurePosixPath("/a")]
+    ) == ["A", "/a"]
+
+    # The cached types without an encoder are reset too
+    assert dispatch.get(int) is None
+    del encoders[PurePosixPath]
+    encoders[int] = str
+    assert dispatch.get(int) is str
+    assert dispatch.get(PurePosixPath) is None
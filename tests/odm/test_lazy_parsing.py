@@ -1,8 +1,20 @@
+import json
+
+import bson
 import pytest
+from bson.raw_bson import RawBSONDocument
 
+from beanie import Link, PydanticObjectId, WriteRules
 from beanie.odm.utils.dump import get_dict
 from beanie.odm.utils.parsing import parse_obj
-from tests.odm.models import SampleLazyParsing
+from tests.odm.models import (
+    DocumentWithTurnedOnStateManagement,
+    Door,
+    House,
+    InternalDoc,
+    SampleLazyParsing,
+    Window,
+)
 
 
 @pytest.fixture
@@ -51,3 +63,130 @@ class TestLazyParsing:
     async def test_default_list(self):
         res = parse_obj(SampleLazyParsing, {"i": "1", "s": "1"})
         assert res.lst == []
+
+
+class TestRawBSON:
+    async def test_find_many(self, docs):
+        found_docs = await SampleLazyParsing.find(
+            SampleLazyParsing.i <= 5, raw_bson=True
+        ).to_list()
+        assert len(found_docs) == 6
+        assert isinstance(found_docs[0]._store, RawBSONDocument)
+        saved_state = found_docs[0].get_saved_state()
+        assert list(saved_state.keys()) == ["_id"]
+        assert found_docs[0].i == 0
+        assert found_docs[0].s == "0"
+        assert get_dict(found_docs[2])["i"] == 2
+
+    async def test_iterate(self, docs):
+        found_docs = [
+            doc
+            async for doc in SampleLazyParsing.find(
+                SampleLazyParsing.i >= 8, raw_bson=True
+            )
+        ]
+        assert [doc.i for doc in found_docs] == [8, 9]
+        assert isinstance(found_docs[0]._store, RawBSONDocument)
+
+    async def test_find_one(self, docs):
+        doc = await SampleLazyParsing.find_one(
+            SampleLazyParsing.s == "3", raw_bson=True
+        )
+        assert isinstance(doc._store, RawBSONDocument)
+        assert doc.i == 3
+
+        doc = await SampleLazyParsing.find_one(
+            SampleLazyParsing.id == doc.id, raw_bson=True
+        )
+        assert isinstance(doc._store, RawBSONDocument)
+        assert doc.s == "3"
+
+    async def test_aggregate(self, docs):
+        result = await SampleLazyParsing.aggregate(
+            [{"$match": {"i": {"$lt": 2}}}, {"$sort": {"i": 1}}],
+            raw_bson=True,
+        ).to_list()
+        assert all(isinstance(item, RawBSONDocument) for item in result)
+        assert [item["i"] for item in result] == [0, 1]
+
+        result = await SampleLazyParsing.aggregate(
+            [{"$match": {"i": {"$lt": 2}}}, {"$sort": {"i": 1}}],
+            projection_model=SampleLazyParsing,
+            raw_bson=True,
+        ).to_list()
+        assert isinstance(result[0]._store, RawBSONDocument)
+        assert [doc.s for doc in result] == ["0", "1"]
+
+    async def test_save_changes(self, docs):
+        doc = await SampleLazyParsing.find_one(
+            SampleLazyParsing.s == "0", raw_bson=True
+        )
+        doc.i = 1000
+        await doc.save_changes()
+        new_doc = await SampleLazyParsing.find_one(SampleLazyParsing.s == "0")
+        assert new_doc.i == 1000
+
+    async def test_links(self):
+        house = await House(
+            name="test",
+            door=Door(),
+            windows=[Window(x=1, y=1), Window(x=2, y=2)],
+        ).insert(link_rule=WriteRules.WRITE)
+
+        found = await House.find_one(House.id == house.id, raw_bson=True)
+        assert isinstance(found.door, Link)
+        assert found.door.ref.id == house.door.id
+        assert [window.ref.id for window in found.windows] == [
+            window.id for window in house.windows
+        ]
+
+    def test_parse_embedded(self):
+        doc = DocumentWithTurnedOnStateManagement(
+            id=PydanticObjectId(),
+            num_1=1,
+            num_2=2,
+            internal=InternalDoc(num=3, lst=[4, 5]),
+        )
+        raw = RawBSONDocument(bson.encode(get_dict(doc, to_db=True)))
+        parsed = parse_obj(
+            DocumentWithTurnedOnStateManagement, raw, lazy_parse=True
+        )
+        assert parsed.id == doc.id
+        assert parsed.internal == doc.internal
+        assert parsed.num_2 == 2
+
+    def test_parse_embedded_values(self):
+        raw = RawBSONDocument(
+            bson.encode(
+                {
+                    "_id": PydanticObjectId(),
+                    "i": 1,
+                    "s": "1",
+                    "meta": {"k": {"z": 1}},
+                }
+            )
+        )
+        parsed = parse_obj(SampleLazyParsing, raw, lazy_parse=True)
+        parsed.meta["k"]["z"] = 2
+        assert parsed.meta == {"k": {"z": 2}}
+
+    async def test_embedded_values(self):
+        meta = {"k": {"z": 1, "lst": [{"a": 1}]}, "n": 1}
+        await SampleLazyParsing(
+            i=1, s="1", meta=meta, value=[{"b": 2}]
+        ).insert()
+
+        doc = await SampleLazyParsing.find_one(
+            SampleLazyParsing.i == 1, raw_bson=True
+        )
+        assert doc.meta == meta
+        assert not isinstance(doc.meta["k"], RawBSONDocument)
+        assert not isinstance(doc.meta["k"]["lst"][0], RawBSONDocument)
+        assert doc.value == [{"b": 2}]
+        assert not isinstance(doc.value[0], RawBSONDocument)
+        json.dumps([doc.meta, doc.value])
+
+        doc.meta["k"]["z"] = 2
+        await doc.save_changes()
+        new_doc = await SampleLazyParsing.find_one(SampleLazyParsing.i == 1)
+        assert new_doc.meta["k"]["z"] == 2
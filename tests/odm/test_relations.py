@@ -1,16 +1,31 @@
+import asyncio
 from typing import List
+from unittest.mock import patch
+from uuid import UUID
 
 import pytest
+from pydantic import BaseModel
 from pydantic.fields import Field
 
-from beanie import Document, init_beanie
-from beanie.exceptions import DocumentWasNotSaved
+from beanie import BulkWriter, Document, IdentityMap, init_beanie
+from beanie.exceptions import DocumentWasNotSaved, NotSupported
 from beanie.odm.fields import (
     BackLink,
     DeleteRules,
     Link,
+    PydanticObjectId,
     WriteRules,
 )
+from beanie.odm.utils.cascade import plan_cascade_write
+from beanie.odm.utils.encoder import decode_uuid
+from beanie.odm.utils.find import (
+    construct_lookup_queries,
+    get_fetched_link_fields,
+    get_lookup_queries,
+    project_lookup,
+    split_lookup_query,
+)
+from beanie.odm.utils.projection import get_projection
 from beanie.odm.utils.pydantic import (
     IS_PYDANTIC_V2,
     get_model_fields,
@@ -22,6 +37,7 @@ from tests.odm.models import (
     ADocument,
     BDocument,
     DocumentToBeLinked,
+    DocumentToBeLinkedWithUUID,
     DocumentWithBackLink,
     DocumentWithBackLinkForNesting,
     DocumentWithLink,
@@ -30,6 +46,7 @@ from tests.odm.models import (
     DocumentWithListLink,
     DocumentWithListOfLinks,
     DocumentWithTextIndexAndLink,
+    DocumentWithUUIDLinks,
     Door,
     House,
     LinkDocumentForTextSeacrh,
@@ -429,6 +446,98 @@ class TestFind:
         assert isinstance(doc.back_link.link.back_link, BackLink)
 
 
+class TestCascadeWrite:
+    def test_plan(self):
+        lock = Lock(k=1)
+        windows = [Window(x=i, y=i, lock=lock) for i in range(2)]
+        door = Door(window=windows[0], locks=[lock])
+        house = House(windows=windows, door=door, name="test")
+
+        plan = plan_cascade_write([house])
+        assert [id(document) for document in plan] == [
+            id(lock),
+            id(windows[0]),
+            id(windows[1]),
+            id(door),
+        ]
+
+    async def test_bulk_write_per_collection(self):
+        lock = Lock(k=1)
+        houses = [
+            House(
+                windows=[Window(x=i, y=j, lock=lock) for j in range(3)],
+                door=Door(locks=[lock, Lock(k=2)]),
+                name=f"house {i}",
+            )
+            for i in range(2)
+        ]
+        collection_class = type(Lock.get_motor_collection())
+        bulk_write = collection_class.bulk_write
+        written = []
+
+        async def counting_bulk_write(self, requests, *args, **kwargs):
+            written.append((self.name, len(requests)))
+            return await bulk_write(self, requests, *args, **kwargs)
+
+        with patch.object(collection_class, "bulk_write", counting_bulk_write):
+            await House.insert_many(houses, link_rule=WriteRules.WRITE)
+
+        assert written == [("Lock", 3), ("Window", 6), ("Door", 2)]
+        assert await Lock.count() == 3
+        assert await Window.count() == 6
+        assert await Door.count() == 2
+        assert await House.count() == 2
+        assert all(house.door.id is not None for house in houses)
+
+    async def test_same_class_chain(self):
+        await SelfLinked(
+            item=SelfLinked(item=SelfLinked(s="3"), s="2"), s="1"
+        ).insert(link_rule=WriteRules.WRITE)
+        assert await SelfLinked.count() == 3
+
+    async def test_insert_with_bulk_writer(self, house_not_inserted):
+        async with BulkWriter() as bulk_writer:
+            await House.insert_one(
+                house_not_inserted,
+                bulk_writer=bulk_writer,
+                link_rule=WriteRules.WRITE,
+            )
+        assert await Lock.count() == 5
+        assert await Window.count() == 3
+        assert await Door.count() == 1
+        house = await House.find_one()
+        assert house.door.ref.id == house_not_inserted.door.id
+
+    @pytest.mark.parametrize("with_bulk_writer", [False, True])
+    async def test_uuid_ids(self, with_bulk_writer):
+        linked = [DocumentToBeLinkedWithUUID(s=str(i)) for i in range(3)]
+        document = DocumentWithUUIDLinks(link=linked[0], links=linked[1:])
+        if with_bulk_writer:
+            async with BulkWriter() as bulk_writer:
+                await DocumentWithUUIDLinks.insert_one(
+                    document,
+                    bulk_writer=bulk_writer,
+                    link_rule=WriteRules.WRITE,
+                )
+        else:
+            await document.insert(link_rule=WriteRules.WRITE)
+        assert all(isinstance(item.id, UUID) for item in linked)
+
+        raw = await DocumentWithUUIDLinks.get_motor_collection().find_one()
+        assert [
+            decode_uuid(ref.id) for ref in [raw["link"], *raw["links"]]
+        ] == [item.id for item in linked]
+        new_document = await DocumentWithUUIDLinks.find_one()
+        assert (await new_document.link.fetch()) == linked[0]
+
+    async def test_replace(self, house):
+        house.door.t = 100
+        house.windows[0].x = 100
+        await house.replace(link_rule=WriteRules.WRITE)
+        assert (await Door.get(house.door.id)).t == 100
+        assert (await Window.get(house.windows[0].id)).x == 100
+
+
 class TestReplace:
     async def test_do_nothing(self, house):
         house.door.t = 100
@@ -491,6 +600,47 @@ class TestDelete:
         locks = await Lock.all().to_list()
         assert locks == []
 
+    async def test_delete_links_one_query_per_collection(self, house):
+        collection_class = type(Lock.get_motor_collection())
+        delete_many = collection_class.delete_many
+        deleted = []
+
+        async def counting_delete_many(self, filter, *args, **kwargs):
+            deleted.append(self.name)
+            return await delete_many(self, filter, *args, **kwargs)
+
+        with patch.object(
+            collection_class, "delete_many", counting_delete_many
+        ):
+            await house.delete(link_rule=DeleteRules.DELETE_LINKS)
+
+        assert sorted(deleted) == ["Door", "Lock", "Window"]
+        assert await Lock.count() == 0
+        assert await House.count() == 0
+
+    async def test_delete_unfetched_links(self, house):
+        house = await House.get(house.id)
+        assert isinstance(house.door, Link)
+
+        await house.delete(link_rule=DeleteRules.DELETE_LINKS)
+        assert await Door.count() == 0
+        assert await Window.count() == 0
+        assert await Lock.count() == 0
+        assert await House.count() == 0
+
+    async def test_delete_unfetched_links_max_depth(self):
+        await SelfLinked(
+            item=SelfLinked(
+                item=SelfLinked(item=SelfLinked(s="4"), s="3"), s="2"
+            ),
+            s="1",
+        ).insert(link_rule=WriteRules.WRITE)
+        root = await SelfLinked.find_one(SelfLinked.s == "1")
+
+        await root.delete(link_rule=DeleteRules.DELETE_LINKS)
+        left = await SelfLinked.find_all().to_list()
+        assert [doc.s for doc in left] == ["4"]
+
 
 class TestOther:
     async def test_query_composition(self):
@@ -960,3 +1110,450 @@ class TestBuildAggregations:
         ]
         result = await aggregation.to_list()
         assert result == [{"_id": 0, "count": 1}]
+
+
+class TestLookupPushdown:
+    def test_local_query_and_pagination(self):
+        pipeline = (
+            House.find(House.height > 1, fetch_links=True)
+            .sort(-House.height)
+            .skip(5)
+            .limit(20)
+            .build_aggregation_pipeline()
+        )
+        assert pipeline[:4] == [
+            {"$match": {"height": {"$gt": 1}}},
+            {"$sort": {"height": -1}},
+            {"$skip": 5},
+            {"$limit": 20},
+        ]
+        assert pipeline[4:] == get_lookup_queries(House)
+
+    def test_linked_query(self):
+        pipeline = (
+            House.find(House.height == 2, House.door.t == 10, fetch_links=True)
+            .sort("height")
+            .limit(20)
+            .build_aggregation_pipeline()
+        )
+        lookups = get_lookup_queries(House)
+        assert pipeline[0] == {"$match": {"height": 2}}
+        assert pipeline[1 : len(lookups) + 1] == lookups
+        assert pipeline[len(lookups) + 1 :] == [
+            {"$match": {"door.t": 10}},
+            {"$sort": {"height": 1}},
+            {"$limit": 20},
+        ]
+
+    def test_sort_by_linked_field(self):
+        pipeline = (
+            House.find(fetch_links=True)
+            .sort("door.t")
+            .limit(20)
+            .build_aggregation_pipeline()
+        )
+        assert pipeline[-2:] == [{"$sort": {"door.t": 1}}, {"$limit": 20}]
+
+    def test_back_direct_link_pagination(self):
+        pipeline = (
+            DocumentWithBackLink.find(DocumentWithBackLink.i == 1)
+            .find(fetch_links=True)
+            .limit(5)
+            .build_aggregation_pipeline()
+        )
+        assert pipeline[0] == {"$match": {"i": 1}}
+        assert pipeline[-1] == {"$limit": 5}
+
+    def test_without_fetch_links(self):
+        pipeline = (
+            House.find(House.height == 2)
+            .limit(20)
+            .build_aggregation_pipeline({"$project": {"height": 1}})
+        )
+        assert pipeline == [
+            {"$match": {"height": 2}},
+            {"$project": {"height": 1}},
+            {"$limit": 20},
+        ]
+
+    def test_split_lookup_query(self):
+        query = {
+            "$and": [
+                {"height": 2},
+                {"$or": [{"height": 3}, {"door.t": 1}]},
+                {"$expr": {"$eq": ["$height", 2]}},
+                {"name": "test", "windows.x": 10},
+            ]
+        }
+        local_queries, linked_queries = split_lookup_query(
+            [query], {"door", "windows"}
+        )
+        assert local_queries == [{"height": 2}, {"name": "test"}]
+        assert linked_queries == [
+            {"$or": [{"height": 3}, {"door.t": 1}]},
+            {"$expr": {"$eq": ["$height", 2]}},
+            {"windows.x": 10},
+        ]
+
+
+class HouseHeight(BaseModel):
+    height: int
+
+
+class HouseDoorT(BaseModel):
+    height: int
+    door_t: int
+
+    class Settings:
+        projection = {"height": 1, "door_t": "$door.t"}
+
+
+class TestProjectedLookups:
+    def test_projection_without_links(self):
+        pipeline = House.find(
+            House.height > 1, fetch_links=True
+        ).build_aggregation_pipeline(projection=get_projection(HouseHeight))
+        assert pipeline == [{"$match": {"height": {"$gt": 1}}}]
+
+    def test_projected_link_fields(self):
+        pipeline = House.find(fetch_links=True).build_aggregation_pipeline(
+            projection=get_projection(HouseDoorT)
+        )
+        lookups = [
+            stage["$lookup"] for stage in pipeline if "$lookup" in stage
+        ]
+        assert [lookup["as"] for lookup in lookups] == ["_link_door"]
+        assert lookups[0]["pipeline"][-1] == {"$project": {"t": 1}}
+
+    def test_linked_query(self):
+        pipeline = House.find(
+            House.windows.x > 10, fetch_links=True
+        ).build_aggregation_pipeline(projection=get_projection(HouseHeight))
+        lookups = [
+            stage["$lookup"] for stage in pipeline if "$lookup" in stage
+        ]
+        assert [lookup["as"] for lookup in lookups] == ["windows"]
+        assert lookups[0]["pipeline"][-1] == {"$project": {"x": 1}}
+        assert pipeline[-1] == {"$match": {"windows.x": {"$gt": 10}}}
+
+    def test_document_projection(self):
+        pipeline = House.find(fetch_links=True).build_aggregation_pipeline(
+            projection=get_projection(House)
+        )
+        assert pipeline == get_lookup_queries(House)
+
+    def test_extra_stages(self):
+        pipeline = House.find(fetch_links=True).build_aggregation_pipeline(
+            {"$project": {"height": 1}}, projection={}
+        )
+        assert pipeline[:-1] == get_lookup_queries(House)
+
+    def test_fetched_link_fields(self):
+        assert get_fetched_link_fields(House, None, [], []) is None
+        assert get_fetched_link_fields(House, {"door": 0}, [], []) is None
+        assert (
+            get_fetched_link_fields(
+                House, {}, [{"$expr": {"$eq": ["$height", 1]}}], []
+            )
+            is None
+        )
+        assert get_fetched_link_fields(
+            House,
+            {"door": 1, "roof_id": "$roof._id"},
+            [{"windows.x": 1}],
+            ["yards.v"],
+        ) == {"door": None, "roof": {"_id"}, "windows": {"x"}, "yards": {"v"}}
+        assert get_fetched_link_fields(DocumentWithBackLink, {}, [], []) == {
+            "back_link": {"_id"}
+        }
+
+    def test_project_lookup(self):
+        lookup = {"from": "Door", "as": "door"}
+        project_lookup(lookup, {"window", "window.x", "t"}, 5)
+        assert lookup["pipeline"] == [{"$project": {"t": 1, "window": 1}}]
+
+        lookup = {"from": "Door", "as": "door"}
+        project_lookup(lookup, {"t"}, 4)
+        assert "pipeline" not in lookup
+
+
+class TestLookupQueries:
+    def test_built_on_init(self):
+        assert (None, None) in House._lookup_queries
+        assert Door._lookup_queries is not None
+
+    def test_reused(self):
+        first = get_lookup_queries(House)
+        second = get_lookup_queries(House)
+        assert first == construct_lookup_queries(House)
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+
+        first.append({"$limit": 1})
+        assert get_lookup_queries(House) == second
+
+    def test_nesting_parameters(self):
+        shallow = get_lookup_queries(House, nesting_depth=1)
+        assert shallow == construct_lookup_queries(House, nesting_depth=1)
+        assert shallow != get_lookup_queries(House)
+
+        per_field = get_lookup_queries(
+            House, nesting_depths_per_field={"door": 0}
+        )
+        assert per_field == construct_lookup_queries(
+            House, nesting_depths_per_field={"door": 0}
+        )
+        assert (None, (("door", 0),)) in House._lookup_queries
+
+
+class TestBatchedLinks:
+    async def test_find_many(self, houses):
+        items = (
+            await House.find(House.height > 2, fetch_links="batched")
+            .sort(House.height)
+            .to_list()
+        )
+        assert len(items) == 7
+        for window in items[0].windows:
+            assert isinstance(window, Window)
+            assert isinstance(window.lock, Lock)
+        assert items[0].yards is None
+        for yard in items[1].yards:
+            assert isinstance(yard, Yard)
+        assert isinstance(items[0].door, Door)
+        assert items[0].door.window is None
+        assert isinstance(items[1].door.window, Window)
+        assert isinstance(items[1].door.window.lock, Lock)
+        for lock in items[0].door.locks:
+            assert isinstance(lock, Lock)
+        assert items[0].roof is None
+        assert isinstance(items[1].roof, Roof)
+
+        house = items[-1]
+        assert house.height == 9
+        assert len(house.windows) == 1
+        assert isinstance(house.windows[0].lock, Link)
+        assert isinstance(house.door, Link)
+
+    async def test_one_query_per_collection_and_level(self, houses):
+        from beanie.odm.utils import batched_links
+
+        fetched = []
+        fetch_class = batched_links._fetch_class
+
+        async def spy(document_class, keys, session):
+            fetched.append(document_class)
+            return await fetch_class(document_class, keys, session)
+
+        with patch.object(batched_links, "_fetch_class", spy):
+            items = await House.find_all(fetch_links="batched").to_list()
+        assert len(items) == 10
+        # Window, Door, Roof and Yard, then Window and Lock, then Lock
+        assert len(fetched) == 7
+        assert set(fetched[:4]) == {Window, Door, Roof, Yard}
+        assert set(fetched[4:6]) == {Window, Lock}
+        assert fetched[6] is Lock
+
+    async def test_not_linked_query(self, houses):
+        items = (
+            await House.find(House.height == 3, fetch_links="batched")
+            .aggregate([{"$project": {"height": 1}}])
+            .to_list()
+        )
+        assert items[0]["height"] == 3
+        assert await House.find(fetch_links="batched").count() == 10
+
+    async def test_iteration(self, houses):
+        query = House.find(fetch_links="batched").sort(House.height)
+        async for house in query:
+            assert isinstance(house.door, Door)
+            break
+        async for batch in House.find(fetch_links="batched").iter_batches(4):
+            for house in batch:
+                if house.height != 9:
+                    assert isinstance(house.door, Door)
+
+    async def test_iteration_fetches_per_batch(self, houses):
+        from beanie.odm.utils import batched_links
+
+        fetched = []
+        fetch_class = batched_links._fetch_class
+
+        async def spy(document_class, keys, session):
+            fetched.append(document_class)
+            return await fetch_class(document_class, keys, session)
+
+        with patch.object(batched_links, "_fetch_class", spy):
+            houses = [
+                house async for house in House.find(fetch_links="batched")
+            ]
+        assert len(houses) == 10
+        assert len(fetched) == 7
+
+    async def test_linked_field_query(self, houses):
+        door = await Door.find_one()
+        # The ids of the links are stored in the document itself
+        await House.find(
+            House.door.id == door.id, fetch_links="batched"
+        ).to_list()
+
+        with pytest.raises(NotSupported):
+            await House.find(
+                House.door.t == 10, fetch_links="batched"
+            ).to_list()
+        with pytest.raises(NotSupported):
+            await House.find(fetch_links="batched").sort(
+                House.roof.r
+            ).to_list()
+
+    async def test_nesting_depth(self):
+        self_linked_doc = LongSelfLink()
+        await self_linked_doc.insert(link_rule=WriteRules.WRITE)
+        self_linked_doc.link = self_linked_doc
+        await self_linked_doc.save()
+
+        docs = await LongSelfLink.find(
+            nesting_depth=4, fetch_links="batched"
+        ).to_list()
+        assert docs[0].link.link.link.link.id == self_linked_doc.id
+        assert isinstance(docs[0].link.link.link.link.link, Link)
+
+        docs = await LongSelfLink.find(
+            nesting_depth=0, fetch_links="batched"
+        ).to_list()
+        assert isinstance(docs[0].link, Link)
+
+    async def test_back_links(
+        self, link_and_backlink_doc_pair, list_link_and_list_backlink_doc_pair
+    ):
+        link_doc, back_link_doc = link_and_backlink_doc_pair
+        docs = await DocumentWithBackLink.find(
+            DocumentWithBackLink.id == back_link_doc.id,
+            fetch_links="batched",
+        ).to_list()
+        assert docs[0].back_link.id == link_doc.id
+        assert docs[0].back_link.link.id == back_link_doc.id
+
+        link_doc, back_link_doc = list_link_and_list_backlink_doc_pair
+        docs = await DocumentWithListBackLink.find(
+            DocumentWithListBackLink.id == back_link_doc.id,
+            fetch_links="batched",
+        ).to_list()
+        assert docs[0].back_link[0].id == link_doc.id
+        assert docs[0].back_link[0].link[0].id == back_link_doc.id
+
+    def test_wrong_value(self):
+        with pytest.raises(ValueError):
+            House.find(fetch_links="lazy")
+
+
+class TestIdentityMap:
+    async def test_shared_documents(self):
+        door = await Door(t=1).insert()
+        window = await Window(x=1, y=1).insert()
+        for i in range(5):
+            await House(
+                door=door, windows=[window], name="test", height=i
+            ).insert()
+        houses = await House.find_all().to_list()
+
+        fetched = []
+        get = Door.get
+
+        async def spy(*args, **kwargs):
+            fetched.append(args[0])
+            return await get(*args, **kwargs)
+
+        with patch.object(Door, "get", spy):
+            with IdentityMap() as identity_map:
+                assert IdentityMap.current() is identity_map
+                doors = await asyncio.gather(
+                    *(house.door.fetch() for house in houses)
+                )
+                windows = await asyncio.gather(
+                    *(Link.fetch_list(house.windows) for house in houses)
+                )
+        assert IdentityMap.current() is None
+        assert fetched == [door.id]
+        assert isinstance(doors[0], Door)
+        assert all(item is doors[0] for item in doors)
+        assert isinstance(windows[0][0], Window)
+        assert all(item[0] is windows[0][0] for item in windows)
+
+        doors = await asyncio.gather(*(house.door.fetch() for house in houses))
+        assert doors[0] is not doors[1]
+
+    async def test_fetch_list(self):
+        windows = [await Window(x=i, y=i).insert() for i in range(3)]
+        links = [Link(window.to_ref(), Window) for window in windows]
+        async with IdentityMap() as identity_map:
+            first = await Link.fetch_list(links[:2])
+            second = await Link.fetch_list(links[1:])
+            assert len(identity_map.documents) == 3
+            assert await links[0].fetch() is first[0]
+        assert second[0] is first[1]
+        assert [window.x for window in second] == [1, 2]
+
+    async def test_not_found(self):
+        door = await Door(t=1).insert()
+        link = Link(door.to_ref(), Door)
+        await door.delete()
+        with IdentityMap() as identity_map:
+            assert await link.fetch() is link
+            await Door(id=door.id, t=2).insert()
+            assert await link.fetch() is link
+            identity_map.clear()
+            assert isinstance(await link.fetch(), Door)
+
+    async def test_cancelled_fetch(self):
+        door = await Door(t=1).insert()
+        link = Link(door.to_ref(), Door)
+
+        fetched = []
+        started = asyncio.Event()
+        get = Door.get
+
+        async def slow_get(*args, **kwargs):
+            fetched.append(args[0])
+            if len(fetched) == 1:
+                started.set()
+                await asyncio.sleep(10)
+            return await get(*args, **kwargs)
+
+        with patch.object(Door, "get", slow_get):
+            with IdentityMap():
+                first = asyncio.create_task(link.fetch())
+                await started.wait()
+                second = asyncio.create_task(link.fetch())
+                await asyncio.sleep(0)
+                first.cancel()
+                assert isinstance(await second, Door)
+                with pytest.raises(asyncio.CancelledError):
+                    await first
+        assert fetched == [door.id, door.id]
+
+    async def test_fetch_many(self):
+        door = await Door(t=1).insert()
+        windows = [await Window(x=i, y=i).insert() for i in range(2)]
+        missing = Window(x=5, y=5)
+        missing.id = PydanticObjectId()
+        links = [
+            Link(windows[0].to_ref(), Window),
+            Link(door.to_ref(), Door),
+            Link(missing.to_ref(), Window),
+            Link(windows[1].to_ref(), Window),
+            Link(windows[0].to_ref(), Window),
+        ]
+        with IdentityMap() as identity_map:
+            result = await Link.fetch_many(links)
+            assert len(identity_map.documents) == 4
+        assert [type(item) for item in result] == [
+            Window,
+            Door,
+            Link,
+            Window,
+            Window,
+        ]
+        assert result[0] is result[4]
+        assert result[2] is links[2]
+        assert result[3].x == 1
@@ -1,16 +1,31 @@
+import copy
+from uuid import uuid4
+
 import pytest
 from bson import ObjectId
 
-from beanie import PydanticObjectId, WriteRules
-from beanie.exceptions import StateManagementIsTurnedOff, StateNotSaved
+from beanie import Document, PydanticObjectId, WriteRules
+from beanie.exceptions import (
+    NotSupported,
+    StateManagementIsTurnedOff,
+    StateNotSaved,
+)
 from beanie.odm.utils.parsing import parse_obj
 from beanie.odm.utils.pydantic import IS_PYDANTIC_V2, parse_model
+from beanie.odm.utils.tracking import TrackedDict, TrackedList
 from tests.odm.models import (
+    DocumentWithArrayUpdates,
+    DocumentWithBsonSnapshot,
+    DocumentWithHashSnapshot,
+    DocumentWithTrackedArrayUpdates,
+    DocumentWithTrackedChanges,
     DocumentWithTurnedOffStateManagement,
     DocumentWithTurnedOnReplaceObjects,
     DocumentWithTurnedOnSavePrevious,
     DocumentWithTurnedOnStateManagement,
     DocumentWithTurnedOnStateManagementWithCustomId,
+    DocumentWithUUIDBsonSnapshot,
+    DocumentWithUUIDHashSnapshot,
     HouseWithRevision,
     InternalDoc,
     LockWithRevision,
@@ -460,3 +475,283 @@ class TestStateManagement:
                 )
                 is None
             )
+
+    class TestTrackChanges:
+        @pytest.fixture
+        def doc_tracked(self, state):
+            doc = parse_obj(
+                DocumentWithTrackedChanges,
+                {**state, "items": [InternalDoc(), InternalDoc()]},
+            )
+            doc._save_state()
+            return doc
+
+        def test_setattr(self):
+            assert getattr(
+                DocumentWithTrackedChanges.__setattr__, "tracks_changes", False
+            )
+            assert "__setattr__" not in Document.__dict__
+            assert not getattr(
+                DocumentWithTurnedOnStateManagement.__setattr__,
+                "tracks_changes",
+                False,
+            )
+
+        def test_tracked_fields(self, doc_tracked):
+            # the changes of the sets can't be tracked
+            assert doc_tracked._get_tracked_fields() == {("labels",): set()}
+
+            doc_tracked.num_1 = 10
+            doc_tracked.internal.num = 1000
+            doc_tracked.items[1].string = "new"
+            doc_tracked.counters["a"] = 1
+            assert doc_tracked._get_tracked_fields() == {
+                ("num_1",): 10,
+                ("internal", "num"): 1000,
+                ("items", "1", "string"): "new",
+                ("counters", "a"): 1,
+                ("labels",): set(),
+            }
+
+            doc_tracked.internal.lst.append(6)
+            doc_tracked.items.append(InternalDoc())
+            assert doc_tracked._get_tracked_fields().keys() == {
+                ("num_1",),
+                ("internal", "num"),
+                ("internal", "lst"),
+                ("items",),
+                ("counters", "a"),
+                ("labels",),
+            }
+
+        def test_get_changes(self, doc_tracked):
+            assert not doc_tracked.is_changed
+            doc_tracked.num_1 = 1
+            doc_tracked.internal.num = 100
+            assert not doc_tracked.is_changed
+
+            doc_tracked.num_2 = 20
+            doc_tracked.internal.num = 1000
+            doc_tracked.items[0].lst.append(6)
+            doc_tracked.tags += ["new"]
+            doc_tracked.counters["a"] = 1
+            doc_tracked.labels.add("label")
+            assert doc_tracked.is_changed
+            assert doc_tracked.get_changes() == {
+                "num_2": 20,
+                "internal.num": 1000,
+                "items.0.lst": [1, 2, 3, 4, 5, 6],
+                "tags": ["new"],
+                "counters.a": 1,
+                "labels": ["label"],
+            }
+
+            doc_tracked._save_state()
+            assert doc_tracked.get_changes() == {}
+            saved_state = doc_tracked.get_saved_state()
+            assert saved_state["internal"]["num"] == 1000
+            assert saved_state["items"][0]["lst"] == [1, 2, 3, 4, 5, 6]
+            assert saved_state["counters"] == {"a": 1}
+
+            # only the changed fields of the assigned model are set
+            doc_tracked.internal = InternalDoc(num=1000, string="new")
+            assert doc_tracked.get_changes() == {"internal.string": "new"}
+
+        def test_moved_items(self, doc_tracked):
+            item = doc_tracked.items[0]
+            doc_tracked.items.insert(0, InternalDoc(num=1))
+            item.num = 2
+            changes = doc_tracked.get_changes()
+            assert changes.keys() == {"items"}
+            assert [item["num"] for item in changes["items"]] == [1, 2, 100]
+
+            doc_tracked._save_state()
+            item.num = 3
+            removed = doc_tracked.items.pop()
+            doc_tracked._save_state()
+            removed.num = 4
+            assert doc_tracked.get_changes() == {}
+            item.num = 5
+            assert doc_tracked.get_changes() == {"items.1.num": 5}
+
+        def test_copies(self, doc_tracked):
+            assert isinstance(doc_tracked.tags, TrackedList)
+            # the copies are not tracked
+            assert not isinstance(
+                copy.deepcopy(doc_tracked.items), TrackedList
+            )
+            assert not isinstance(copy.copy(doc_tracked.counters), TrackedDict)
+
+        async def test_save_changes(self, doc_tracked):
+            await doc_tracked.insert()
+            doc_tracked.num_1 = 10
+            doc_tracked.note = "note"
+            doc_tracked.internal.lst.append(6)
+            doc_tracked.items[1].num = 1
+            await doc_tracked.save_changes()
+            assert not doc_tracked.is_changed
+
+            doc_tracked.note = None
+            await doc_tracked.save_changes()
+            assert not doc_tracked.is_changed
+
+            new_doc = await DocumentWithTrackedChanges.get(doc_tracked.id)
+            assert new_doc.num_1 == 10
+            assert new_doc.note is None
+            assert new_doc.internal.lst == [1, 2, 3, 4, 5, 6]
+            assert new_doc.items[1].num == 1
+            raw = await DocumentWithTrackedChanges.get_motor_collection().find_one(
+                {"_id": doc_tracked.id}
+            )
+            assert "note" not in raw
+
+        async def test_array_updates(self, state):
+            doc = parse_obj(DocumentWithTrackedArrayUpdates, state)
+            await doc.insert()
+            doc.internal.lst.append(6)
+            doc.tags.append("new")
+            assert doc._get_changes_operators() == [
+                {
+                    "$push": {
+                        "internal.lst": {"$each": [6]},
+                        "tags": {"$each": ["new"]},
+                    }
+                }
+            ]
+            await doc.save_changes()
+            new_doc = await DocumentWithTrackedArrayUpdates.get(doc.id)
+            assert new_doc.internal.lst == [1, 2, 3, 4, 5, 6]
+            assert new_doc.tags == ["new"]
+
+    class TestSnapshots:
+        async def test_bson(self, state):
+            doc = parse_obj(DocumentWithBsonSnapshot, state)
+            assert isinstance(doc._saved_state, bytes)
+            assert doc.get_saved_state()["num_1"] == 1
+            assert not doc.is_changed
+
+            doc.internal.num = 1000
+            doc.num_2 = 20
+            assert doc.get_changes() == {"num_2": 20, "internal.num": 1000}
+            doc._save_state()
+            assert doc.get_previous_changes() == {
+                "num_2": 20,
+                "internal.num": 1000,
+            }
+
+            doc.num_1 = 10
+            doc.rollback()
+            assert doc.num_1 == 1
+
+        async def test_hash(self, state):
+            doc = parse_obj(DocumentWithHashSnapshot, state)
+            assert not doc.is_changed
+
+            doc.internal.num = 1000
+            doc.num_2 = 20
+            assert doc.is_changed
+            changes = doc.get_changes()
+            assert changes.keys() == {"num_2", "internal"}
+            assert changes["internal"]["num"] == 1000
+
+            doc._save_state()
+            assert not doc.is_changed
+            with pytest.raises(NotSupported):
+                doc.rollback()
+
+        @pytest.mark.parametrize(
+            "model", [DocumentWithBsonSnapshot, DocumentWithHashSnapshot]
+        )
+        async def test_save_changes(self, model, state_without_id):
+            doc = parse_obj(model, state_without_id)
+            await doc.insert()
+            assert not doc.is_changed
+
+            doc.num_1 = 10
+            doc.internal.lst.append(6)
+            await doc.save_changes()
+            assert not doc.is_changed
+
+            new_doc = await model.get(doc.id)
+            assert new_doc.num_1 == 10
+            assert new_doc.internal.lst == [1, 2, 3, 4, 5, 6]
+            assert not new_doc.is_changed
+
+        @pytest.mark.parametrize(
+            "model",
+            [DocumentWithUUIDBsonSnapshot, DocumentWithUUIDHashSnapshot],
+        )
+        async def test_uuid_id(self, model):
+            doc = parse_obj(model, {"_id": uuid4(), "num": 1})
+            assert not doc.is_changed
+            await doc.insert()
+
+            # Lazily parsed documents keep only the id in the saved state
+            for kwargs in [{"lazy_parse": True}, {"raw_bson": True}]:
+                docs = await model.find(model.id == doc.id, **kwargs).to_list()
+                assert docs[0].id == doc.id
+                assert docs[0].num == 1
+
+            docs = await model.find(model.id == doc.id).to_list()
+            assert not docs[0].is_changed
+            docs[0].num = 3
+            assert docs[0].is_changed
+            await docs[0].save_changes()
+            assert not docs[0].is_changed
+            assert (await model.get(doc.id)).num == 3
+
+    class TestArrayUpdates:
+        @pytest.fixture
+        def doc(self):
+            return parse_obj(
+                DocumentWithArrayUpdates,
+                {
+                    "_id": ObjectId(),
+                    "events": ["a", "b", "c", "d"],
+                    "items": [{"num": i} for i in range(4)],
+                },
+            )
+
+        async def test_push(self, doc):
+            doc.events.extend(["e", "f"])
+            assert doc._get_changes_operators() == [
+                {"$push": {"events": {"$each": ["e", "f"]}}}
+            ]
+
+        async def test_pull(self, doc):
+            doc.events.remove("b")
+            assert doc._get_changes_operators() == [
+                {"$pullAll": {"events": ["b"]}}
+            ]
+
+        async def test_positional(self, doc):
+            doc.items[1].num = 100
+            doc.events[2] = "x"
+            assert doc._get_changes_operators() == [
+                {"$set": {"events.2": "x", "items.1.num": 100}}
+            ]
+
+        async def test_fallback(self, doc):
+            doc.events = ["d", "c", "b", "a"]
+            doc.items.pop(0)
+            doc.items.append(InternalDoc(num=10))
+            assert doc._get_changes_operators() == [
+                {
+                    "$set": {
+                        "events": ["d", "c", "b", "a"],
+                        "items": doc._get_state()["items"],
+                    }
+                }
+            ]
+
+        async def test_save_changes(self, doc):
+            await doc.insert()
+            doc.events.append("e")
+            doc.items.pop(2)
+            await doc.save_changes()
+            doc.items[0].num = 100
+            await doc.save_changes()
+
+            new_doc = await DocumentWithArrayUpdates.get(doc.id)
+            assert new_doc.events == ["a", "b", "c", "d", "e"]
+            assert [item.num for item in new_doc.items] == [100, 1, 3]
@@ -1,6 +1,10 @@
 from beanie.odm.fields import Link
 from beanie.odm.views import View
-from tests.odm.models import DocumentTestModel, DocumentTestModelWithLink
+from tests.odm.models import (
+    DocumentTestModel,
+    DocumentTestModelWithCacheInvalidation,
+    DocumentTestModelWithLink,
+)
 
 
 class ViewForTest(View):
@@ -23,3 +27,13 @@ class ViewForTestWithLink(View):
         view_name = "test_view_with_link"
         source = DocumentTestModelWithLink
         pipeline = [{"$set": {"link": "$test_link"}}]
+
+
+class ViewForTestWithCache(View):
+    number: int
+
+    class Settings:
+        view_name = "test_view_with_cache"
+        source = DocumentTestModelWithCacheInvalidation
+        pipeline = [{"$project": {"number": "$test_int"}}]
+        use_cache = True